@@ -0,0 +1,235 @@
+"""
+Signal-change alerts: diff this run's signals against the last run's.
+
+Only transitions are emitted (e.g. Gold BeES W: WAIT / HOLD -> BUY /
+ACCUMULATE), one JSON event each, to pluggable sinks:
+
+    stdout               one JSON line per event
+    file[:path]          append NDJSON (default alerts.ndjson)
+    webhook:<url>        POST the events as a JSON list (stand-in receiver:
+                         python alerts.py --receive 8765)
+
+ALERT_SINKS picks them, e.g. ALERT_SINKS=stdout,file,webhook:http://localhost:8765/.
+The last seen signal per ticker and timeframe is kept in
+.cache/alert_state.json; the first run records the state without alerting.
+
+main_production runs the same check after computing signals. Run alone,
+this script is the cheap alert-only mode: it tops up only markets that
+are open (every ALERT_INTERVAL), recomputes signals from cached bars and
+never renders charts.
+
+    python alerts.py                 # check once
+    python alerts.py --loop          # check every ALERT_INTERVAL
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import numpy as np
+
+from signals import labels, last_bars
+
+STATE_PATH = os.getenv("ALERT_STATE", ".cache/alert_state.json")
+SCHEDULE_PATH = os.getenv("ALERT_SCHEDULE", ".cache/alert_schedule.json")
+LOG_PATH = "alerts.ndjson"
+ALERT_INTERVAL = timedelta(minutes=int(os.getenv("ALERT_INTERVAL_MIN", "5")))
+TIMEFRAMES = ("D", "W", "M")
+WEBHOOK_TIMEOUT = 10
+
+
+# 1. SINKS
+class StdoutSink:
+    def send(self, events):
+        for e in events:
+            print(json.dumps(e, ensure_ascii=False), flush=True)
+
+
+class FileSink:
+    def __init__(self, path=LOG_PATH):
+        self.path = path
+
+    def send(self, events):
+        with open(self.path, "a", encoding="utf-8") as f:
+            for e in events:
+                f.write(json.dumps(e, ensure_ascii=False) + "\n")
+
+
+class WebhookSink:
+    def __init__(self, url, timeout=WEBHOOK_TIMEOUT):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, events):
+        body = json.dumps({"alerts": events}, ensure_ascii=False).encode()
+        req = urllib.request.Request(self.url, data=body, headers={"Content-Type": "application/json"}, method="POST")
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            resp.read()
+
+
+def parse_sinks(spec=None):
+    """"stdout,file:alerts.ndjson,webhook:http://..." -> sink objects."""
+    spec = spec if spec is not None else os.getenv("ALERT_SINKS", "file")
+    sinks = []
+    for item in filter(None, (s.strip() for s in spec.split(","))):
+        kind, _, arg = item.partition(":")
+        if kind == "stdout":
+            sinks.append(StdoutSink())
+        elif kind == "file":
+            sinks.append(FileSink(arg or LOG_PATH))
+        elif kind == "webhook":
+            sinks.append(WebhookSink(arg))
+        else:
+            raise ValueError(f"unknown alert sink {item!r} (stdout, file[:path], webhook:<url>)")
+    return sinks
+
+
+def emit(events, sinks):
+    """Send to every sink; one failing sink (e.g. webhook down) does not stop the others."""
+    failed = 0
+    for sink in sinks:
+        try:
+            sink.send(events)
+        except Exception as e:
+            failed += 1
+            print(f"⚠️ Alert sink {type(sink).__name__} failed: {e}")
+    return failed
+
+
+# 2. STATE AND DIFF
+def load_state(path=STATE_PATH):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(state, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+
+
+def current_signals(panels, names):
+    """{ticker: {timeframe: {name, signal, ts, close, rsi}}} from classified panels ({timeframe: panel})."""
+    label = labels()
+    out = {}
+    for tf, panel in panels.items():
+        has, last = last_bars(panel)
+        cols = np.arange(len(panel.tickers))
+        close, rsi = panel["Close"][last, cols].tolist(), panel["RSI_2"][last, cols].tolist()
+        codes = panel["Signal"][last, cols]
+        dates = panel.index[last].strftime("%Y-%m-%d")
+        for j, t in enumerate(panel.tickers):
+            if not has[j]:
+                continue
+            out.setdefault(t, {})[tf] = {
+                "name": names.get(t, t), "signal": label[codes[j]], "ts": dates[j],
+                "close": round(close[j], 4), "rsi": None if rsi[j] != rsi[j] else round(rsi[j], 2),
+            }
+    return out
+
+
+def diff(previous, current, at=None):
+    """Events for every (ticker, timeframe) whose signal changed; new tickers/timeframes are not alerts."""
+    at = at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    events = []
+    for ticker, frames in current.items():
+        for tf, now in frames.items():
+            before = previous.get(ticker, {}).get(tf)
+            if before is None or before["signal"] == now["signal"]:
+                continue
+            events.append({"ticker": ticker, "name": now["name"], "timeframe": tf, "from": before["signal"],
+                           "to": now["signal"], "bar": now["ts"], "close": now["close"], "rsi": now["rsi"], "at": at})
+    return events
+
+
+def check(panels, names, sinks=None, state_path=STATE_PATH):
+    """Diff the panels' latest signals against the saved state, emit transitions, save the new state."""
+    sinks = parse_sinks() if sinks is None else sinks
+    previous = load_state(state_path)
+    current = current_signals(panels, names)
+    events = diff(previous, current)
+    if not any(isinstance(s, StdoutSink) for s in sinks):   # keep stdout pure JSON when it is a sink
+        for e in events:
+            print(f"🔔 {e['name']} {e['timeframe']}: {e['from']} -> {e['to']} @ {e['close']:,.2f}")
+    if events:
+        emit(events, sinks)
+    save_state({**previous, **{t: {**previous.get(t, {}), **tfs} for t, tfs in current.items()}}, state_path)
+    return events
+
+
+# 3. ALERT-ONLY RUN (no rendering)
+def run_once(sinks=None, timeframes=TIMEFRAMES, force=False):
+    from bar_cache import BarCache
+    from market_calendar import Scheduler, group_tickers, refreshed_groups
+    from timeframes import Timeframes, DAY, WEEK, MONTH
+    from universe import ASSETS
+
+    rules = {"D": DAY, "W": WEEK, "M": MONTH}
+    groups = group_tickers(ASSETS.values())
+    sched = Scheduler(state_path=SCHEDULE_PATH, interval=ALERT_INTERVAL)
+    due = list(groups) if force else sched.due_groups(groups)
+
+    started = datetime.now(timezone.utc)
+    bars = BarCache()
+    frames, failures = bars.load([t for g in due for t in groups[g]], period="1y", interval="1d") if due else ({}, {})
+    sched.mark_refreshed(refreshed_groups(groups, due, frames, bars.topup_failures), now=started)
+    cached, missing = bars.cached([t for g in groups if g not in due for t in groups[g]], period="1y", interval="1d")
+    frames.update(cached)
+    for t, reason in {**failures, **missing}.items():
+        print(f"⚠️ {t}: {reason}")
+    if not frames:
+        return []
+
+    tf = Timeframes(frames)
+    names = {t: n for n, t in ASSETS.items()}
+    return check({label: tf.panel(rules[label]) for label in timeframes}, names, sinks)
+
+
+# 4. WEBHOOK STAND-IN
+def receive(port):
+    """Tiny local webhook receiver: prints every POSTed alert batch."""
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            for e in json.loads(body or b"{}").get("alerts", []):
+                print(f"📨 {e['name']} {e['timeframe']}: {e['from']} -> {e['to']}", flush=True)
+            self.send_response(204)
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    print(f"👂 Webhook stand-in on http://localhost:{port}/")
+    HTTPServer(("", port), Handler).serve_forever()
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Alert on signal changes without rendering the dashboard")
+    ap.add_argument("--sinks", help="comma separated: stdout, file[:path], webhook:<url> (default $ALERT_SINKS or file)")
+    ap.add_argument("--timeframes", default=",".join(TIMEFRAMES))
+    ap.add_argument("--force", action="store_true", help="top up every market, open or not")
+    ap.add_argument("--loop", action="store_true", help=f"check every {ALERT_INTERVAL}")
+    ap.add_argument("--receive", type=int, metavar="PORT", help="run the webhook stand-in instead")
+    args = ap.parse_args()
+
+    if args.receive:
+        receive(args.receive)
+        sys.exit(0)
+    sinks = parse_sinks(args.sinks)
+    timeframes = [t.strip() for t in args.timeframes.split(",") if t.strip()]
+    while True:
+        t0 = time.perf_counter()
+        events = run_once(sinks, timeframes, args.force)
+        print(f"✅ {len(events)} signal change(s), checked in {time.perf_counter() - t0:.2f}s")
+        if not args.loop:
+            break
+        time.sleep(ALERT_INTERVAL.total_seconds())
@@ -0,0 +1,146 @@
+"""
+Vectorized backtester for the RSI(2) + 90MA + UT Bot strategy.
+
+Replays the signal codes from signals.classify_panel over the whole
+history of every asset at once. There is no per-bar Python loop: target
+exposure, returns, equity, drawdowns and trade statistics are all array
+operations on the (time x asset) panel.
+
+Position sizing:
+  * AGGRESSIVE ADD scales up to ADD_LEVELS[...] of a full position,
+    BUY / ACCUMULATE to a smaller level; adds only ever increase exposure.
+  * BOOK PROFIT takes exposure down to BOOK_TO.
+  * DOWNTREND optionally exits (exit_on_downtrend=True).
+Exposure is decided at a bar's close and fills fill_lag bars later, at
+that bar's close: 1 (default) is the next bar's close; 0 fills at the
+signal bar's own close, which is optimistic.
+"""
+import numpy as np
+import pandas as pd
+
+from indicator_panel import stack_panel, compute_indicators
+from signals import SIGNAL_RULES, classify_panel
+
+ADD_LEVELS = {"⚡ AGGRESSIVE ADD": 1.0, "🟢 BUY / ACCUMULATE": 0.5}
+BOOK_LABEL = "🔴 BOOK PROFIT"
+DOWNTREND_LABEL = "⚠️ DOWNTREND"
+BOOK_TO = 0.0
+COST_BPS = 10          # per unit of turnover
+BARS_PER_YEAR = 52     # weekly bars by default
+FILL_LAG = 1           # bars from the signal bar's close to the fill (a close)
+
+
+def target_exposure(codes, rules=SIGNAL_RULES, add_levels=ADD_LEVELS, book_to=BOOK_TO, exit_on_downtrend=False):
+    """Exposure (0..1) decided at each bar's close, from signal codes.
+
+    Adds ratchet exposure up within a "segment"; each book/exit event opens
+    a new segment at book_to. Encoding events as segment * K + level turns
+    that into a single running maximum along the time axis.
+    """
+    names = [r[0] for r in rules]
+    resets = np.zeros(codes.shape, dtype=bool)
+    level = np.full(codes.shape, -np.inf)
+    for label, lvl in add_levels.items():
+        if label in names:
+            level[codes == names.index(label)] = lvl
+    reset_labels = [BOOK_LABEL] + ([DOWNTREND_LABEL] if exit_on_downtrend else [])
+    for label in reset_labels:
+        if label in names:
+            hit = codes == names.index(label)
+            resets |= hit
+            level[hit] = book_to
+
+    K = 10.0  # any constant > max level - min level
+    segment = np.cumsum(resets, axis=0).astype(float)
+    encoded = np.where(np.isfinite(level), segment * K + level, -np.inf)
+    running = np.maximum.accumulate(encoded, axis=0)
+    return np.where(np.isfinite(running), running - segment * K, 0.0)
+
+
+def _ffill(a):
+    """Forward-fill NaNs down each column."""
+    idx = np.where(np.isnan(a), 0, np.arange(len(a))[:, None])
+    np.maximum.accumulate(idx, axis=0, out=idx)
+    return a[idx, np.arange(a.shape[1])]
+
+
+def _trade_returns(weights, log_ret):
+    """Sum of log returns for every contiguous in-position run, and its column."""
+    in_pos = weights > 0
+    prev = np.vstack([np.zeros((1, in_pos.shape[1]), dtype=bool), in_pos[:-1]])
+    starts = (in_pos & ~prev).T.ravel()
+    run_id = np.cumsum(starts) - 1
+    mask = in_pos.T.ravel()
+    cols = np.repeat(np.arange(in_pos.shape[1]), in_pos.shape[0])
+    n_runs = int(starts.sum())
+    sums = np.bincount(run_id[mask], weights=log_ret.T.ravel()[mask], minlength=n_runs)
+    owner = np.zeros(n_runs, dtype=int)
+    owner[run_id[mask]] = cols[mask]
+    return sums, owner
+
+
+def run_backtest(panel, rules=SIGNAL_RULES, cost_bps=COST_BPS, bars_per_year=BARS_PER_YEAR, fill_lag=FILL_LAG, **sizing):
+    """Backtest every asset in a classified panel; returns (stats, equity)."""
+    if "Signal" not in panel.fields:
+        classify_panel(panel, rules)
+    close = panel["Close"]
+    traded = ~np.isnan(close)
+    started = np.maximum.accumulate(traded, axis=0)
+
+    px = _ffill(close)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ret = np.nan_to_num(px / np.vstack([px[:1], px[:-1]]) - 1)
+
+    target = target_exposure(panel["Signal"], rules, **sizing)
+    # Held from the fill bar's close, so it earns returns from the bar after it
+    shift = 1 + fill_lag
+    weights = np.zeros_like(target)
+    weights[shift:] = target[:-shift]
+    turnover = np.abs(np.diff(weights, axis=0, prepend=0.0))
+    strat = weights * ret - turnover * cost_bps / 1e4
+    equity = np.cumprod(1 + strat, axis=0)
+
+    n_bars = started.sum(axis=0)
+    years = np.maximum(n_bars / bars_per_year, 1e-9)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cagr = equity[-1] ** (1 / years) - 1
+        hold_cagr = (px[-1] / px[np.argmax(traded, axis=0), np.arange(px.shape[1])]) ** (1 / years) - 1
+    drawdown = (equity / np.maximum.accumulate(equity, axis=0) - 1).min(axis=0)
+
+    sums, owner = _trade_returns(weights, np.log1p(strat))
+    trades = np.bincount(owner, minlength=close.shape[1])
+    wins = np.bincount(owner, weights=(sums > 0).astype(float), minlength=close.shape[1])
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        stats = pd.DataFrame({
+            "CAGR": cagr,
+            "Buy&Hold CAGR": hold_cagr,
+            "Max Drawdown": drawdown,
+            "Trades": trades,
+            "Hit Rate": wins / trades,
+            "Exposure": (weights * started).sum(axis=0) / np.maximum(n_bars, 1),
+            "Years": n_bars / bars_per_year,
+        }, index=pd.Index(panel.tickers, name="Ticker"))
+    return stats, pd.DataFrame(equity, index=panel.index, columns=panel.tickers)
+
+
+def backtest_frames(frames, bars_per_year=BARS_PER_YEAR, indicator_params=None, **kwargs):
+    """{ticker: OHLC frame} -> (stats, equity), computing indicators first."""
+    panel = compute_indicators(stack_panel(frames), **(indicator_params or {}))
+    return run_backtest(panel, bars_per_year=bars_per_year, **kwargs)
+
+
+if __name__ == "__main__":
+    from bar_cache import BarCache
+    from main_production import weekly_bars
+    from universe import ASSETS
+
+    print("🧪 Backtesting RSI(2) + 90MA + UT Bot on full history...")
+    frames, failures = BarCache().load(list(ASSETS.values()), period="max", interval="1d")
+    for t, reason in failures.items():
+        print(f"⚠️ {t}: {reason}")
+
+    stats, _ = backtest_frames({t: weekly_bars(df) for t, df in frames.items()})
+    stats.index = [next(n for n, t in ASSETS.items() if t == tk) for tk in stats.index]
+    pd.set_option("display.width", 140)
+    print(stats.to_string(formatters={c: "{:.1%}".format for c in ("CAGR", "Buy&Hold CAGR", "Max Drawdown", "Hit Rate", "Exposure")}))
@@ -0,0 +1,167 @@
+"""
+Persistent on-disk OHLCV cache with incremental top-up fetches.
+
+History is stored once per (ticker, interval) as a Parquet file. Later runs
+only download the bars after the last cached timestamp, re-fetching the
+last few cached bars too because Yahoo revises the most recent bar.
+
+Each file also records the longest period it was fetched for. A request
+for a longer period (a 1y cache asked for "max") re-downloads that period
+once, so the missing head of the history is backfilled instead of being
+silently cut short.
+"""
+import os
+import time
+
+import pandas as pd
+
+from data_fetch import fetch_universe
+
+CACHE_DIR = os.getenv("BAR_CACHE_DIR", ".cache/bars")
+RECONCILE_BARS = 2          # Yahoo revises the latest bar (and sometimes the one before)
+MAX_AGE_DAYS = 30           # evict files nobody has read for a month
+MAX_CACHE_MB = 256          # then trim least-recently-used files down to this size
+
+PERIOD_OFFSETS = {
+    "1mo": pd.DateOffset(months=1), "3mo": pd.DateOffset(months=3), "6mo": pd.DateOffset(months=6),
+    "1y": pd.DateOffset(years=1), "2y": pd.DateOffset(years=2), "5y": pd.DateOffset(years=5),
+    "10y": pd.DateOffset(years=10), "max": None,
+}
+PERIODS = list(PERIOD_OFFSETS)      # shortest to longest
+
+
+def _trim(df, period):
+    offset = PERIOD_OFFSETS.get(period)
+    if offset is None or df.empty:
+        return df
+    return df[df.index > df.index[-1] - offset]
+
+
+def covered_period(df):
+    """Longest period the cached history covers: stored with the file, else inferred from its span."""
+    period = df.attrs.get("period")
+    if period in PERIOD_OFFSETS:
+        return period
+    covered = PERIODS[0]
+    for p in PERIODS[:-1]:
+        # a few days' grace for holidays at either end of a fetched period
+        if df.index[0] <= df.index[-1] - PERIOD_OFFSETS[p] + pd.Timedelta(days=10):
+            covered = p
+    return covered
+
+
+def _covers(have, want):
+    return want not in PERIOD_OFFSETS or PERIODS.index(have) >= PERIODS.index(want)
+
+
+class BarCache:
+    def __init__(self, root=CACHE_DIR, max_age_days=MAX_AGE_DAYS, max_mb=MAX_CACHE_MB, reconcile_bars=RECONCILE_BARS):
+        self.root = root
+        self.max_age = max_age_days * 86400
+        self.max_bytes = max_mb * 1024 * 1024
+        self.reconcile_bars = reconcile_bars
+        self.topup_failures = {}    # ticker -> reason, for tickers served from cache after a failed top-up
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, ticker, interval):
+        safe = ticker.replace("^", "_").replace("/", "_").replace("=", "_")
+        return os.path.join(self.root, f"{safe}__{interval}.parquet")
+
+    def read(self, ticker, interval):
+        p = self.path(ticker, interval)
+        if not os.path.exists(p):
+            return None
+        try:
+            df = pd.read_parquet(p)
+        except Exception as e:
+            print(f"⚠️ Corrupt cache for {ticker}, refetching: {e}")
+            os.remove(p)
+            return None
+        os.utime(p)  # mtime doubles as last-used time for eviction
+        return df
+
+    def write(self, ticker, interval, df, period=None):
+        if period is not None:
+            df.attrs["period"] = period     # kept in the Parquet metadata
+        p = self.path(ticker, interval)
+        tmp = p + ".tmp"
+        df.to_parquet(tmp)
+        os.replace(tmp, p)
+
+    def merge(self, cached, fresh):
+        """Append fresh bars; fresh rows win on overlapping timestamps (stale-bar fix)."""
+        fresh = fresh.dropna(how="all")
+        if cached is None or cached.empty:
+            return fresh
+        merged = pd.concat([cached, fresh[cached.columns.intersection(fresh.columns)]])
+        return merged[~merged.index.duplicated(keep="last")].sort_index()
+
+    def cached(self, tickers, period="1y", interval="1d"):
+        """Cache-only read for groups that are not due a refresh; never touches the network."""
+        frames, failures = {}, {}
+        for t in dict.fromkeys(tickers):
+            df = self.read(t, interval)
+            if df is None or df.empty:
+                failures[t] = "not cached yet"
+            else:
+                frames[t] = _trim(df, period)
+        return frames, failures
+
+    def load(self, tickers, period="1y", interval="1d", downloader=None):
+        """Return (frames, failures) like fetch_universe, using the cache.
+
+        Cached tickers are grouped by their top-up start date so the
+        incremental fetch is still one batched call per group. Tickers
+        whose cache covers less than `period` are refetched in full.
+        """
+        cached, starts = {}, {}
+        for t in dict.fromkeys(tickers):
+            df = self.read(t, interval)
+            if df is None or len(df) <= self.reconcile_bars:
+                starts.setdefault(None, []).append(t)
+                continue
+            cached[t] = df
+            if not _covers(covered_period(df), period):
+                starts.setdefault(None, []).append(t)    # backfill the missing head
+                continue
+            start = df.index[-self.reconcile_bars].strftime("%Y-%m-%d")
+            starts.setdefault(start, []).append(t)
+
+        frames, failures = {}, {}
+        for start, group in starts.items():
+            fresh, failed = fetch_universe(group, period=period, interval=interval, downloader=downloader, start=start)
+            for t in group:
+                if t in fresh:
+                    merged = self.merge(cached.get(t), fresh[t])
+                    self.write(t, interval, merged, period if start is None else covered_period(cached[t]))
+                    frames[t] = _trim(merged, period)
+                elif t in cached:
+                    print(f"⚠️ {t}: top-up failed ({failed.get(t)}), serving cached bars")
+                    self.topup_failures[t] = failed.get(t, "no data")
+                    frames[t] = _trim(cached[t], period)
+                else:
+                    failures[t] = failed.get(t, "no data")
+
+        self.evict()
+        return frames, failures
+
+    def evict(self):
+        """Drop files unused for max_age, then LRU-trim to max_bytes."""
+        now = time.time()
+        entries = []
+        for name in os.listdir(self.root):
+            p = os.path.join(self.root, name)
+            if not name.endswith(".parquet"):
+                continue
+            st = os.stat(p)
+            if now - st.st_mtime > self.max_age:
+                os.remove(p)
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(p)
+            total -= size
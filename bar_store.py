@@ -0,0 +1,172 @@
+"""
+Compact columnar bar store: float32 OHLC + int64 timestamps, memory-mapped.
+
+The Parquet cache (bar_cache.py) keeps one float64 DataFrame per ticker,
+Volume included, and every consumer re-reads and re-stacks them. This is a
+consolidated snapshot of a whole universe already in the Panel layout:
+
+    <root>/<name>/ohlc.npy    float32 (4, bars, tickers): Open, High, Low, Close
+                              on the union calendar, NaN where a ticker did not trade
+    <root>/<name>/ts.npy      int64 epoch nanoseconds of every calendar row
+    <root>/<name>/meta.json   tickers, interval, built_at
+
+Opening it maps the files (np.load(mmap_mode="r")) and returns a Panel
+whose fields are read-only views, so a cold start reads no bars up front
+and only touches the pages it uses. A contiguous run of tickers (a
+screener chunk) and a period are slices, i.e. views too; any other ticker
+subset is one fancy-indexing copy.
+
+float32 keeps ~7 significant digits, finer than Yahoo's quotes; the
+indicators still compute in float64 (indicator_panel packs into float64).
+
+It is a snapshot: refresh_bars rewrites the "dashboard" store after each
+top-up, `python bar_store.py build` consolidates the Parquet cache for any
+universe file.
+
+    python bar_store.py build nifty500.csv --name nifty500
+    python bar_store.py info nifty500
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+
+import numpy as np
+import pandas as pd
+
+from bar_cache import PERIOD_OFFSETS
+from indicator_panel import Panel, OHLC
+
+STORE_DIR = os.getenv("BAR_STORE_DIR", ".cache/barstore")
+DTYPE = np.float32
+
+
+class BarStore:
+    def __init__(self, root=STORE_DIR):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, name):
+        return os.path.join(self.root, name)
+
+    def write(self, name, frames, interval="1d"):
+        """Consolidate {ticker: OHLC frame} into the store `name` (replaces the previous snapshot)."""
+        tickers = [t for t, df in frames.items() if not df.empty]
+        stamps = [frames[t].index.values for t in tickers]
+        index = pd.DatetimeIndex(np.unique(np.concatenate(stamps))) if stamps else pd.DatetimeIndex([])
+
+        tmp = self.path(f"{name}.tmp-{os.getpid()}")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        # Filled in place on disk: no float64 panel in memory, whatever the universe size
+        ohlc = np.lib.format.open_memmap(os.path.join(tmp, "ohlc.npy"), mode="w+", dtype=DTYPE,
+                                         shape=(len(OHLC), len(index), len(tickers)))
+        ohlc[:] = np.nan
+        for j, t in enumerate(tickers):
+            df = frames[t]
+            pos = index.searchsorted(df.index)
+            for k, c in enumerate(OHLC):
+                ohlc[k, pos, j] = df[c].to_numpy(dtype=DTYPE)
+        ohlc.flush()
+        del ohlc
+        np.save(os.path.join(tmp, "ts.npy"), index.values.astype("datetime64[ns]").view(np.int64))
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({"tickers": tickers, "interval": interval, "built_at": time.time()}, f)
+
+        # Swap directories; readers that find no store in the gap fall back to the Parquet cache
+        final, old = self.path(name), self.path(f"{name}.old-{os.getpid()}")
+        if os.path.exists(final):
+            os.replace(final, old)
+        os.replace(tmp, final)
+        shutil.rmtree(old, ignore_errors=True)
+        return final
+
+    def meta(self, name):
+        try:
+            with open(os.path.join(self.path(name), "meta.json"), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def panel(self, name, tickers=None, period=None):
+        """(Panel of read-only float32 views, missing tickers), or None when there is no usable store."""
+        meta = self.meta(name)
+        if meta is None:
+            return None
+        try:
+            ohlc = np.load(os.path.join(self.path(name), "ohlc.npy"), mmap_mode="r")
+            ts = np.load(os.path.join(self.path(name), "ts.npy"), mmap_mode="r")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Unreadable bar store {name}: {e}")
+            return None
+        if ohlc.shape != (len(OHLC), len(ts), len(meta["tickers"])):
+            print(f"⚠️ Bar store {name} is inconsistent (being rewritten?), ignoring it")
+            return None
+
+        rows = slice(None)
+        offset = PERIOD_OFFSETS.get(period)
+        if offset is not None and len(ts):
+            start = pd.Timestamp(int(ts[-1])) - offset
+            rows = slice(int(np.searchsorted(ts, start.value, side="right")), None)
+
+        col = {t: j for j, t in enumerate(meta["tickers"])}
+        wanted = meta["tickers"] if tickers is None else list(dict.fromkeys(tickers))
+        found = [t for t in wanted if t in col]
+        missing = [t for t in wanted if t not in col]
+        idx = [col[t] for t in found]
+        if idx and idx == list(range(idx[0], idx[0] + len(idx))):
+            cols = slice(idx[0], idx[0] + len(idx))      # view
+        else:
+            cols = np.array(idx, dtype=np.intp)          # copy of just these columns
+
+        index = pd.DatetimeIndex(np.asarray(ts[rows]).view("datetime64[ns]"))
+        fields = {c: ohlc[k, rows][:, cols] for k, c in enumerate(OHLC)}
+        return Panel(index, found, fields), missing
+
+    def build(self, name, tickers, bars=None, period="max", interval="1d"):
+        """Consolidate what the Parquet cache holds for `tickers` (no downloads)."""
+        from bar_cache import BarCache
+
+        bars = bars or BarCache()
+        frames, missing = bars.cached(tickers, period=period, interval=interval)
+        self.write(name, frames, interval)
+        return len(frames), missing
+
+
+def store_bytes(path):
+    return sum(os.path.getsize(os.path.join(path, f)) for f in os.listdir(path))
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Consolidate cached bars into a memory-mapped float32 store")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("build", help="build a store from the Parquet cache")
+    p.add_argument("universe", nargs="?", help="universe file (.txt or .csv); default: the dashboard assets")
+    p.add_argument("--name", default="dashboard")
+    p.add_argument("--period", default="max")
+    p = sub.add_parser("info", help="describe a store")
+    p.add_argument("name", nargs="?", default="dashboard")
+    args = ap.parse_args()
+
+    store = BarStore()
+    if args.command == "build":
+        from universe import ASSETS, load_universe
+
+        universe = load_universe(args.universe) if args.universe else ASSETS
+        t0 = time.perf_counter()
+        n, missing = store.build(args.name, list(universe.values()), period=args.period)
+        for t in missing:
+            print(f"⚠️ {t}: {missing[t]}")
+        print(f"✅ {n} tickers -> {store.path(args.name)} "
+              f"({store_bytes(store.path(args.name)) / 1024 / 1024:.1f} MB) in {time.perf_counter() - t0:.1f}s")
+    else:
+        loaded = store.panel(args.name)
+        if loaded is None:
+            raise SystemExit(f"❌ No bar store named {args.name!r} in {store.root}")
+        panel, _ = loaded
+        meta = store.meta(args.name)
+        print(f"📦 {args.name}: {len(panel.tickers)} tickers x {len(panel.index)} bars "
+              f"({panel.index[0]:%Y-%m-%d} .. {panel.index[-1]:%Y-%m-%d}), "
+              f"{store_bytes(store.path(args.name)) / 1024 / 1024:.1f} MB, "
+              f"built {time.strftime('%Y-%m-%d %H:%M', time.localtime(meta['built_at']))}")
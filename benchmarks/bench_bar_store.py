@@ -0,0 +1,104 @@
+"""
+Bar store vs Parquet cache: size on disk, cold-start time and peak RSS.
+
+N synthetic assets go into a temp Parquet cache and are consolidated into
+a float32 bar store. Each read path then runs in a fresh process (cold
+interpreter, warm OS page cache): load every ticker, build the weekly
+indicator panel and classify it. Memory is the child's peak RSS above
+its RSS after imports, so the memory-mapped pages it touched count too.
+
+Signals from float32 bars are checked against the float64 path, and the
+screener is run both ways.
+
+Run from the repo root:  python -m benchmarks.bench_bar_store [n_assets] [years]
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from bar_cache import BarCache
+from bar_store import BarStore, store_bytes
+from run_report import RunReport
+from screener import screen
+from timeframes import Timeframes, WEEK
+from synthetic_data import synthetic_ohlcv
+
+PERIOD = "max"
+
+
+def child(mode, root, n_assets):
+    """One cold read: (load seconds, weekly panel seconds, peak RSS MB) as JSON on stdout."""
+    from run_report import peak_rss_mb, rss_mb
+
+    base = rss_mb()     # interpreter + pandas/NumPy imports
+    tickers = [f"SYM{i:04d}.NS" for i in range(n_assets)]
+    t0 = time.perf_counter()
+    if mode == "parquet":
+        frames, _ = BarCache(root=os.path.join(root, "bars"), max_mb=1 << 20).cached(tickers, period=PERIOD)
+    else:
+        frames, _ = BarStore(os.path.join(root, "store")).panel("bench", tickers, PERIOD)
+    t1 = time.perf_counter()
+    Timeframes(frames).panel(WEEK)
+    t2 = time.perf_counter()
+    print(json.dumps({"load": t1 - t0, "panel": t2 - t1, "rss": peak_rss_mb() - base}))
+
+
+def cold(mode, root, n_assets, repeat=3):
+    runs = []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, "-m", "benchmarks.bench_bar_store", "--child", mode, root, str(n_assets)],
+                             capture_output=True, text=True, check=True)
+        runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+    return {k: min(r[k] for r in runs) for k in runs[0]}
+
+
+def run(n_assets=2000, years=2):
+    tickers = [f"SYM{i:04d}.NS" for i in range(n_assets)]
+    with tempfile.TemporaryDirectory() as root:
+        bars = BarCache(root=os.path.join(root, "bars"), max_mb=1 << 20)
+        frames = {}
+        for t in tickers:
+            frames[t] = synthetic_ohlcv(t, days=365 * years)
+            bars.write(t, "1d", frames[t])
+        store = BarStore(os.path.join(root, "store"))
+        t0 = time.perf_counter()
+        store.write("bench", frames)
+        built = time.perf_counter() - t0
+        parquet_mb = sum(os.path.getsize(os.path.join(bars.root, f)) for f in os.listdir(bars.root)) / 1024 / 1024
+        print(f"📊 {n_assets} assets x {years}y daily bars")
+        print(f"   on disk: Parquet {parquet_mb:6.1f} MB (OHLCV, float64), store {store_bytes(store.path('bench')) / 1024 / 1024:6.1f} MB "
+              f"(OHLC, float32; built in {built:.1f}s)")
+
+        for mode in ("parquet", "store"):
+            r = cold(mode, root, n_assets)
+            print(f"   {mode:8s} cold load {r['load']:6.2f}s  weekly panel {r['panel']:6.2f}s  peak RSS +{r['rss']:6.1f} MB")
+
+        a = Timeframes(frames).panel(WEEK)
+        b = Timeframes(store.panel("bench")[0]).panel(WEEK)
+        differ = int((a["Signal"] != b["Signal"]).sum())
+        rsi = np.nanmax(np.abs(a["RSI_2"] - b["RSI_2"]))
+        print(f"{'✅' if differ <= a['Signal'].size * 1e-4 else '❌'} float32 bars: {differ} of {a['Signal'].size:,} weekly signals "
+              f"differ from float64, max |RSI(2) diff| {rsi:.4f}")
+
+        universe = {t: t for t in tickers}
+        quiet = RunReport("bench", profile=())
+        t0 = time.perf_counter()
+        via_cache = screen(universe, cache_only=True, period=PERIOD, report=quiet, bars=bars)
+        cache_s = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        via_store = screen(universe, period=PERIOD, report=quiet, store=(store, "bench"))
+        store_s = time.perf_counter() - t0
+        same = (via_cache["Signal"] == via_store["Signal"]).mean() * 100
+        print(f"   screener: Parquet {cache_s:5.1f}s, store {store_s:5.1f}s; {same:.2f}% of signals identical")
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--child"]:
+        child(sys.argv[2], sys.argv[3], int(sys.argv[4]))
+    else:
+        run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000, int(sys.argv[2]) if len(sys.argv) > 2 else 2)
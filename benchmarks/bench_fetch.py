@@ -0,0 +1,50 @@
+"""
+Per-ticker download loop vs batched fetch_universe, against a local stand-in.
+
+Run from the repo root:  python -m benchmarks.bench_fetch [n_assets]
+"""
+import sys
+import time
+
+import pandas as pd
+
+from data_fetch import fetch_universe
+from synthetic_data import SyntheticSource
+
+
+def legacy_loop(tickers, source):
+    # What create_card used to do: one download per ticker, one after another
+    frames = {}
+    for t in tickers:
+        df = source(t, period="1y", interval="1d", progress=False)
+        if df.empty: continue
+        if isinstance(df.columns, pd.MultiIndex): df.columns = df.columns.get_level_values(0)
+        if df.index.tz is not None: df.index = df.index.tz_localize(None)
+        frames[t] = df
+    return frames
+
+
+def run(n_assets=11, latency=0.25):
+    tickers = [f"SYM{i:04d}.NS" for i in range(n_assets - 2)] + ["BTC-USD", "BAD.NS"]
+    source = SyntheticSource(latency=latency, failing={"BAD.NS"})
+
+    t0 = time.perf_counter()
+    legacy = legacy_loop(tickers, source)
+    legacy_s = time.perf_counter() - t0
+    legacy_calls = source.calls
+
+    source.calls = 0
+    t0 = time.perf_counter()
+    frames, failures = fetch_universe(tickers, downloader=source)
+    batch_s = time.perf_counter() - t0
+
+    print(f"📊 {len(tickers)} tickers, simulated round trip {latency * 1000:.0f} ms")
+    print(f"   Per-ticker loop: {legacy_s:6.2f}s  ({legacy_calls} calls, {len(legacy)} frames)")
+    print(f"   Batched fetch:   {batch_s:6.2f}s  ({source.calls} calls, {len(frames)} frames, {len(failures)} failed)")
+    print(f"   Speedup: {legacy_s / batch_s:.1f}x")
+    for t, reason in failures.items():
+        print(f"   ⚠️ {t}: {reason}")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 11)
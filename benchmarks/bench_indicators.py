@@ -0,0 +1,32 @@
+"""
+Per-frame pandas calculate_indicators vs the vectorized indicator panel
+(correctness: tests/test_indicators.py).
+
+Run from the repo root:  python -m benchmarks.bench_indicators [n_assets]
+"""
+import sys
+import time
+
+from indicator_panel import indicators_for_frames
+from synthetic_data import legacy_calculate_indicators, weekly_universe
+
+
+def run(n_assets=2000):
+    frames = weekly_universe(n_assets)
+
+    t0 = time.perf_counter()
+    legacy = {t: legacy_calculate_indicators(df.copy()) for t, df in frames.items()}
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    panel = indicators_for_frames(frames)
+    panel_s = time.perf_counter() - t0
+
+    print(f"📊 {n_assets} assets x {len(panel.index)} weekly bars")
+    print(f"   Per-frame pandas: {legacy_s:6.2f}s")
+    print(f"   Indicator panel:  {panel_s:6.2f}s")
+    print(f"   Speedup: {legacy_s / panel_s:.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,44 @@
+"""
+Gemini response cache: API calls and latency for repeated dashboard builds.
+
+Run from the repo root:  python -m benchmarks.bench_llm_cache [n_builds]
+"""
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from google.genai import types
+
+from llm_cache import CachedClient, FakeClient, ResponseCache
+
+CONFIG = types.GenerateContentConfig(tools=[types.Tool(google_search=types.GoogleSearch())],
+                                     system_instruction="Keep it brief (3 sentences).")
+QUERY = "Quick status of Nifty 50 and Bitcoin vs their 90-day Moving Average."
+
+
+def run(n_builds=5, latency=0.5):
+    path = os.path.join(tempfile.mkdtemp(), "llm.sqlite")
+    fake = FakeClient(latency=latency)
+
+    # Same prompt fired from 8 threads at once: one upstream call
+    client = CachedClient(fake, ResponseCache(path))
+    with ThreadPoolExecutor(8) as pool:
+        texts = list(pool.map(lambda _: client.models.generate_content(
+            model="gemini-2.0-flash", contents=QUERY, config=CONFIG).text, range(8)))
+    assert fake.calls == 1 and len(set(texts)) == 1
+    print(f"✅ 8 concurrent identical requests -> {fake.calls} API call {client.cache.stats()}")
+
+    # Later builds (new process = new client) within the TTL: zero calls
+    t0 = time.perf_counter()
+    for _ in range(n_builds):
+        CachedClient(fake, ResponseCache(path)).models.generate_content(
+            model="gemini-2.0-flash", contents=QUERY, config=CONFIG)
+    cached_s = (time.perf_counter() - t0) / n_builds
+    assert fake.calls == 1
+    print(f"✅ {n_builds} more builds -> still {fake.calls} API call, {cached_s * 1000:.1f} ms each vs {latency * 1000:.0f} ms upstream")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
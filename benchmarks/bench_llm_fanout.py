@@ -0,0 +1,50 @@
+"""
+Per-asset Gemini fan-out vs sequential calls, against a fake client that throttles.
+
+Run from the repo root:  python -m benchmarks.bench_llm_fanout [n_assets]
+"""
+import sys
+import time
+
+from llm_cache import FakeClient
+from llm_fanout import FanOut, retryable
+
+
+def sequential(client, prompts):
+    out = {}
+    for k, p in prompts.items():
+        while True:
+            try:
+                out[k] = client.models.generate_content(model="m", contents=p).text
+                break
+            except Exception as e:
+                if not retryable(e):
+                    raise
+                time.sleep(0.05)
+    return out
+
+
+def run(n_assets=11, latency=0.4, fail_rate=0.2):
+    prompts = {f"Asset {i}": f"latest price of asset {i}" for i in range(n_assets)}
+
+    client = FakeClient(latency=latency, fail_rate=fail_rate, seed=1)
+    t0 = time.perf_counter()
+    seq = sequential(client, prompts)
+    seq_s, seq_calls = time.perf_counter() - t0, client.calls
+
+    client = FakeClient(latency=latency, fail_rate=fail_rate, seed=1)
+    fan = FanOut(client, "m", rpm=600, concurrency=8, base=0.05, cap=1.0)
+    t0 = time.perf_counter()
+    par = fan.run(prompts)
+    par_s = time.perf_counter() - t0
+
+    assert par == seq and list(par) == list(prompts)
+    for name, text in list(par.items())[:3]:
+        print(f"   {name}: {text}")
+    print(f"📊 {n_assets} assets, {latency * 1000:.0f} ms/call, {fail_rate:.0%} of calls throttled (429)")
+    print(f"   Sequential: {seq_s:5.2f}s ({seq_calls} calls)")
+    print(f"   Fan-out:    {par_s:5.2f}s ({client.calls} calls, {fan.retries} retried)  {seq_s / par_s:.1f}x faster")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 11)
@@ -0,0 +1,49 @@
+"""
+Startup cost of picking a model: live client.models.list() vs the on-disk registry.
+
+Run from the repo root:  python -m benchmarks.bench_model_registry [list_latency_s]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from google.genai import types
+
+from model_registry import ModelRegistry
+
+NAMES = ["models/gemini-1.5-flash-8b", "models/gemini-2.0-flash", "models/gemini-2.0-flash-lite",
+         "models/gemini-2.5-flash", "models/gemini-2.5-flash-preview-tts", "models/gemini-2.5-pro",
+         "models/gemini-flash-latest", "models/gemini-pro-latest"]
+
+
+class ListingClient:
+    def __init__(self, latency):
+        self.latency, self.calls, self.models = latency, 0, self
+
+    def list(self):
+        self.calls += 1
+        time.sleep(self.latency)
+        return [types.Model(name=n, supported_actions=["generateContent"]) for n in NAMES]
+
+
+def run(latency=0.6, n_starts=5):
+    path = os.path.join(tempfile.mkdtemp(), "models.json")
+    client = ListingClient(latency)
+
+    t0 = time.perf_counter()
+    first = ModelRegistry(client, path=path).best("flash")
+    cold_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    picks = {ModelRegistry(client, path=path).best("flash") for _ in range(n_starts)}
+    warm_s = (time.perf_counter() - t0) / n_starts
+
+    assert picks == {first} and client.calls == 1
+    print(f"📊 best('flash') = {first}")
+    print(f"   Cold start (live listing): {cold_s * 1000:7.1f} ms")
+    print(f"   Warm start (disk cache):   {warm_s * 1000:7.1f} ms  ({n_starts} starts, 1 listing call in total)")
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 0.6)
@@ -0,0 +1,38 @@
+"""
+Parameter-sweep scaling with worker count, on synthetic weekly data.
+
+Run from the repo root:  python -m benchmarks.bench_optimizer [n_assets] [n_combos]
+"""
+import os
+import sys
+import time
+
+from indicator_panel import stack_panel
+from optimizer import sweep, random_combos
+from synthetic_data import synthetic_ohlcv
+
+
+def run(n_assets=100, n_combos=200):
+    weekly = {}
+    for i in range(n_assets):
+        t = f"SYM{i:04d}.NS"
+        weekly[t] = synthetic_ohlcv(t, 20 * 365).resample("W-FRI").agg(
+            {"Open": "first", "High": "max", "Low": "min", "Close": "last"}).dropna()
+    panel = stack_panel(weekly)
+    combos = random_combos(n_combos)
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, 32, cores} & set(range(1, cores + 1)))
+    base = None
+    print(f"📊 {len(combos)} combos x {n_assets} assets x {len(panel.index)} weekly bars")
+    for w in counts:
+        t0 = time.perf_counter()
+        results = sweep(panel, combos, workers=w)
+        dt = time.perf_counter() - t0
+        base = base or dt
+        print(f"   {w:2d} workers: {dt:6.2f}s  {len(results) / dt:7.1f} combos/s  speedup {base / dt:4.1f}x")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    run(*args)
@@ -0,0 +1,260 @@
+"""
+End-to-end pipeline benchmark, fully offline.
+
+Runs the main_production pipeline stage by stage against a deterministic
+local yf.download (synthetic random walks, or real bars recorded earlier)
+and the fake Gemini client, at several universe sizes:
+
+  fetch       BarCache.load through fetch_universe (parquet writes included,
+              time spent inside the stand-in downloader itself excluded)
+  resample    daily panel + 90-day MA -> weekly and monthly bars
+  indicators  compute_indicators on daily, weekly and monthly bars
+  signal      classify_panel + latest signal per timeframe
+  render      compact card payloads (render_pool, as main_production)
+  plotly      main09 Plotly cards (first --plotly-cards assets; per-card time is reported)
+  html        render_dashboard + write the page
+  llm         per-asset FanOut + model choice through the cached fake client (cold, then warm)
+
+Results go to benchmarks/results/<commit>.json; --baseline compares with an
+earlier file and exits 1 when a stage got more than --threshold slower.
+
+Run from the repo root:
+  python -m benchmarks.bench_pipeline                       # 11, 500 and 5000 assets
+  python -m benchmarks.bench_pipeline --sizes 11 500 --baseline benchmarks/results/abc1234.json
+  python -m benchmarks.bench_pipeline --recorded .cache/bars --years 1
+"""
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from bar_cache import BarCache
+from dashboard_render import render_dashboard
+from indicator_panel import compute_indicators
+from llm_cache import CachedClient, FakeClient, ResponseCache
+from llm_fanout import FanOut
+from main_production import card_from_arrays, CARD_FIELDS
+from model_registry import ModelRegistry
+from render_pool import render_cards, to_arrays
+from signals import classify_panel, latest_signals
+from timeframes import Timeframes, DAY, WEEK, MONTH
+from synthetic_data import SyntheticSource, RecordedSource
+
+SIZES = (11, 500, 5000)
+RESULTS_DIR = os.path.join("benchmarks", "results")
+PLOTLY_CARDS = 25
+LLM_ASSETS = 11
+THRESHOLD = 0.25        # 25% slower than the baseline counts as a regression
+NOISE_FLOOR = 0.01      # ignore stages faster than 10 ms in comparisons
+YEARS = {1: "1y", 2: "2y", 5: "5y", 10: "10y"}
+
+
+def universe(n):
+    # Mostly NSE names, plus the 24x7 and index shapes the real ASSETS dict has
+    special = ["BTC-USD", "^NSEI", "^BSESN"][:n]
+    return special + [f"SYM{i:04d}.NS" for i in range(n - len(special))]
+
+
+class TimedSource:
+    """Wraps the stand-in downloader so its own generation time can be taken out of the fetch stage."""
+
+    def __init__(self, source):
+        self.source = source
+        self.seconds = 0.0
+
+    def __call__(self, *args, **kwargs):
+        t0 = time.perf_counter()
+        try:
+            return self.source(*args, **kwargs)
+        finally:
+            self.seconds += time.perf_counter() - t0
+
+
+class Stopwatch:
+    def __init__(self):
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        t0 = time.perf_counter()
+        yield
+        self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - t0
+
+
+def run_size(n, source, period, workdir, plotly_cards=PLOTLY_CARDS, llm_assets=LLM_ASSETS, llm_latency=0.02):
+    tickers = universe(n)
+    names = {t: t for t in tickers}
+    sw = Stopwatch()
+    counts = {"assets": n}
+
+    source = TimedSource(source)
+    with sw.stage("fetch"):
+        frames, failures = BarCache(root=os.path.join(workdir, f"bars{n}")).load(tickers, period=period, downloader=source)
+    sw.stages["fetch"] -= source.seconds
+    counts["provider_s"] = round(source.seconds, 3)
+    counts["fetched"] = len(frames)
+    counts["daily_bars"] = int(sum(len(df) for df in frames.values()))
+
+    with sw.stage("resample"):
+        tf = Timeframes(frames)
+        bars = {rule: tf.bars(rule) for rule in (DAY, WEEK, MONTH)}
+
+    with sw.stage("indicators"):
+        panels = {}
+        for rule, b in bars.items():
+            p = compute_indicators(b)
+            p["MA_90"] = p.fields.pop("MA_90D")
+            panels[rule] = p
+
+    with sw.stage("signal"):
+        panels = {rule: classify_panel(p) for rule, p in panels.items()}
+        side = {label: latest_signals(panels[rule]) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))}
+    weekly = panels[WEEK]
+
+    with sw.stage("render"):
+        cards, _ = render_cards(card_from_arrays, [(names[t], to_arrays(weekly.frame(t), CARD_FIELDS)) for t in frames])
+        for t, c in zip(frames, cards):
+            if c:
+                c["tf"] = [[label, *sig[t]] for label, sig in side.items()]
+    counts["cards"] = sum(1 for c in cards if c)
+
+    # Plotly is ~100x slower per card than the compact renderer, so only a sample is drawn
+    sample = list(frames)[:plotly_cards]
+    with contextlib.redirect_stdout(io.StringIO()):
+        from main09_chart import create_chart_card
+        with sw.stage("plotly"):
+            figs = [create_chart_card(names[t], weekly.frame(t)) for t in sample]
+    counts["plotly_cards"] = sum(1 for f in figs if f)
+    counts["plotly_ms_per_card"] = round(1000 * sw.stages["plotly"] / max(1, len(sample)), 2)
+
+    with sw.stage("html"):
+        html = render_dashboard([c for c in cards if c])
+        with open(os.path.join(workdir, f"index{n}.html"), "w") as f:
+            f.write(html)
+    counts["html_kb"] = round(len(html.encode()) / 1024, 1)
+
+    fake = FakeClient(latency=llm_latency)
+    client = CachedClient(fake, ResponseCache(os.path.join(workdir, f"llm{n}.sqlite")))
+    prompts = {t: f"One line of news for {t}" for t in list(frames)[:llm_assets]}
+    for label in ("llm_cold", "llm_warm"):
+        with sw.stage(label):
+            model = ModelRegistry(client, path=os.path.join(workdir, f"models{n}.json")).best("flash")
+            answers = FanOut(client, model, rpm=60_000).run(prompts)
+    counts["llm_calls"] = fake.calls
+    counts["llm_errors"] = sum(isinstance(a, Exception) for a in answers.values())
+
+    return {"assets": n, "stages": {k: round(v, 4) for k, v in sw.stages.items()},
+            "total": round(sum(sw.stages.values()), 4), "counts": counts, "failures": len(failures)}
+
+
+def best_of(runs):
+    """Per-stage minimum over repeats (least noisy estimate on a shared machine)."""
+    out = dict(runs[0])
+    out["stages"] = {k: min(r["stages"][k] for r in runs) for k in runs[0]["stages"]}
+    out["total"] = round(sum(out["stages"].values()), 4)
+    out["repeats"] = len(runs)
+    return out
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def environment():
+    return {
+        "commit": _git("rev-parse", "--short", "HEAD") or "unknown",
+        "dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "timestamp": pd.Timestamp.now(tz="UTC").isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def compare(result, baseline, threshold=THRESHOLD):
+    """Print per-stage ratios against a baseline result; returns the regressions."""
+    old = {r["assets"]: r for r in baseline["runs"]}
+    regressions = []
+    print(f"\n📈 vs {baseline['env']['commit']} ({baseline['env']['timestamp']})")
+    for run in result["runs"]:
+        prev = old.get(run["assets"])
+        if prev is None:
+            continue
+        for stage, secs in run["stages"].items():
+            before = prev["stages"].get(stage)
+            if before is None or max(before, secs) < NOISE_FLOOR:
+                continue
+            ratio = secs / before if before else float("inf")
+            flag = "❌" if ratio > 1 + threshold else ("✅" if ratio < 1 - threshold else "  ")
+            print(f"   {flag} {run['assets']:>5} {stage:11s} {before:8.3f}s -> {secs:8.3f}s  ({ratio:5.2f}x)")
+            if ratio > 1 + threshold:
+                regressions.append((run["assets"], stage, ratio))
+    return regressions
+
+
+def run(sizes=SIZES, years=1, recorded=None, latency=0.0, repeat=1, plotly_cards=PLOTLY_CARDS, out=None):
+    period = YEARS[years]
+    result = {"env": environment(), "config": {"years": years, "period": period, "source": recorded or "synthetic",
+                                               "latency": latency, "repeat": repeat, "plotly_cards": plotly_cards},
+              "runs": []}
+    print(f"🏁 Pipeline benchmark @ {result['env']['commit']}: {years}y of daily bars, "
+          f"{'recorded from ' + recorded if recorded else 'synthetic'} source")
+    for n in sizes:
+        runs = []
+        for _ in range(repeat):
+            # Fresh cache and source each time, so every repeat pays the cold fetch
+            source = RecordedSource(recorded, latency=latency) if recorded else SyntheticSource(latency=latency, per_ticker=0.0)
+            with tempfile.TemporaryDirectory() as workdir:
+                runs.append(run_size(n, source, period, workdir, plotly_cards))
+        r = best_of(runs)
+        result["runs"].append(r)
+        stages = "  ".join(f"{k} {v:.3f}s" for k, v in r["stages"].items())
+        print(f"   {n:>5} assets: {r['total']:7.2f}s  |  {stages}")
+        print(f"         {r['counts']['daily_bars']:,} daily bars, {r['counts']['cards']} cards, "
+              f"{r['counts']['html_kb']:,} KB page, Plotly {r['counts']['plotly_ms_per_card']} ms/card")
+
+    result["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    out = out or os.path.join(RESULTS_DIR, f"{result['env']['commit']}{'-dirty' if result['env']['dirty'] else ''}.json")
+    os.makedirs(os.path.dirname(out) or ".", exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=1)
+    print(f"💾 {out} (peak RSS {result['peak_rss_mb']} MB)")
+    return result
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Time every pipeline stage offline and save JSON results")
+    ap.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    ap.add_argument("--years", type=int, choices=sorted(YEARS), default=1, help="history per ticker")
+    ap.add_argument("--recorded", help="directory of recorded daily bars (parquet/CSV) to replay instead of synthetic data")
+    ap.add_argument("--latency", type=float, default=0.0, help="simulated seconds per download call")
+    ap.add_argument("--repeat", type=int, default=1, help="keep the fastest of N runs per stage")
+    ap.add_argument("--plotly-cards", type=int, default=PLOTLY_CARDS)
+    ap.add_argument("--out", help="result file (default benchmarks/results/<commit>.json)")
+    ap.add_argument("--baseline", help="earlier result file to compare against")
+    ap.add_argument("--threshold", type=float, default=THRESHOLD)
+    args = ap.parse_args()
+
+    result = run(args.sizes, args.years, args.recorded, args.latency, args.repeat, args.plotly_cards, args.out)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.threshold)
+        if regressions:
+            print(f"❌ {len(regressions)} stage(s) slower than {1 + args.threshold:.2f}x the baseline")
+            sys.exit(1)
+        print("✅ No regressions")
@@ -0,0 +1,54 @@
+"""
+Page size and build time: per-card fig.to_html vs the compact JSON renderer.
+
+Run from the repo root:  python -m benchmarks.bench_render [n_assets]
+"""
+import gzip
+import sys
+import time
+
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from dashboard_render import card_payload, render_dashboard
+from indicator_panel import indicators_for_frames
+from signals import classify_panel, signal_for_row
+from synthetic_data import synthetic_ohlcv
+
+
+def legacy_card(name, df):
+    # The old create_card: a full Plotly figure serialized per card
+    fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.75, 0.25])
+    fig.add_trace(go.Candlestick(x=df.index, open=df['Open'], high=df['High'], low=df['Low'], close=df['Close']), row=1, col=1)
+    fig.add_trace(go.Scatter(x=df.index, y=df['MA_90']), row=1, col=1)
+    fig.add_trace(go.Scatter(x=df.index, y=df['UT_Stop']), row=1, col=1)
+    fig.add_trace(go.Scatter(x=df.index, y=df['RSI_2']), row=2, col=1)
+    fig.update_layout(template="plotly_dark", height=400, showlegend=False)
+    return f"<div class='card'><h3>{name}</h3>{fig.to_html(full_html=False, include_plotlyjs='cdn')}</div>"
+
+
+def run(n_assets=11):
+    weekly = {}
+    for i in range(n_assets):
+        t = f"SYM{i:04d}.NS"
+        weekly[t] = synthetic_ohlcv(t).resample('W-FRI').agg(
+            {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}).dropna()
+    panel = classify_panel(indicators_for_frames(weekly))
+    frames = {t: panel.frame(t) for t in weekly}
+
+    t0 = time.perf_counter()
+    legacy = "<html><body>" + "".join(legacy_card(t, df) for t, df in frames.items()) + "</body></html>"
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    compact = render_dashboard([card_payload(t, df, *signal_for_row(df.iloc[-1])) for t, df in frames.items()])
+    compact_s = time.perf_counter() - t0
+
+    for label, page, dt in (("fig.to_html per card", legacy, legacy_s), ("compact renderer", compact, compact_s)):
+        raw = page.encode()
+        print(f"   {label:22s} {len(raw) / 1024:8.1f} KB  ({len(gzip.compress(raw)) / 1024:6.1f} KB gz)  built in {dt:.2f}s")
+    print(f"📊 {n_assets} cards: {len(legacy) / len(compact):.1f}x smaller")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 11)
@@ -0,0 +1,61 @@
+"""
+Screener time and peak memory over a large universe: chunked vs all at once.
+
+Bars come from the synthetic source into a temp cache. Times are from
+untraced runs (the cold one includes generating the synthetic bars); peak
+memory is the tracemalloc peak (NumPy and pandas buffers included) of a
+separate traced pass over the cached bars, since tracing slows pandas
+several times over.
+
+Run from the repo root:  python -m benchmarks.bench_screener [n_assets] [chunk]
+"""
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bar_cache import BarCache
+from run_report import RunReport
+from screener import screen, hits
+from synthetic_data import SyntheticSource
+
+
+def timed(universe, chunk, bars, cache_only):
+    t0 = time.perf_counter()
+    table = screen(universe, chunk, cache_only=cache_only, report=RunReport("bench", profile=()), bars=bars)
+    return table, time.perf_counter() - t0
+
+
+def traced_peak(universe, chunk, bars):
+    tracemalloc.start()
+    screen(universe, chunk, cache_only=True, report=RunReport("bench", profile=()), bars=bars)
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return peak
+
+
+def run(n_assets=5000, chunk=250):
+    universe = {f"SYM{i:04d}": f"SYM{i:04d}.NS" for i in range(n_assets - 1)}
+    universe["Bitcoin"] = "BTC-USD"
+    source = SyntheticSource(latency=0, per_ticker=0)
+
+    with tempfile.TemporaryDirectory() as root:
+        bars = BarCache(root=root, max_mb=4096)
+        original = bars.load
+        bars.load = lambda tickers, **kw: original(tickers, downloader=source, **kw)
+
+        table, secs = timed(universe, chunk, bars, cache_only=False)
+        print(f"📊 cold fetch, chunked  {len(table):>5} screened in {secs:6.1f}s")
+        results = {}
+        for label, size in (("cached, chunked", chunk), ("cached, one batch", n_assets)):
+            results[label], secs = timed(universe, size, bars, cache_only=True)
+            peak = traced_peak(universe, size, bars)
+            print(f"📊 {label:20s} {len(results[label]):>5} screened in {secs:6.1f}s, peak {peak:7.1f} MB")
+
+    a, b = results["cached, chunked"], results["cached, one batch"]
+    same = a.sort_values("Ticker").reset_index(drop=True).equals(b.sort_values("Ticker").reset_index(drop=True))
+    print(f"{'✅' if same else '❌'} Chunked and one-batch results identical; {len(hits(a))} hits with RSI(2) < 10")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000, int(sys.argv[2]) if len(sys.argv) > 2 else 250)
@@ -0,0 +1,85 @@
+"""
+Signal history store: bulk upsert cost per run and indexed query latency.
+
+Records D/W/M panels for N synthetic assets: the first full write, a
+re-run with no new bars, and a run after a week of new daily bars. The
+incremental store is checked row-for-row against a full rewrite. Then
+times "flipped to BUY in the last week" and one ticker's history with the
+indexes, and with them disabled (unary + on the indexed columns).
+
+Run from the repo root:  python -m benchmarks.bench_signal_store [n_assets] [years]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from signal_store import SignalStore, match_signals
+from timeframes import Timeframes, DAY, WEEK, MONTH
+from synthetic_data import synthetic_ohlcv
+
+
+def best_ms(fn, repeat=20):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000, out
+
+
+def panels_for(frames, end=None):
+    tf = Timeframes({t: df[:end] if end else df for t, df in frames.items()})
+    return tf, {label: tf.panel(rule) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))}
+
+
+def dump(store):
+    return [store._db.execute(f"SELECT * FROM {t} ORDER BY ticker, timeframe, ts").fetchall() for t in ("snapshots", "transitions")]
+
+
+def run(n_assets=500, years=2):
+    frames = {f"SYM{i:04d}.NS": synthetic_ohlcv(f"SYM{i:04d}.NS", days=365 * years) for i in range(n_assets)}
+    cut = sorted(frames["SYM0000.NS"].index)[-6]      # a week earlier, mid-week
+    _, earlier = panels_for(frames, cut)
+    tf, panels = panels_for(frames)
+
+    with tempfile.TemporaryDirectory() as root:
+        store = SignalStore(os.path.join(root, "signals.sqlite"))
+        t0 = time.perf_counter()
+        snaps, flips = store.record_panels(earlier, run_at=1.0)
+        cold = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        same = store.record_panels(earlier, run_at=1.0)
+        rerun = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        week = store.record_panels(panels, run_at=1.0)
+        newbars = time.perf_counter() - t0
+        print(f"📊 {n_assets} assets x {years}y, D/W/M: {snaps:,} snapshots, {flips:,} transitions")
+        print(f"   first write   {cold:6.2f}s")
+        print(f"   re-run        {rerun:6.2f}s ({same[0]:,} rows rewritten)")
+        print(f"   +1 week bars  {newbars:6.2f}s ({week[0]:,} rows written)")
+
+        full = SignalStore(os.path.join(root, "full.sqlite"))
+        full.record_panels(panels, run_at=1.0, full=True)
+        print(f"{'✅' if dump(store) == dump(full) else '❌'} Incremental store identical to a full rewrite")
+        full.close()
+
+        since = (tf.daily.index[-1] - pd.Timedelta(days=7)).strftime("%Y-%m-%d")
+        wanted = match_signals("BUY")
+        marks = ", ".join("?" * len(wanted))
+        queries = {
+            "flips to BUY, last 7 days": (f"SELECT * FROM transitions WHERE {{0}}signal IN ({marks}) AND {{0}}ts >= ?", [*wanted, since]),
+            "one ticker's weekly history": ("SELECT * FROM snapshots WHERE {0}ticker = ? AND timeframe = 'W' ORDER BY ts", ["SYM0042.NS"]),
+        }
+        for label, (sql, args) in queries.items():
+            fast, rows = best_ms(lambda: store._db.execute(sql.format(""), args).fetchall())
+            slow, rows_scan = best_ms(lambda: store._db.execute(sql.format("+"), args).fetchall(), repeat=3)
+            ok = "✅" if sorted(rows) == sorted(rows_scan) else "❌"
+            print(f"   {ok} {label:28s} {len(rows):>5} rows: {fast:7.2f} ms indexed vs {slow:8.2f} ms full scan")
+        store.close()
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500, int(sys.argv[2]) if len(sys.argv) > 2 else 2)
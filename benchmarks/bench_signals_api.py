@@ -0,0 +1,40 @@
+"""
+Signals API snapshot: size on the wire and cost per run.
+
+Builds the D/W/M panels for N synthetic assets, then times the API step
+alone (records from the panels, JSON + NDJSON encoding, gzip and, when
+installed, brotli) and prints each file's size. The gzip variants are
+checked to decompress to the plain files.
+
+Run from the repo root:  python -m benchmarks.bench_signals_api [sizes...]
+"""
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+from timeframes import Timeframes, DAY, WEEK, MONTH
+from signals_api import publish, brotli
+from synthetic_data import synthetic_ohlcv
+
+
+def run(sizes=(11, 500, 5000)):
+    if brotli is None:
+        print("ℹ️ brotli not installed: no .br variants")
+    for n in sizes:
+        frames = {f"SYM{i:04d}.NS": synthetic_ohlcv(f"SYM{i:04d}.NS") for i in range(n)}
+        tf = Timeframes(frames)
+        panels = {label: tf.panel(rule) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))}
+        names = {t: t.split(".")[0] for t in frames}
+        with tempfile.TemporaryDirectory() as out:
+            t0 = time.perf_counter()
+            written = publish(panels, names, list(frames), out)
+            secs = time.perf_counter() - t0
+            ok = all(gzip.decompress(open(p, "rb").read()) == open(p[:-3], "rb").read() for p in written if p.endswith(".gz"))
+            files = ", ".join(f"{os.path.basename(p)} {size / 1024:,.1f} KB" for p, size in written.items())
+        print(f"{'✅' if ok else '❌'} {n:>5} assets in {secs * 1000:7.1f} ms: {files}")
+
+
+if __name__ == "__main__":
+    run(tuple(int(a) for a in sys.argv[1:]) or (11, 500, 5000))
@@ -0,0 +1,49 @@
+"""
+Streaming IndicatorState throughput: bars and ticks per second
+(correctness vs the batch panel: tests/test_streaming.py).
+
+Run from the repo root:  python -m benchmarks.bench_streaming [n_weeks]
+"""
+import sys
+import time
+
+import numpy as np
+
+from main_production import weekly_bars
+from streaming import IndicatorState, BarStream, run_stream
+from timeframes import period_ends, WEEK
+from synthetic_data import synthetic_ohlcv, daily_ticks
+
+
+def run(n_weeks=520):
+    daily = synthetic_ohlcv("BTC-USD", days=n_weeks * 7)
+    weekly = weekly_bars(daily)
+
+    # Bar by bar, with each week's daily closes fed to the 90-day MA first
+    state = IndicatorState()
+    weeks = period_ends(daily.index, WEEK)
+    days = daily.index.values.astype("datetime64[D]").astype(np.int64)
+    closes = daily["Close"].to_numpy(float)
+    t0 = time.perf_counter()
+    rows = []
+    for label, bar in zip(period_ends(weekly.index, WEEK), weekly[["High", "Low", "Close"]].to_numpy()):
+        for i in np.flatnonzero(weeks == label):
+            state.ma.update(int(days[i]), closes[i])
+        rows.append(state.update(bar))
+    bar_s = time.perf_counter() - t0
+
+    # Tick replay: ticks over the last weeks, seeded from history before them
+    split = len(weekly) - 26
+    stream = BarStream.from_history("BTC-USD", weekly.iloc[:split], daily=daily[daily.index <= weekly.index[split - 1]])
+    ticks = list(daily_ticks(daily[daily.index > weekly.index[split - 1]]))
+    events = []
+    t0 = time.perf_counter()
+    n = run_stream(stream, ticks, emit=events.append)
+    tick_s = time.perf_counter() - t0
+    print(f"📊 {len(rows)} weekly bars, {n} ticks over the last 26 weeks ({len(events)} signal changes)")
+    print(f"   update(bar):  {len(rows) / bar_s / 1e3:6.1f} k bars/s")
+    print(f"   on_tick:      {n / tick_s / 1e3:6.1f} k ticks/s")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 520)
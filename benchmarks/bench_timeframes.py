@@ -0,0 +1,50 @@
+"""
+Three pandas resample().agg() passes per asset vs one daily panel + boundary indices.
+
+Run from the repo root:  python -m benchmarks.bench_timeframes [n_assets]
+"""
+import sys
+import time
+
+import numpy as np
+
+from indicator_panel import OHLC
+from timeframes import Timeframes, DAY, WEEK, MONTH
+from synthetic_data import synthetic_ohlcv
+
+AGG = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}
+
+
+def run(n_assets=500, days=1500):
+    frames = {}
+    for i in range(n_assets):
+        t = "BTC-USD" if i == 0 else f"SYM{i:04d}.NS"
+        frames[t] = synthetic_ohlcv(t, days)
+
+    t0 = time.perf_counter()
+    legacy = {t: {rule: df.resample(rule).agg(AGG).dropna() for rule in (WEEK, MONTH)} for t, df in frames.items()}
+    ma = {t: df['Close'].rolling('90D').mean() for t, df in frames.items()}
+    legacy_s = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    tf = Timeframes(frames)
+    bars = {rule: tf.bars(rule) for rule in (DAY, WEEK, MONTH)}
+    engine_s = time.perf_counter() - t0
+
+    for t in list(frames)[:50]:
+        for rule in (WEEK, MONTH):
+            got = bars[rule].frame(t)
+            ref = legacy[t][rule]
+            assert np.array_equal(got.index.values.astype("datetime64[D]"), ref.index.values.astype("datetime64[D]"))
+            np.testing.assert_allclose(got[list(OHLC)].to_numpy(), ref.to_numpy(), rtol=1e-12)
+            np.testing.assert_allclose(got["MA_90D"].to_numpy(), ma[t].resample(rule).last().dropna().to_numpy(), rtol=1e-9)
+        np.testing.assert_allclose(bars[DAY].frame(t)["MA_90D"].to_numpy(), ma[t].to_numpy(), rtol=1e-9)
+
+    print(f"📊 {n_assets} assets x {len(tf.daily.index)} daily bars -> D/W/M (results match pandas)")
+    print(f"   pandas resample x2 + rolling('90D'): {legacy_s:6.2f}s")
+    print(f"   Timeframes (one panel, reduceat):    {engine_s:6.2f}s")
+    print(f"   Speedup: {legacy_s / engine_s:.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 500)
@@ -0,0 +1,34 @@
+"""
+UT Bot kernel throughput (correctness: tests/test_ut_bot.py).
+
+Run from the repo root:  python -m benchmarks.bench_ut_bot [n_assets] [n_bars]
+"""
+import sys
+import time
+
+from indicator_panel import atr
+from ut_bot import ut_bot, UTBotState
+from synthetic_data import random_bars
+
+
+def run(n_assets=2000, n_bars=5000):
+    high, low, close = random_bars(n_bars, n_assets)
+    a = atr(high, low, close, 10)
+    t0 = time.perf_counter()
+    ut_bot(close, a, 2.0)
+    kernel_s = time.perf_counter() - t0
+
+    state = UTBotState(10, 2.0)
+    t0 = time.perf_counter()
+    for i in range(n_bars):
+        state.update((high[i, 0], low[i, 0], close[i, 0]))
+    update_s = time.perf_counter() - t0
+
+    print(f"📊 {n_assets} assets x {n_bars} bars")
+    print(f"   Batch kernel:  {n_assets * n_bars / kernel_s / 1e6:8.1f} M bars/s  ({kernel_s:.2f}s)")
+    print(f"   update(bar):   {n_bars / update_s / 1e3:8.1f} k bars/s per asset")
+
+
+if __name__ == "__main__":
+    args = [int(x) for x in sys.argv[1:3]]
+    run(*args)
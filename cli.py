@@ -0,0 +1,152 @@
+"""
+One entry point for the dashboard jobs.
+
+    python cli.py fetch [--force]              top up the bar cache (markets that traded since the last run)
+    python cli.py compute [--json] [--refresh|--store]  D/W/M signals from cached bars
+    python cli.py render [--plotly] [--force]   build index.html (or the Plotly strategy_dashboard.html)
+    python cli.py report [--refresh] [--commentary]   portfolio_report.md from cached bars
+    python cli.py alert [--sinks stdout] [--loop]    signal-change alerts only, no rendering
+    python cli.py agent                         Gemini search agent (main_market.py)
+
+Only argparse is imported up front; each command imports what it needs
+when it runs, so `compute` never loads yfinance, plotly or google-genai:
+
+    python -X importtime cli.py compute 2> imports.log
+"""
+import argparse
+import sys
+
+
+def cmd_fetch(args):
+    from main_production import refresh_bars
+    from run_report import RunReport
+
+    report = RunReport("fetch")
+    loaded = refresh_bars(report, force=args.force or None)
+    if loaded:
+        frames, failures = loaded
+        print(f"✅ {len(frames)} tickers cached, {len(failures)} failed.")
+    return 0 if loaded is None or not loaded[1] else 1
+
+
+def cmd_compute(args):
+    from bar_cache import BarCache
+    from universe import ASSETS
+    from signals import latest_signals
+    from timeframes import Timeframes, DAY, WEEK, MONTH
+
+    tickers = list(ASSETS.values())
+    loaded = None
+    if args.store and not args.refresh:
+        from bar_store import BarStore
+        loaded = BarStore().panel("dashboard", tickers, period="1y")
+        if loaded is None:
+            print("⚠️ No bar store yet, reading the Parquet cache.", file=sys.stderr)
+    if loaded:
+        frames, missing = loaded      # memory-mapped daily Panel, written by the last fetch
+        have = set(frames.tickers)
+    else:
+        bars = BarCache()
+        frames, missing = bars.load(tickers, period="1y", interval="1d") if args.refresh else bars.cached(tickers, period="1y", interval="1d")
+        have = set(frames)
+    if not have:
+        print("❌ No cached bars; run `python cli.py fetch` first.", file=sys.stderr)
+        return 1
+
+    tf = Timeframes(frames)
+    side = {label: latest_signals(tf.panel(rule)) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))}
+    rows = {name: {label: sig[t][0] for label, sig in side.items()} for name, t in ASSETS.items() if t in have}
+    if args.json:
+        import json
+        print(json.dumps({"signals": rows, "missing": sorted(missing)}, ensure_ascii=False, indent=1))
+        return 0
+
+    width = max(map(len, rows))
+    for name, sig in rows.items():
+        print(f"{name:<{width}}  " + "  ".join(f"{label}: {text:<18}" for label, text in sig.items()))
+    for t in missing:
+        print(f"⚠️ {t}: not cached")
+    return 0
+
+
+def cmd_render(args):
+    if args.plotly:
+        from main09_chart import build_dashboard
+        build_dashboard()
+        return 0
+    from main_production import update_dashboard
+    report = update_dashboard(force=args.force or None)
+    return 1 if report.counters.get("card_errors") else 0
+
+
+def cmd_report(args):
+    from portfolio import build_report, REPORT_PATH
+
+    text, elapsed = build_report(refresh=args.refresh, with_commentary=args.commentary)
+    out = args.out or REPORT_PATH
+    with open(out, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(text)
+    print(f"✅ Valued in {elapsed * 1000:.1f} ms -> {out}")
+    return 0
+
+
+def cmd_alert(args):
+    import time
+    from alerts import run_once, parse_sinks, ALERT_INTERVAL
+
+    sinks = parse_sinks(args.sinks)
+    while True:
+        events = run_once(sinks, force=args.force)
+        print(f"✅ {len(events)} signal change(s)")
+        if not args.loop:
+            return 0
+        time.sleep(ALERT_INTERVAL.total_seconds())
+
+
+def cmd_agent(args):
+    from main_market import start_search_agent
+    start_search_agent()
+    return 0
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="cli.py", description="Strategy dashboard jobs")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("fetch", help="top up the bar cache")
+    p.add_argument("--force", action="store_true", help="refetch every market, open or not")
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser("compute", help="print daily/weekly/monthly signals from cached bars")
+    p.add_argument("--json", action="store_true")
+    p.add_argument("--refresh", action="store_true", help="top up the cache first (loads yfinance)")
+    p.add_argument("--store", action="store_true", help="read the memory-mapped bar store written by the last fetch")
+    p.set_defaults(func=cmd_compute)
+
+    p = sub.add_parser("render", help="build index.html")
+    p.add_argument("--plotly", action="store_true", help="build strategy_dashboard.html with Plotly figures instead")
+    p.add_argument("--force", action="store_true", help="refetch every market, open or not")
+    p.set_defaults(func=cmd_render)
+
+    p = sub.add_parser("report", help="write portfolio_report.md from cached bars")
+    p.add_argument("--refresh", action="store_true")
+    p.add_argument("--commentary", action="store_true", help="add LLM commentary (loads google-genai)")
+    p.add_argument("--out")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("alert", help="emit signal changes since the last check (no rendering)")
+    p.add_argument("--sinks", help="stdout, file[:path], webhook:<url> (default $ALERT_SINKS or file)")
+    p.add_argument("--force", action="store_true", help="top up every market, open or not")
+    p.add_argument("--loop", action="store_true", help="check every ALERT_INTERVAL_MIN minutes")
+    p.set_defaults(func=cmd_alert)
+
+    p = sub.add_parser("agent", help="run the Gemini search agent")
+    p.set_defaults(func=cmd_agent)
+
+    args = ap.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
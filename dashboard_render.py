@@ -0,0 +1,131 @@
+"""
+Compact dashboard renderer.
+
+Instead of one fig.to_html() per card (each with its own plotly.js tag,
+full plotly_dark template and verbose JSON), the page carries:
+  * one plotly.js <script> tag,
+  * one JSON blob with every card's series as base64 float32 typed arrays
+    (plotly.js decodes {"dtype": "f4", "bdata": ...} natively),
+  * one small JS template that builds each figure client-side from a
+    shared layout, lazily as cards scroll into view.
+"""
+import base64
+import html
+import json
+
+import numpy as np
+
+from signals import colors, rsi_codes
+
+PLOTLY_JS = "https://cdn.plot.ly/plotly-3.7.0.min.js"
+SERIES = ("Open", "High", "Low", "Close", "MA_90", "UT_Stop", "RSI_2")
+
+PAGE_CSS = "body{background:#131722;color:#d1d4dc;font-family:sans-serif;padding:20px;} .grid{display:grid;grid-template-columns:repeat(auto-fit,minmax(400px,1fr));gap:20px;} .card{background:#1e222d;padding:15px;border-radius:8px;} .header{display:flex;justify-content:space-between;margin-bottom:10px;} .badge{padding:4px 8px;border-radius:4px;font-weight:bold;} .stats{color:#888;margin-bottom:10px;display:flex;gap:15px;} .chart{height:400px;} .tf{display:flex;gap:6px;margin-bottom:10px;font-size:12px;} .tf span{padding:2px 6px;border-radius:4px;}"
+
+# Shared figure template; every card's figure is built from this in the browser
+CLIENT_JS = """
+(function(){
+  var D = JSON.parse(document.getElementById('dashboard-data').textContent);
+  var LAYOUT = {
+    height: 400, margin: {l: 40, r: 10, t: 0, b: 20}, showlegend: false,
+    paper_bgcolor: '#1e222d', plot_bgcolor: '#1e222d', font: {color: '#d1d4dc'},
+    xaxis: {anchor: 'y2', type: 'date', rangeslider: {visible: false}, gridcolor: '#2a2e39'},
+    yaxis: {domain: [0.28, 1], gridcolor: '#2a2e39'},
+    yaxis2: {domain: [0, 0.25], range: [0, 100], gridcolor: '#2a2e39'},
+    shapes: [
+      {type: 'rect', xref: 'paper', x0: 0, x1: 1, yref: 'y2', y0: 0, y1: 20, fillcolor: 'green', opacity: 0.1, line: {width: 0}},
+      {type: 'rect', xref: 'paper', x0: 0, x1: 1, yref: 'y2', y0: 90, y1: 100, fillcolor: 'red', opacity: 0.1, line: {width: 0}}
+    ]
+  };
+  function f4(b64) { return {dtype: 'f4', bdata: b64}; }
+  function dates(start, steps) {
+    var t = Date.parse(start), out = [];
+    for (var i = 0; i < steps.length; i++) { t += steps[i] * 864e5; out.push(new Date(t).toISOString().slice(0, 10)); }
+    return out;
+  }
+  function build(el, c) {
+    var x = dates(c.d0, c.dx), s = c.s;
+    var mx = c.m.map(function(m){ return x[m[0]]; }), my = c.m.map(function(m){ return m[2]; });
+    var traces = [
+      {type: 'candlestick', x: x, open: f4(s.Open), high: f4(s.High), low: f4(s.Low), close: f4(s.Close), name: 'Price'},
+      {type: 'scatter', x: x, y: f4(s.MA_90), line: {color: '#ffea00', width: 2}, name: '90MA'},
+      {type: 'scatter', x: x, y: f4(s.UT_Stop), line: {color: '#2979ff', dash: 'dot'}, name: 'UT Bot'},
+      {type: 'scatter', x: mx, y: my, mode: 'markers', marker: {size: 7, color: c.m.map(function(m){ return D.palette[m[1]]; })}, name: 'Signals'},
+      {type: 'scatter', x: x, y: f4(s.RSI_2), yaxis: 'y2', line: {color: '#ab47bc', width: 2}, name: 'RSI'}
+    ];
+    Plotly.newPlot(el, traces, LAYOUT, {responsive: true, displayModeBar: false});
+  }
+  var els = document.querySelectorAll('.chart');
+  var io = 'IntersectionObserver' in window ? new IntersectionObserver(function(entries){
+    entries.forEach(function(e){ if (e.isIntersecting) { io.unobserve(e.target); build(e.target, D.cards[+e.target.dataset.i]); } });
+  }, {rootMargin: '200px'}) : null;
+  els.forEach(function(el){ io ? io.observe(el) : build(el, D.cards[+el.dataset.i]); });
+})();
+"""
+
+
+def _b64_f4(values):
+    return base64.b64encode(np.ascontiguousarray(values, dtype="<f4").tobytes()).decode("ascii")
+
+
+def _num(x):
+    x = float(x)
+    return None if np.isnan(x) else x
+
+
+def _fmt(x):
+    return "—" if x is None else f"{x:.1f}"
+
+
+def card_payload(name, df_weekly, sig_text, sig_color):
+    """Compact per-card data: float32 series, delta-encoded dates, signal marks."""
+    days = df_weekly.index.values.astype("datetime64[D]").astype(np.int64)
+    steps = np.diff(days, prepend=days[0]).tolist()
+    marks = []
+    if "Signal" in df_weekly:
+        codes = df_weekly["Signal"].to_numpy()
+        close = df_weekly["Close"].to_numpy()
+        for i in np.flatnonzero(np.isin(codes, rsi_codes())):
+            marks.append([int(i), int(codes[i]), float(f"{close[i]:.6g}")])
+    last = df_weekly.iloc[-1]
+    return {
+        "name": name, "signal": sig_text, "color": sig_color,
+        "rsi": _num(last["RSI_2"]), "price": _num(last["Close"]),
+        "d0": str(df_weekly.index[0].date()), "dx": steps,
+        "s": {k: _b64_f4(df_weekly[k].to_numpy()) for k in SERIES},
+        "m": marks,
+    }
+
+
+def _timeframe_badges(card):
+    # Optional [[timeframe, label, color], ...] from timeframes.Timeframes
+    spans = "".join(f'<span style="background:{c}20;color:{c}">{html.escape(tf)}: {html.escape(sig)}</span>'
+                    for tf, sig, c in card.get("tf", []))
+    return f'<div class="tf">{spans}</div>' if spans else ""
+
+
+def card_html(i, card):
+    name, sig, color = html.escape(card["name"]), html.escape(card["signal"]), card["color"]
+    return f"""
+        <div class="card" style="border-top: 4px solid {color};">
+            <div class="header"><h3>{name}</h3><span class="badge" style="background:{color}20; color:{color}">{sig}</span></div>
+            <div class="stats"><span>RSI(2): <strong style="color:#fff">{_fmt(card['rsi'])}</strong></span><span>Price: <strong style="color:#fff">{_fmt(card['price'])}</strong></span></div>
+            {_timeframe_badges(card)}
+            <div class="chart" data-i="{i}"></div>
+        </div>"""
+
+
+def render_dashboard(cards, title="Strategy Dashboard", heading="⚡ RSI(2) + UT BOT DASHBOARD", css=PAGE_CSS,
+                     footer="Auto-updated by GitHub Actions"):
+    """Full page for a list of card payloads (in display order)."""
+    data = json.dumps({"palette": colors(), "cards": cards}, separators=(",", ":")).replace("</", "<\\/")
+    body = "".join(card_html(i, c) for i, c in enumerate(cards))
+    return f"""<!DOCTYPE html><html><head><title>{title}</title><meta charset="utf-8"><meta name="viewport" content="width=device-width,initial-scale=1">
+<style>{css}</style>
+<script src="{PLOTLY_JS}" defer></script>
+</head><body><h1 style="text-align:center;color:#2962ff">{heading}</h1><div class="grid">{body}</div>
+<p style="text-align:center;color:#555;margin-top:20px">{footer}</p>
+<script type="application/json" id="dashboard-data">{data}</script>
+<script>window.addEventListener('DOMContentLoaded', function(){{{CLIENT_JS}}});</script>
+</body></html>
+"""
@@ -0,0 +1,91 @@
+"""
+Batched market-data fetch stage.
+
+Pulls the whole universe with one (or a few chunked) yf.download calls
+instead of one round trip per ticker, then splits the MultiIndex result
+into per-ticker frames. Failures are reported per ticker so one bad symbol
+never aborts the batch.
+
+yfinance is imported on first use (it costs ~0.3s on top of pandas), so
+cache-only callers such as `cli.py compute` never load it.
+"""
+import pandas as pd
+
+# Yahoo handles ~50 symbols per request comfortably; bigger batches start to time out.
+DEFAULT_CHUNK_SIZE = 50
+
+
+def _chunks(items, size):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _yahoo_errors():
+    # yfinance records per-ticker failures here instead of raising
+    import yfinance as yf
+    try:
+        return dict(yf.shared._ERRORS)
+    except AttributeError:
+        return {}
+
+
+def split_batch(raw, tickers):
+    """Split a group_by='ticker' download into {ticker: frame}.
+
+    Each frame is a column slice of the batch (copy-on-write, so no data is
+    copied until someone writes to it). Rows where a ticker did not trade
+    (other exchanges' calendars) are all-NaN; resample/dropna skips them.
+    """
+    frames, failures = {}, {}
+    if raw is None or raw.empty:
+        return frames, {t: "no data returned" for t in tickers}
+
+    if getattr(raw.index, "tz", None) is not None:
+        raw.index = raw.index.tz_localize(None)
+
+    available = set(raw.columns.get_level_values(0)) if isinstance(raw.columns, pd.MultiIndex) else set()
+    for ticker in tickers:
+        if ticker not in available:
+            failures[ticker] = "missing from batch response"
+            continue
+        df = raw[ticker]
+        if not df['Close'].notna().any():
+            failures[ticker] = "empty frame"
+            continue
+        frames[ticker] = df
+    return frames, failures
+
+
+def fetch_universe(tickers, period="1y", interval="1d", chunk_size=DEFAULT_CHUNK_SIZE, downloader=None, start=None):
+    """Download all tickers in batched calls.
+
+    Returns (frames, failures): frames maps ticker -> OHLCV DataFrame,
+    failures maps ticker -> reason string. `downloader` defaults to
+    yf.download and can be swapped for a local stand-in. When `start` is
+    given it replaces `period` (used for incremental top-ups).
+    """
+    if downloader is None:
+        import yfinance as yf
+    download = downloader or yf.download
+    tickers = list(dict.fromkeys(tickers))
+    frames, failures = {}, {}
+    window = {"start": start} if start else {"period": period}
+
+    for chunk in _chunks(tickers, chunk_size):
+        try:
+            raw = download(chunk, interval=interval, group_by='ticker',
+                           threads=True, progress=False, **window)
+        except Exception as e:
+            for t in chunk:
+                failures[t] = f"batch error: {e}"
+            continue
+
+        got, missing = split_batch(raw, chunk)
+        frames.update(got)
+        if downloader is None:
+            # Prefer Yahoo's own reason over our generic one
+            errors = _yahoo_errors()
+            missing = {t: errors.get(t, reason) for t, reason in missing.items()}
+        failures.update(missing)
+
+    return frames, failures
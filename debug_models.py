@@ -1,10 +1,14 @@
 import os
 from dotenv import load_dotenv
 from google import genai
+from model_registry import registry_for
 
 load_dotenv(override=True)
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+registry = registry_for(client)
 
-for m in genai.list_models():
-  if 'generateContent' in m.supported_generation_methods:
-    print(m.name)
\ No newline at end of file
+# Force a fresh listing, then show how each family is ranked
+for name in registry.refresh():
+    print(name)
+for family in ("flash", "lite", "pro"):
+    print(f"\n{family}: " + " > ".join(registry.ranked(family)[:5]))
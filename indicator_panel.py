@@ -0,0 +1,170 @@
+"""
+Vectorized multi-asset indicator engine.
+
+Stacks every ticker into 2-D (time x asset) NumPy arrays and computes
+RSI, the 90-day MA, ATR and the UT Bot trailing stop for all assets in
+one pass.
+
+Different trading calendars are handled by packing each asset's own bars
+to the top of a working array, computing there, then scattering results
+back onto the shared calendar. That gives exactly the per-frame semantics
+of the old calculate_indicators (each asset only sees its own bars) with
+no per-asset pandas work.
+"""
+import numpy as np
+import pandas as pd
+
+from ut_bot import ut_bot
+
+OHLC = ("Open", "High", "Low", "Close")
+
+# Strategy defaults: RSI(2), 13 weekly bars ~ 90 days, ATR(10) x 2
+RSI_PERIOD = 2
+MA_WINDOW = 13
+ATR_PERIOD = 10
+ATR_MULT = 2.0
+
+
+class Panel:
+    """Shared calendar index, ticker list and {field: 2-D array} store."""
+
+    def __init__(self, index, tickers, fields):
+        self.index = index
+        self.tickers = list(tickers)
+        self.fields = fields
+        self._col = {t: j for j, t in enumerate(self.tickers)}
+
+    def __getitem__(self, name):
+        return self.fields[name]
+
+    def __setitem__(self, name, values):
+        self.fields[name] = values
+
+    def column(self, name, ticker):
+        return self.fields[name][:, self._col[ticker]]
+
+    def frame(self, ticker, fields=None):
+        """Per-ticker DataFrame of the bars that ticker traded."""
+        j = self._col[ticker]
+        names = fields or list(self.fields)
+        data = {n: self.fields[n][:, j] for n in names}
+        rows = ~np.isnan(self.fields["Close"][:, j])
+        return pd.DataFrame({n: v[rows] for n, v in data.items()}, index=self.index[rows])
+
+
+def stack_panel(frames, columns=OHLC):
+    """Align {ticker: OHLC frame} onto one union calendar (NaN where not traded)."""
+    tickers = list(frames)
+    stamps = [frames[t].index.values for t in tickers]
+    index = pd.DatetimeIndex(np.unique(np.concatenate(stamps))) if stamps else pd.DatetimeIndex([])
+
+    fields = {c: np.full((len(index), len(tickers)), np.nan) for c in columns}
+    for j, t in enumerate(tickers):
+        pos = index.searchsorted(frames[t].index)
+        for c in columns:
+            fields[c][pos, j] = frames[t][c].to_numpy(dtype=float)
+
+    return Panel(index, tickers, fields)
+
+
+# --- packing helpers (calendar layout <-> per-asset contiguous layout) ---
+
+def _pack_plan(valid):
+    rank = np.cumsum(valid, axis=0) - 1
+    rows, cols = np.nonzero(valid)
+    return rank[rows, cols], cols, rows, int(valid.sum(axis=0).max(initial=0))
+
+
+def _pack(values, plan):
+    packed_rows, cols, rows, depth = plan
+    out = np.full((depth, values.shape[1]), np.nan)
+    out[packed_rows, cols] = values[rows, cols]
+    return out
+
+
+def _unpack(packed, plan, shape):
+    packed_rows, cols, rows, _ = plan
+    out = np.full(shape, np.nan)
+    out[rows, cols] = packed[packed_rows, cols]
+    return out
+
+
+# --- kernels on packed arrays (all assets start at row 0) ---
+
+def ewm_mean(x, alpha, min_periods=0):
+    """pandas ewm(adjust=False).mean() along axis 0."""
+    out = np.empty_like(x)
+    if len(x) == 0:
+        return out
+    out[0] = x[0]
+    for i in range(1, len(x)):
+        out[i] = (1 - alpha) * out[i - 1] + alpha * x[i]
+    if min_periods > 1:
+        out[:min_periods - 1] = np.nan
+    return out
+
+
+def rolling_mean(x, window):
+    """pandas rolling(window).mean() along axis 0 (full windows only)."""
+    out = np.full_like(x, np.nan)
+    if len(x) < window:
+        return out
+    csum = np.cumsum(np.nan_to_num(x), axis=0)
+    out[window - 1] = csum[window - 1]
+    out[window:] = csum[window:] - csum[:-window]
+    out[window - 1:] /= window
+    # A NaN anywhere in the window poisons it, like pandas
+    bad = np.cumsum(np.isnan(x), axis=0)
+    nan_in_window = bad[window - 1:] - np.vstack([np.zeros((1, x.shape[1])), bad[:-window]]) > 0
+    out[window - 1:][nan_in_window] = np.nan
+    return out
+
+
+def rsi(close, period=RSI_PERIOD):
+    delta = np.diff(close, axis=0, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = ewm_mean(gain, 1 / period, min_periods=period)
+    avg_loss = ewm_mean(loss, 1 / period, min_periods=period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def true_range(high, low, close):
+    prev_close = np.roll(close, 1, axis=0)
+    prev_close[0] = np.nan
+    return np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+
+
+def atr(high, low, close, period=ATR_PERIOD):
+    return rolling_mean(true_range(high, low, close), period)
+
+
+def compute_indicators(panel, rsi_period=RSI_PERIOD, ma_window=MA_WINDOW, atr_period=ATR_PERIOD, atr_mult=ATR_MULT):
+    """Add RSI_2, MA_90, ATR, UT_Stop, UT_Trend and UT_Signal fields in one pass."""
+    shape = panel["Close"].shape
+    valid = np.isfinite(panel["Close"])
+    for c in ("Open", "High", "Low"):
+        if c in panel.fields:
+            valid &= np.isfinite(panel[c])
+    plan = _pack_plan(valid)
+
+    o = {c: _pack(panel[c], plan) for c in ("High", "Low", "Close")}
+    packed_atr = atr(o["High"], o["Low"], o["Close"], atr_period)
+    stop, trend, flips = ut_bot(o["Close"], packed_atr, atr_mult)
+    results = {
+        "RSI_2": rsi(o["Close"], rsi_period),
+        "MA_90": rolling_mean(o["Close"], ma_window),
+        "ATR": packed_atr,
+        "UT_Stop": stop,
+        "UT_Trend": trend,
+        "UT_Signal": flips,
+    }
+    for name, packed in results.items():
+        panel[name] = _unpack(packed, plan, shape)
+    return panel
+
+
+def indicators_for_frames(frames, **params):
+    """Convenience wrapper: {ticker: weekly OHLC frame} -> computed Panel."""
+    return compute_indicators(stack_panel(frames), **params)
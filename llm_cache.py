@@ -0,0 +1,234 @@
+"""
+Local response cache for Gemini calls.
+
+Wraps a genai.Client so scripts keep calling client.models.generate_content
+and client.chats.create(...).send_message as before, but:
+  * responses are stored in SQLite, keyed by a hash of model, system
+    instruction, tools/config and the prompt (plus chat history), and
+    served from there until they expire (LLM_CACHE_TTL, default 6h);
+  * identical requests already in flight are coalesced: callers on other
+    threads wait for the first one instead of spending quota on a repeat;
+  * failures are never cached, so a 429 is retried on the next run.
+
+FakeClient answers locally (no network, no key) for offline runs and
+benchmarks; LLM_FAKE=1 makes make_client() use it.
+"""
+import hashlib
+import json
+import os
+import random
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+
+from google.genai import errors, types
+
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm.sqlite")
+TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL", str(6 * 3600)))
+
+
+def _plain(obj):
+    """JSON-able view of prompts/configs (pydantic genai types, dicts, lists, str)."""
+    if hasattr(obj, "model_dump"):
+        return obj.model_dump(mode="json", exclude_none=True)
+    if isinstance(obj, dict):
+        return {k: _plain(v) for k, v in obj.items() if v is not None}
+    if isinstance(obj, (list, tuple)):
+        return [_plain(v) for v in obj]
+    return obj
+
+
+def request_key(model, contents, config=None, history=None):
+    """Content address of a request: model + system instruction/tools/config + prompt (+ history)."""
+    payload = {"model": model, "config": _plain(config), "contents": _plain(contents), "history": _plain(history)}
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+
+class ResponseCache:
+    """SQLite store of serialized responses with TTL eviction and in-flight coalescing."""
+
+    def __init__(self, path=CACHE_PATH, ttl=TTL_SECONDS):
+        self.path = path
+        self.ttl = ttl
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY, model TEXT, created REAL, expires REAL, body TEXT)""")
+        self._lock = threading.Lock()
+        self._inflight = {}
+        self.hits = self.misses = self.coalesced = 0
+        self.evict()
+
+    def get(self, key):
+        with self._lock:
+            row = self._db.execute("SELECT body FROM responses WHERE key = ? AND expires > ?",
+                                   (key, time.time())).fetchone()
+        return None if row is None else types.GenerateContentResponse.model_validate(json.loads(row[0]))
+
+    def put(self, key, model, response, ttl=None):
+        now = time.time()
+        body = json.dumps(response.model_dump(mode="json", exclude_none=True), separators=(",", ":"))
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)",
+                             (key, model, now, now + (self.ttl if ttl is None else ttl), body))
+
+    def evict(self):
+        with self._lock:
+            return self._db.execute("DELETE FROM responses WHERE expires <= ?", (time.time(),)).rowcount
+
+    def fetch(self, key, model, call, ttl=None):
+        """Cached response for `key`, else run call() once, however many threads ask at the same time."""
+        cached = self.get(key)
+        if cached is not None:
+            self.hits += 1
+            return cached
+        with self._lock:
+            waiting = self._inflight.get(key)
+            if waiting is None:
+                self._inflight[key] = mine = Future()
+        if waiting is not None:
+            self.coalesced += 1
+            return waiting.result()
+
+        self.misses += 1
+        # The future is resolved (and the response stored) before the in-flight entry goes,
+        # so no waiter is left blocked and no later caller misses both the cache and the future
+        try:
+            try:
+                # Another caller may have finished between our cache miss and registering
+                response = self.get(key) or call()
+            except BaseException as e:
+                mine.set_exception(e)
+                raise
+            try:
+                self.put(key, model, response, ttl)
+            except Exception as e:    # e.g. "database is locked": the answer is still good, just not cached
+                print(f"⚠️ LLM cache write failed, response not cached: {e}")
+            mine.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "coalesced": self.coalesced}
+
+
+# --- client wrappers (same call shapes as genai.Client) ---
+
+class _CachedModels:
+    def __init__(self, inner, cache):
+        self._inner, self._cache = inner, cache
+
+    def generate_content(self, *, model, contents, config=None, ttl=None):
+        key = request_key(model, contents, config)
+        return self._cache.fetch(key, model, lambda: self._inner.models.generate_content(
+            model=model, contents=contents, config=config), ttl)
+
+    def cached(self, *, model, contents, config=None):
+        """Stored response or None, without calling the API (lets rate limiters skip cache hits)."""
+        return self._cache.get(request_key(model, contents, config))
+
+    def __getattr__(self, name):
+        return getattr(self._inner.models, name)   # list(), get(), ... pass straight through
+
+
+class CachedChat:
+    """Chat whose turns are cached; the real chat is only opened on a miss, seeded with the history so far."""
+
+    def __init__(self, inner, cache, model, config=None, history=None):
+        self._inner, self._cache = inner, cache
+        self.model, self.config = model, config
+        self.history = list(history or [])
+        self._chat = None
+
+    def send_message(self, message, ttl=None):
+        key = request_key(self.model, message, self.config, self.history)
+        live = []
+
+        def call():
+            if self._chat is None:
+                self._chat = self._inner.chats.create(model=self.model, config=self.config, history=list(self.history))
+            live.append(True)
+            return self._chat.send_message(message)
+
+        response = self._cache.fetch(key, self.model, call, ttl)
+        if not live:
+            self._chat = None   # served from cache: a live chat would not know this turn
+        self.history += [types.Content(role="user", parts=[types.Part(text=str(message))]),
+                         types.Content(role="model", parts=[types.Part(text=response.text or "")])]
+        return response
+
+    def get_history(self):
+        return list(self.history)
+
+
+class _CachedChats:
+    def __init__(self, inner, cache):
+        self._inner, self._cache = inner, cache
+
+    def create(self, *, model, config=None, history=None):
+        return CachedChat(self._inner, self._cache, model, config, history)
+
+
+class CachedClient:
+    def __init__(self, inner, cache=None):
+        self.inner = inner
+        self.cache = cache or ResponseCache()
+        self.models = _CachedModels(inner, self.cache)
+        self.chats = _CachedChats(inner, self.cache)
+
+
+# --- offline stand-in ---
+
+class FakeClient:
+    """Local genai.Client look-alike: canned answers, optional latency and 429s, call counter."""
+
+    def __init__(self, answer=None, latency=0.0, fail_rate=0.0, seed=0):
+        self.answer = answer or (lambda model, contents: f"[offline {model}] {str(contents).strip()[:80]}")
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.models = self
+        self.chats = self
+
+    def _respond(self, model, contents):
+        with self._lock:
+            self.calls += 1
+            throttled = self._rng.random() < self.fail_rate
+        time.sleep(self.latency)
+        if throttled:
+            raise errors.ClientError(429, {"error": {"code": 429, "message": "Resource exhausted (fake)", "status": "RESOURCE_EXHAUSTED"}})
+        part = types.Part(text=self.answer(model, contents))
+        return types.GenerateContentResponse(candidates=[types.Candidate(content=types.Content(role="model", parts=[part]))])
+
+    def generate_content(self, *, model, contents, config=None):
+        return self._respond(model, contents)
+
+    def list(self):
+        return iter([types.Model(name="models/gemini-2.0-flash")])
+
+    def create(self, *, model, config=None, history=None):
+        fake = self
+
+        class _Chat:
+            def send_message(self, message):
+                return fake._respond(model, message)
+        return _Chat()
+
+
+def make_client(api_key=None, cache=None):
+    """Cached Gemini client (or a cached FakeClient when LLM_FAKE=1).
+
+    Repeat prompts within LLM_CACHE_TTL, and duplicates already in flight,
+    cost no API calls.
+    """
+    if os.getenv("LLM_FAKE") == "1":
+        return CachedClient(FakeClient(), cache)
+    from google import genai
+    return CachedClient(genai.Client(api_key=api_key or os.getenv("GEMINI_API_KEY")), cache)
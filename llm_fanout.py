@@ -0,0 +1,101 @@
+"""
+Concurrent per-asset Gemini queries with rate limiting and backoff.
+
+Instead of one giant prompt for the whole portfolio (which fails as a
+whole, and gets trimmed to "indices only" to dodge 429s), each asset gets
+its own small query. An asyncio scheduler runs them concurrently:
+  * a token bucket keeps the request rate under the quota (LLM_RPM),
+  * a semaphore caps requests in flight (LLM_CONCURRENCY),
+  * 429 and 5xx responses are retried with full-jitter exponential backoff,
+  * one asset failing only blanks its own row.
+
+Calls go through the (cached, coalescing) client from llm_cache on worker
+threads, so a repeat run inside the cache TTL makes no API calls at all.
+"""
+import asyncio
+import os
+import random
+import time
+
+from google.genai import errors
+
+LLM_RPM = float(os.getenv("LLM_RPM", "15"))             # Gemini free-tier flash quota
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "4"))
+MAX_RETRIES = 5
+BACKOFF_BASE = 2.0      # seconds
+BACKOFF_CAP = 60.0
+
+
+class TokenBucket:
+    """`rate` tokens per second, up to `burst` saved; acquire() waits for one."""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.stamp = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.stamp) * self.rate)
+                self.stamp = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+def retryable(exc):
+    code = getattr(exc, "code", None)
+    return isinstance(exc, errors.APIError) and (code == 429 or (code or 0) >= 500)
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE, cap=BACKOFF_CAP, rng=random):
+    """Full jitter: uniform(0, min(cap, base * 2**attempt))."""
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+
+class FanOut:
+    def __init__(self, client, model, config=None, rpm=LLM_RPM, concurrency=LLM_CONCURRENCY,
+                 max_retries=MAX_RETRIES, base=BACKOFF_BASE, cap=BACKOFF_CAP):
+        self.client = client
+        self.model = model
+        self.config = config
+        self.rpm = rpm
+        self.concurrency = concurrency
+        self.max_retries = max_retries
+        self.base, self.cap = base, cap
+        self.retries = 0
+
+    async def _one(self, bucket, sem, prompt):
+        peek = getattr(self.client.models, "cached", None)
+        hit = peek and peek(model=self.model, contents=prompt, config=self.config)
+        if hit:
+            return hit.text     # cache hits cost no quota, so they skip the bucket
+        async with sem:
+            for attempt in range(self.max_retries + 1):
+                await bucket.acquire()
+                try:
+                    response = await asyncio.to_thread(self.client.models.generate_content,
+                                                       model=self.model, contents=prompt, config=self.config)
+                    return response.text
+                except Exception as e:
+                    if not retryable(e) or attempt == self.max_retries:
+                        raise
+                    self.retries += 1
+                    await asyncio.sleep(backoff_delay(attempt, self.base, self.cap))
+
+    async def run_async(self, prompts):
+        """{key: prompt} -> {key: text or Exception}, in the order given."""
+        bucket = TokenBucket(self.rpm / 60, burst=min(self.concurrency, max(1, int(self.rpm))))
+        sem = asyncio.Semaphore(self.concurrency)
+        keys = list(prompts)
+        results = await asyncio.gather(*(self._one(bucket, sem, prompts[k]) for k in keys), return_exceptions=True)
+        return dict(zip(keys, results))
+
+    def run(self, prompts):
+        return asyncio.run(self.run_async(prompts))
+
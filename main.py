@@ -1,36 +1,40 @@
 import os
 from dotenv import load_dotenv
 from google import genai
+from model_registry import registry_for
 
 load_dotenv()
 api_key = os.getenv("GEMINI_API_KEY")
 
 client = genai.Client(api_key=api_key)
+registry = registry_for(client)
 
 def start_mission():
-    print("🤖 System Check: Engaging 'gemini-flash-latest'...")
+    model = registry.best("flash")
+    print(f"🤖 System Check: Engaging '{model}'...")
     try:
-        # We use the ALIAS found in your list. 
-        # This routes to the stable, quota-enabled version automatically.
-        response = client.models.generate_content(
-            model="models/gemini-flash-latest", 
-            contents="Confirm system online in 5 words."
-        )
+        # The registry ranks the "-latest" ALIAS first: it routes to the
+        # stable, quota-enabled version automatically. 404s fall through to the next model.
+        tried = []
+        def ask(m):
+            tried.append(m)
+            return client.models.generate_content(model=m, contents="Confirm system online in 5 words.")
+        response = registry.call(ask)
         
         print(f"\nAI RESPONSE: {response.text}")
         print("🚀 DAY 1 MISSION SUCCESSFUL!")
-        print("Route: Alias (gemini-flash-latest) | Status: ONLINE\n")
+        print(f"Route: {tried[-1]} | Status: ONLINE\n")   # the model that answered, after any 404 fallback
         
     except Exception as e:
         print(f"\n❌ ERROR: {e}")
-        # If Flash fails, we try the Pro alias as a backup
-        if "429" in str(e) or "404" in str(e):
-             print("⚠️ Flash failed. Trying 'models/gemini-pro-latest'...")
+        # If Flash is out of quota, we try the Pro family as a backup
+        if "429" in str(e):
+             print(f"⚠️ Flash failed. Trying '{registry.best('pro')}'...")
              try:
-                 response = client.models.generate_content(
-                    model="models/gemini-pro-latest", 
+                 response = registry.call(lambda m: client.models.generate_content(
+                    model=m, 
                     contents="Confirm system online."
-                 )
+                 ), "pro")
                  print(f"AI RESPONSE: {response.text}")
              except Exception as e2:
                  print(f"❌ Backup failed: {e2}")
@@ -2,9 +2,11 @@ import os
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types # New import for config
+from model_registry import registry_for
 
 load_dotenv()
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+registry = registry_for(client)
 
 # THE BOSS MOVE: Defining the System Persona
 SYSTEM_PROMPT = """
@@ -22,13 +24,13 @@ def start_research_agent():
     print("🤖 Agent Persona: 'Security Analyst' Initialized...")
     try:
         # We pass the persona into the 'config' parameter
-        response = client.models.generate_content(
-            model="models/gemini-flash-latest", 
+        response = registry.call(lambda model: client.models.generate_content(
+            model=model, 
             config=types.GenerateContentConfig(
                 system_instruction=SYSTEM_PROMPT
             ),
             contents="How can a company protect its API keys in a public GitHub repo?"
-        )
+        ))
         
         print(f"\n{response.text}")
         print("\n🚀 DAY 2 MISSION SUCCESSFUL: Persona active.")
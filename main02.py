@@ -2,9 +2,11 @@ import os
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
+from model_registry import registry_for
 
 load_dotenv()
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+registry = registry_for(client)
 
 # THE BOSS MOVE: Persona + Self-Correction + Few-Shot Examples
 SYSTEM_PROMPT = """
@@ -34,14 +36,14 @@ While highly effective, 2FA can be bypassed via... (etc)
 def start_few_shot_agent():
     print("🤖 Agent: Learning from examples...")
     try:
-        response = client.models.generate_content(
-            model="models/gemini-flash-latest", 
+        response = registry.call(lambda model: client.models.generate_content(
+            model=model, 
             config=types.GenerateContentConfig(
                 system_instruction=SYSTEM_PROMPT
             ),
             # New query for the agent to analyze using your examples
             contents="Explain the risks of using outdated NPM packages."
-        )
+        ))
         print(f"\n{response.text}")
         
     except Exception as e:
@@ -2,23 +2,25 @@ import os
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
+from model_registry import registry_for
 
 load_dotenv()
 # Using the production client we established yesterday
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+registry = registry_for(client)
 
 def start_grounded_agent():
     print("🌐 Agent: Connecting to Google Search...")
     try:
         # THE BOSS MOVE: Adding the Google Search Tool
-        response = client.models.generate_content(
-            model="models/gemini-flash-latest", 
+        response = registry.call(lambda model: client.models.generate_content(
+            model=model, 
             config=types.GenerateContentConfig(
                 tools=[types.Tool(google_search=types.GoogleSearch())]
             ),
             # Ask about something that happened RECENTLY in 2026
             contents="What are the top three cyber-security breaches reported in January 2026?"
-        )
+        ))
         
         print(f"\n{response.text}")
         
@@ -1,44 +1,30 @@
+import html
 import os
 from dotenv import load_dotenv
-from google import genai
 from google.genai import types
+from llm_cache import make_client
+from llm_fanout import FanOut
+from model_registry import registry_for
 
 load_dotenv(override=True)
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+client = make_client(os.getenv("GEMINI_API_KEY"))
 
 # Mapping your Indian ETFs to TradingView-compatible symbols
-TV_SYMBOLS = {
-    "Bitcoin": "BINANCE:BTCUSDT",
-    "Gold BeES": "NSE:GOLDBEES",
-    "Silver BeES": "NSE:SILVERBEES",
-    "Nifty 50": "NSE:NIFTY",
-    "Sensex": "BSE:SENSEX",
-    "Smallcap 250": "NSE:HDFCSML250",
-    "Junior BeES": "NSE:JUNIORBEES",
-    "MON100": "NSE:MON100",
-    "MAFANG": "NSE:MAFANG",
-    "HangSeng BeES": "NSE:HNGSNGBEES",
-    "MAHKTECH": "NSE:MAHKTECH"
-}
+from universe import TV_SYMBOLS
 
 def generate_dashboard():
-    print("🧠 Step 1: Getting AI Market Sentiment (Indices Only)...")
+    print("🧠 Step 1: Getting AI Market Sentiment (per asset)...")
     
-    # We only search for the main Index to avoid hitting the 429 limit
-    query = "Quick status of Nifty 50 and Bitcoin vs their 90-day Moving Average. Are we in a 'Dead Rubber' or 'Overheated' zone?"
-
-    try:
-        response = client.models.generate_content(
-            model="gemini-2.0-flash",
-            config=types.GenerateContentConfig(
-                tools=[types.Tool(google_search=types.GoogleSearch())],
-                system_instruction="Keep it brief (3 sentences)."
-            ),
-            contents=query
-        )
-        ai_intel = response.text
-    except:
-        ai_intel = "Market Data Hub Active. View charts below for RSI(2) signals."
+    # One short query per asset, fanned out under the rate limit (llm_fanout handles 429s)
+    query = "Quick status of {name} vs its 90-day Moving Average. Is it in a 'Dead Rubber' or 'Overheated' zone?"
+    fan = FanOut(client, registry_for(client).best("flash"), types.GenerateContentConfig(
+        tools=[types.Tool(google_search=types.GoogleSearch())],
+        system_instruction="Keep it brief (1 sentence)."
+    ))
+    intel = fan.run({name: query.format(name=name) for name in TV_SYMBOLS})
+    # Model output goes into the page as text, never as markup
+    intel = {n: ("" if isinstance(t, Exception) else html.escape(t)) for n, t in intel.items()}
+    ai_intel = intel.get("Nifty 50") or "Market Data Hub Active. View charts below for RSI(2) signals."
 
     print("🎨 Step 2: Generating Strategy GUI...")
     
@@ -66,6 +52,7 @@ def generate_dashboard():
         cards += f"""
         <div class="card">
             <h3 style="margin:5px;">{name}</h3>
+            <p style="margin:5px;color:#9598a1;font-size:13px;">{intel.get(name, "")}</p>
             <div id="tv_{name.replace(' ', '')}" style="height:350px;"></div>
             <script type="text/javascript" src="https://s3.tradingview.com/tv.js"></script>
             <script type="text/javascript">
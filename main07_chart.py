@@ -4,19 +4,7 @@ from dotenv import load_dotenv
 # We don't even need the GenAI library for the GUI generation part! 
 # This saves your quota for the 'Strategy Advice' later.
 
-TV_CONFIGS = {
-    "Bitcoin": "BINANCE:BTCUSDT",
-    "Nifty 50": "NSE:NIFTY",
-    "Sensex": "BSE:SENSEX",
-    "Gold BeES": "NSE:GOLDBEES",
-    "Silver BeES": "NSE:SILVERBEES",
-    "Smallcap 250": "NSE:HDFCSML250",
-    "Junior BeES": "NSE:JUNIORBEES",
-    "MON100": "NSE:MON100",
-    "MAFANG": "NSE:MAFANG",
-    "HangSeng BeES": "NSE:HNGSNGBEES",
-    "MAHKTECH": "NSE:MAHKTECH"
-}
+from universe import TV_SYMBOLS as TV_CONFIGS
 
 def build_god_mode_gui():
     print("🎨 Building High-Performance Dashboard...")
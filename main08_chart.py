@@ -1,22 +1,12 @@
-import yfinance as yf
-import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from bar_cache import BarCache
+from timeframes import resample_frame, WEEK
+from render_pool import render_cards, report_timings, to_arrays, from_arrays
+import time
 
 # 1. ASSETS
-ASSETS = {
-    "Nifty 50": "^NSEI",
-    "Bitcoin": "BTC-USD",
-    "Gold BeES": "GOLDBEES.NS",
-    "Silver BeES": "SILVERBEES.NS",
-    "Junior BeES": "JUNIORBEES.NS",
-    "Smallcap 250": "HDFCSML250.NS",
-    "MON100": "MON100.NS",
-    "MAFANG": "MAFANG.NS",
-    "HangSeng BeES": "HNGSNGBEES.NS",
-    "MAHKTECH": "MAHKTECH.NS",
-    "Sensex": "^BSESN"
-}
+from universe import ASSETS
 
 # 2. RSI MATH
 def calculate_rsi(series, period=2):
@@ -28,34 +18,11 @@ def calculate_rsi(series, period=2):
     rs = avg_gain / avg_loss
     return 100 - (100 / (1 + rs))
 
-def create_pro_chart(name, ticker):
+def create_pro_chart(name, df):
     print(f"📊 Processing {name}...")
     try:
-        # DOWNLOAD
-        df = yf.download(ticker, period="1y", interval="1d", progress=False)
-        
-        if df.empty:
-            print(f"   ⚠️ No data for {ticker}")
-            return None
-
-        # --- CRITICAL FIX: FLATTEN COLUMNS ---
-        # If columns look like ('Close', 'BTC-USD'), we want just 'Close'
-        if isinstance(df.columns, pd.MultiIndex):
-            df.columns = df.columns.get_level_values(0)
-        
-        # --- CRITICAL FIX: NUKE TIMEZONES ---
-        # We convert everything to "Naive" time (no timezone) to stop the crash
-        if df.index.tz is not None:
-            df.index = df.index.tz_localize(None)
-
         # RESAMPLE TO WEEKLY
-        # Now that columns are flat ('Open', 'Close'), this will work:
-        df_weekly = df.resample('W-FRI').agg({
-            'Open': 'first', 
-            'High': 'max', 
-            'Low': 'min', 
-            'Close': 'last'
-        }).dropna()
+        df_weekly = resample_frame(df, WEEK)
 
         # Indicators
         df_weekly['RSI_2'] = calculate_rsi(df_weekly['Close'], period=2)
@@ -95,12 +62,26 @@ def create_pro_chart(name, ticker):
         print(f"   ❌ Error: {e}")
         return None
 
+def render_pro_chart(name, arrays):
+    return create_pro_chart(name, from_arrays(arrays))
+
 def build_dashboard():
     print("🚀 Starting Engine...")
     html_content = "<html><head><title>My Charts</title><style>body{background:#111;color:white;font-family:sans-serif;}</style></head><body><h1 style='text-align:center;color:#00e676'>RSI(2) Mean Reversion Dashboard</h1>"
     
+    frames, failures = BarCache().load(list(ASSETS.values()), period="1y", interval="1d")
+
+    jobs = []
     for name, ticker in ASSETS.items():
-        chart = create_pro_chart(name, ticker)
+        if ticker not in frames:
+            print(f"   ⚠️ No data for {ticker}: {failures.get(ticker)}")
+            continue
+        jobs.append((name, to_arrays(frames[ticker], ["Open", "High", "Low", "Close"])))
+
+    t0 = time.perf_counter()
+    charts, timings = render_cards(render_pro_chart, jobs)
+    report_timings(timings, time.perf_counter() - t0)
+    for chart in charts:
         if chart:
             html_content += f"<div style='border:1px solid #333; margin:20px; padding:10px;'>{chart}</div>"
     
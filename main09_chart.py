@@ -1,110 +1,32 @@
-print("🟢 DEBUG: Script Initialized. Importing libraries...") # DEBUG LINE
-
-import yfinance as yf
-import pandas as pd
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from bar_cache import BarCache
+from timeframes import Timeframes, resample_frame, WEEK
+from signals import signal_for_row
+from dashboard_render import PLOTLY_JS
+from render_pool import render_cards, report_timings, to_arrays, from_arrays
+from run_report import RunReport, report_path_for
+import time
 
 # 1. ASSETS CONFIGURATION
-ASSETS = {
-    "Nifty 50": "^NSEI",
-    "Bitcoin": "BTC-USD",
-    "Gold BeES": "GOLDBEES.NS",
-    "Silver BeES": "SILVERBEES.NS",
-    "Junior BeES": "JUNIORBEES.NS",
-    "Smallcap 250": "HDFCSML250.NS",
-    "MON100": "MON100.NS",
-    "MAFANG": "MAFANG.NS",
-    "HangSeng BeES": "HNGSNGBEES.NS",
-    "MAHKTECH": "MAHKTECH.NS",
-    "Sensex": "^BSESN"
-}
+from universe import ASSETS
 
 # 2. MATH ENGINE (RSI + UT BOT)
-def calculate_indicators(df):
-    # --- RSI (2) Calculation ---
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).fillna(0)
-    loss = (-delta.where(delta < 0, 0)).fillna(0)
-    avg_gain = gain.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
-    avg_loss = loss.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
-    rs = avg_gain / avg_loss
-    df['RSI_2'] = 100 - (100 / (1 + rs))
-
-    # --- 90-Day Moving Average ---
-    # We use 13 weeks to approximate 90 days (13 * 7 = 91 days)
-    df['MA_90'] = df['Close'].rolling(window=13).mean()
-
-    # --- UT BOT (ATR Trailing Stop) ---
-    # 1. True Range
-    h_l = df['High'] - df['Low']
-    h_pc = abs(df['High'] - df['Close'].shift(1))
-    l_pc = abs(df['Low'] - df['Close'].shift(1))
-    tr = pd.concat([h_l, h_pc, l_pc], axis=1).max(axis=1)
-    
-    # 2. ATR (10 Period)
-    atr = tr.rolling(10).mean()
-    
-    # 3. Trailing Stop (Sensitivity = 2)
-    # If price is below this line, UT Bot says "SELL/DOWNTREND"
-    df['UT_Stop'] = df['Close'] - (atr * 2) 
-    
-    return df
+# The math lives in indicator_panel/timeframes: RSI(2), 90-calendar-day MA and the
+# ATR(10) x 2 UT Bot trailing stop, computed for every asset in one pass.
+def weekly_bars(df):
+    # Resample to Weekly (Friday Close)
+    return resample_frame(df, WEEK)
 
 def get_strategy_signal(row):
-    rsi = row['RSI_2']
-    price = row['Close']
-    ut_stop = row['UT_Stop']
-    
     # --- YOUR STRATEGY RULES ---
-    
-    # Rule 1: Crash Buying (RSI < 10)
-    if rsi < 10:
-        return "⚡ AGGRESSIVE ADD", "#00e676" # Bright Green
-    
-    # Rule 2: Dip Buying (RSI < 20)
-    elif rsi < 20:
-        return "🟢 BUY / ACCUMULATE", "#66bb6a" # Medium Green
-        
-    # Rule 3: Profit Booking (RSI > 90)
-    elif rsi > 90:
-        return "🔴 BOOK PROFIT", "#ff1744" # Red
-        
-    # Rule 4: Trend Check (UT Bot)
-    # If Price is significantly below the ATR stop, it's a downtrend
-    # We use a simple check: is price < UT Stop?
-    elif price < ut_stop:
-         return "⚠️ UT BOT: DOWNTREND", "#ffa726" # Orange
-         
-    else:
-        return "⚪ WAIT / HOLD", "#78909c" # Grey
-
-def create_chart_card(name, ticker):
+    # Crash buying (RSI < 10), dip buying (RSI < 20), profit booking (RSI > 90)
+    # and the UT Bot trend check all live in one table: signals.SIGNAL_RULES
+    return signal_for_row(row)
+
+def create_chart_card(name, df_weekly):
     print(f"📊 Analyzing {name}...")
     try:
-        # Fetch Data (No Progress Bar to keep terminal clean)
-        df = yf.download(ticker, period="1y", interval="1d", progress=False)
-        
-        if df.empty: 
-            print(f"   ⚠️ No data for {name}")
-            return None
-        
-        # Cleanup: Flatten columns if MultiIndex (Fixes the 'Label' error)
-        if isinstance(df.columns, pd.MultiIndex): 
-            df.columns = df.columns.get_level_values(0)
-            
-        # Cleanup: Remove Timezone (Fixes the 'ZoneInfo' error)
-        if df.index.tz is not None: 
-            df.index = df.index.tz_localize(None)
-
-        # Resample to Weekly (Friday Close)
-        df_weekly = df.resample('W-FRI').agg({
-            'Open':'first', 'High':'max', 'Low':'min', 'Close':'last'
-        }).dropna()
-
-        # Add Indicators
-        df_weekly = calculate_indicators(df_weekly)
-        
         # Get Latest Signal from the very last week
         last_row = df_weekly.iloc[-1]
         signal_text, signal_color = get_strategy_signal(last_row)
@@ -157,8 +79,8 @@ def create_chart_card(name, ticker):
         )
         fig.update_xaxes(rangeslider_visible=False)
 
-        # Generate HTML fragment
-        chart_html = fig.to_html(full_html=False, include_plotlyjs='cdn')
+        # Generate HTML fragment (plotly.js is loaded once in the page head)
+        chart_html = fig.to_html(full_html=False, include_plotlyjs=False)
         
         # Create the Card HTML
         return f"""
@@ -179,6 +101,11 @@ def create_chart_card(name, ticker):
         print(f"❌ Error analyzing {name}: {e}")
         return None
 
+def render_chart_card(name, arrays):
+    return create_chart_card(name, from_arrays(arrays))
+
+CARD_FIELDS = ["Open", "High", "Low", "Close", "RSI_2", "MA_90", "UT_Stop"]
+
 def build_dashboard():
     print("🚀 Starting Dashboard Engine...")
     print("🎨 Formatting: Grid Layout + UT Bot + RSI Strategy")
@@ -187,6 +114,7 @@ def build_dashboard():
     <!DOCTYPE html>
     <html><head><title>Strategy Dashboard</title>
     <meta charset="utf-8">
+    <script src="%s"></script>
     <style>
         body { background: #131722; color: #d1d4dc; font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, sans-serif; padding: 20px; margin: 0; }
         h1 { text-align:center; color:#2962ff; margin-bottom: 30px; }
@@ -200,17 +128,43 @@ def build_dashboard():
     </head><body>
     <h1>⚡ RSI(2) + UT BOT DASHBOARD</h1>
     <div class="grid">
-    """
+    """ % PLOTLY_JS
     
-    cards_html = ""
-    for name, ticker in ASSETS.items():
-        card = create_chart_card(name, ticker)
-        if card: cards_html += card
-            
-    with open("strategy_dashboard.html", "w") as f:
-        f.write(html_start + cards_html + "</div></body></html>")
+    report = RunReport("main09_chart")
+
+    with report.writing(report_path_for("strategy_dashboard.html")):
+        # Fetch Data (cached history + one batched top-up for the new bars)
+        with report.stage("fetch"):
+            frames, failures = BarCache().load(list(ASSETS.values()), period="1y", interval="1d")
+        report.count("fetch_failures", len(failures))
+
+        # Add Indicators (all assets at once, weekly bars + true 90-day MA from the daily load)
+        with report.stage("indicators"):
+            panel = Timeframes(frames).panel(WEEK)
+
+        jobs = []
+        for name, ticker in ASSETS.items():
+            if ticker not in frames:
+                print(f"   ⚠️ No data for {name}: {failures.get(ticker)}")
+                report.asset(name, status=f"failed: {failures.get(ticker)}")
+                continue
+            jobs.append((name, to_arrays(panel.frame(ticker), CARD_FIELDS)))
+
+        # Render cards on a process pool (results come back in ASSETS order)
+        with report.stage("render", cards=len(jobs)):
+            t0 = time.perf_counter()
+            cards, timings = render_cards(render_chart_card, jobs)
+            report_timings(timings, time.perf_counter() - t0)
+        for (name, secs), c in zip(timings, cards):
+            report.asset(name, render_s=round(secs, 4), card="built" if c else "failed (see log)")
+        report.count("card_errors", sum(1 for c in cards if not c))
+        cards_html = "".join(c for c in cards if c)
+
+        with report.stage("html"):
+            with open("strategy_dashboard.html", "w") as f:
+                f.write(html_start + cards_html + "</div></body></html>")
     
-    print("\n✅ SUCCESS: Open 'strategy_dashboard.html' to see the GRID.")
+        print("\n✅ SUCCESS: Open 'strategy_dashboard.html' to see the GRID.")
 
 # --- THE START BUTTON (Crucial!) ---
 if __name__ == "__main__":
@@ -2,9 +2,11 @@ import os
 from dotenv import load_dotenv
 from google import genai
 from google.genai import types
+from model_registry import registry_for
 
 load_dotenv()
 client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+registry = registry_for(client)
 
 # STEP 1: Define the actual Python function
 def calculate_risk_score(breach_count: int, industry_multiplier: float) -> dict:
@@ -21,16 +23,18 @@ def start_agent_with_hands():
     print("🤖 Agent: Initializing with Custom Calculation Tool...")
     
     # We use a chat session because it handles the back-and-forth of tools automatically
-    chat = client.chats.create(
-        model="models/gemini-flash-latest",
-        config=types.GenerateContentConfig(tools=tools_list)
-    )
+    def ask(model):
+        chat = client.chats.create(
+            model=model,
+            config=types.GenerateContentConfig(tools=tools_list)
+        )
+        # The 'google-genai' SDK handles the function calling loop for you!
+        return chat.send_message(prompt)
 
     #prompt = "I'm a Fintech company with 3 recent breaches. What is my risk score?"
     prompt = "I'm a Fintech company with 3 breaches. Use a multiplier of 2.5. What is my score?"
     
-    # The 'google-genai' SDK handles the function calling loop for you!
-    response = chat.send_message(prompt)
+    response = registry.call(ask)
     
     print(f"\nAI RESPONSE: {response.text}")
     print("\n🚀 DAY 5 MISSION SUCCESSFUL: Tool executed.")
@@ -1,17 +1,19 @@
 import os
 from dotenv import load_dotenv
-from google import genai
 from google.genai import types
+from llm_cache import make_client
+from model_registry import registry_for
 
 load_dotenv()
-client = genai.Client(api_key=os.getenv("GEMINI_API_KEY"))
+client = make_client(os.getenv("GEMINI_API_KEY"))
 
 def start_search_agent():
     print("🤖 Agent: Connecting to Google Search Network...")
     
     # We enable Google Search. This is the ultimate "Unblockable" tool.
-    chat = client.chats.create(
-        model="models/gemini-flash-latest",
+    registry = registry_for(client)
+    new_chat = lambda model: client.chats.create(
+        model=model,
         config=types.GenerateContentConfig(
             tools=[types.Tool(google_search=types.GoogleSearch())],
             system_instruction="""
@@ -40,7 +42,7 @@ def start_search_agent():
     """
     
     print("📊 Searching live data (this may take 10-15 seconds)...")
-    response = chat.send_message(query)
+    response = registry.call(lambda model: new_chat(model).send_message(query))
     
     print(f"\n{response.text}")
     
@@ -1,104 +1,174 @@
-import yfinance as yf
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import sys
+import json
+import os
+from bar_cache import BarCache
+from signals import signal_for_row, latest_signals
+from timeframes import Timeframes, resample_frame, DAY, WEEK, MONTH
+from dashboard_render import card_payload, render_dashboard
+from render_cache import RenderCache, fingerprint
+from market_calendar import Scheduler, group_tickers, refreshed_groups
+from portfolio import USDINR
+from render_pool import render_cards, report_timings, to_arrays, from_arrays
+from run_report import RunReport, report_path_for
+from signal_store import SignalStore
+from bar_store import BarStore
+from signals_api import publish as publish_api, API_PATH
+from alerts import check as check_alerts
+import time
+from datetime import datetime, timezone
 
 # 1. ASSETS
-ASSETS = {
-    "Nifty 50": "^NSEI",
-    "Bitcoin": "BTC-USD",
-    "Gold BeES": "GOLDBEES.NS",
-    "Silver BeES": "SILVERBEES.NS",
-    "Junior BeES": "JUNIORBEES.NS",
-    "Smallcap 250": "HDFCSML250.NS",
-    "MON100": "MON100.NS",
-    "MAFANG": "MAFANG.NS",
-    "HangSeng BeES": "HNGSNGBEES.NS",
-    "MAHKTECH": "MAHKTECH.NS",
-    "Sensex": "^BSESN"
-}
+from universe import ASSETS
 
 # 2. INDICATORS
-def calculate_indicators(df):
-    # RSI (2)
-    delta = df['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).fillna(0)
-    loss = (-delta.where(delta < 0, 0)).fillna(0)
-    avg_gain = gain.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
-    avg_loss = loss.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
-    rs = avg_gain / avg_loss
-    df['RSI_2'] = 100 - (100 / (1 + rs))
-
-    # 90-Day MA (approx 13 weeks)
-    df['MA_90'] = df['Close'].rolling(window=13).mean()
-
-    # UT Bot (ATR Trailing Stop)
-    h_l = df['High'] - df['Low']
-    h_pc = abs(df['High'] - df['Close'].shift(1))
-    l_pc = abs(df['Low'] - df['Close'].shift(1))
-    tr = pd.concat([h_l, h_pc, l_pc], axis=1).max(axis=1)
-    atr = tr.rolling(10).mean()
-    df['UT_Stop'] = df['Close'] - (atr * 2) 
-    
-    return df
+def weekly_bars(df):
+    return resample_frame(df, WEEK)
 
 def get_signal(row):
-    rsi = row['RSI_2']
-    price = row['Close']
-    ut_stop = row['UT_Stop']
-    
-    if rsi < 10: return "⚡ AGGRESSIVE ADD", "#00e676"
-    elif rsi < 20: return "🟢 BUY / ACCUMULATE", "#66bb6a"
-    elif rsi > 90: return "🔴 BOOK PROFIT", "#ff1744"
-    elif price < ut_stop: return "⚠️ DOWNTREND", "#ffa726"
-    else: return "⚪ WAIT / HOLD", "#78909c"
+    # Rules and RSI thresholds live in signals.SIGNAL_RULES
+    return signal_for_row(row)
 
-def create_card(name, ticker):
+def create_card(name, df_weekly):
+    # Chart data only; the figure itself is built in the browser from a shared template
     try:
-        df = yf.download(ticker, period="1y", interval="1d", progress=False)
-        if df.empty: return None
-        if isinstance(df.columns, pd.MultiIndex): df.columns = df.columns.get_level_values(0)
-        if df.index.tz is not None: df.index = df.index.tz_localize(None)
-
-        df_weekly = df.resample('W-FRI').agg({'Open':'first', 'High':'max', 'Low':'min', 'Close':'last'}).dropna()
-        df_weekly = calculate_indicators(df_weekly)
         last_row = df_weekly.iloc[-1]
         sig_text, sig_color = get_signal(last_row)
+        return card_payload(name, df_weekly, sig_text, sig_color)
+    except (IndexError, KeyError, ValueError, TypeError) as e:
+        # Runs in a render worker: log and skip this card, the caller counts it as a card error
+        print(f"❌ Error building card for {name}: {type(e).__name__}: {e}")
+        return None
 
-        fig = make_subplots(rows=2, cols=1, shared_xaxes=True, vertical_spacing=0.03, row_heights=[0.75, 0.25])
-        fig.add_trace(go.Candlestick(x=df_weekly.index, open=df_weekly['Open'], high=df_weekly['High'], low=df_weekly['Low'], close=df_weekly['Close'], name="Price"), row=1, col=1)
-        fig.add_trace(go.Scatter(x=df_weekly.index, y=df_weekly['MA_90'], line=dict(color='#ffea00', width=2), name="90MA"), row=1, col=1)
-        fig.add_trace(go.Scatter(x=df_weekly.index, y=df_weekly['UT_Stop'], line=dict(color='#2979ff', dash='dot'), name="UT Bot"), row=1, col=1)
-        fig.add_trace(go.Scatter(x=df_weekly.index, y=df_weekly['RSI_2'], line=dict(color='#ab47bc', width=2), name="RSI"), row=2, col=1)
-        fig.add_hrect(y0=0, y1=20, fillcolor="green", opacity=0.1, line_width=0, row=2, col=1)
-        fig.add_hrect(y0=90, y1=100, fillcolor="red", opacity=0.1, line_width=0, row=2, col=1)
-        fig.update_layout(template="plotly_dark", margin=dict(l=0, r=0, t=0, b=0), height=400, showlegend=False, paper_bgcolor="#1e222d", plot_bgcolor="#1e222d")
-        fig.update_xaxes(rangeslider_visible=False)
-        
-        return f"""
-        <div class="card" style="border-top: 4px solid {sig_color};">
-            <div class="header"><h3>{name}</h3><span class="badge" style="background:{sig_color}20; color:{sig_color}">{sig_text}</span></div>
-            <div class="stats"><span>RSI(2): <strong style="color:#fff">{last_row['RSI_2']:.1f}</strong></span><span>Price: <strong style="color:#fff">{last_row['Close']:.1f}</strong></span></div>
-            {fig.to_html(full_html=False, include_plotlyjs='cdn')}
-        </div>"""
-    except: return None
+def card_from_arrays(name, arrays):
+    return create_card(name, from_arrays(arrays))
 
-if __name__ == "__main__":
+CARD_FIELDS = ["Open", "High", "Low", "Close", "MA_90", "UT_Stop", "RSI_2", "Signal"]
+
+def refresh_bars(report, force=None):
+    """Fetch the due market groups, read the rest from cache -> (frames, failures), or None if nothing is due."""
+    # Only refetch groups whose market has traded since their last refresh (FORCE_REFRESH=1 overrides)
+    # USDINR rides along so portfolio.py can value BTC in INR from the cache
+    force = os.getenv("FORCE_REFRESH") == "1" if force is None else force
+    groups = group_tickers(list(ASSETS.values()) + [USDINR])
+    sched = Scheduler()
+    due = list(groups) if force else sched.due_groups(groups)
+    if not due:
+        for g in groups:
+            print(f"💤 {g}: up to date, next refresh due {sched.next_refresh_due(g):%a %Y-%m-%d %H:%M %Z}")
+        report.status = "markets closed"
+        return None
+
+    with report.stage("fetch", groups=due):
+        started = datetime.now(timezone.utc)
+        bars = BarCache()
+        fetch = [t for g in due for t in groups[g]]
+        frames, failures = bars.load(fetch, period="1y", interval="1d")
+        sched.mark_refreshed(refreshed_groups(groups, due, frames, bars.topup_failures), now=started)
+    with report.stage("cache_read"):
+        idle = [t for g in groups if g not in due for t in groups[g]]
+        if idle:
+            cached, missing = bars.cached(idle, period="1y", interval="1d")
+            frames.update(cached)
+            failures.update(missing)
+    print(f"🕒 Refreshed {', '.join(due)}; served {len(idle)} tickers from cache.")
+    for t, reason in failures.items():
+        print(f"⚠️ {t}: {reason}")
+        report.asset(t, status=f"failed: {reason}")
+    for t in fetch:
+        if t in frames:
+            report.asset(t, status=f"cached, top-up failed: {bars.topup_failures[t]}" if t in bars.topup_failures else "fetched", bars=len(frames[t]))
+    for t in idle:
+        if t in frames:
+            report.asset(t, status="cache", bars=len(frames[t]))
+    report.count("fetch_failures", len(failures))
+    report.count("empty_frames", sum(1 for r in failures.values() if r == "empty frame"))
+    report.count("topup_fallbacks", len(bars.topup_failures))
+    # float32 memory-mapped snapshot for cache-only readers (cli.py compute --store)
+    with report.stage("bar_store"):
+        BarStore().write("dashboard", frames)
+    return frames, failures
+
+def build_page(frames, report, page="index.html"):
+    """Recompute changed assets and write the page; False when nothing changed."""
+    # Only assets whose input bars changed since the last run get recomputed
+    with report.stage("change_detection"):
+        cache = RenderCache()
+        fps = {t: fingerprint(frames[t], extra=n) for n, t in ASSETS.items() if t in frames}
+        order = [t for t in ASSETS.values() if t in fps]
+        stale = [t for t in order if cache.changed(t, fps[t])]
+    if not os.path.exists(API_PATH):
+        stale = order    # no API snapshot yet: compute every asset once
+    if not stale and cache.page_unchanged(order, page):
+        print(f"💤 No new bars since the last run: {page} left untouched.")
+        report.status = "unchanged"
+        return False
+
+    # One daily load -> weekly chart + daily/weekly/monthly signals side by side
+    with report.stage("indicators", assets=len(stale)):
+        tf = Timeframes({t: frames[t] for t in stale})
+        panel = tf.panel(WEEK)
+    with report.stage("signals"):
+        side = {label: latest_signals(tf.panel(rule)) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))} if stale else {}
+    names = {t: n for n, t in ASSETS.items()}
+    panels = {label: tf.panel(rule) for label, rule in (("D", DAY), ("W", WEEK), ("M", MONTH))} if stale else {}
+    # Every bar's indicators + signal flips go to the history store (upserts, so reruns are idempotent)
+    with report.stage("history") as rec:
+        if stale:
+            rec["snapshots"], rec["transitions"] = SignalStore().record_panels(panels)
+    # Signal changes since the last run go to the alert sinks (ALERT_SINKS, default alerts.ndjson)
+    with report.stage("alerts") as rec:
+        if stale:
+            rec["alerts"] = len(check_alerts(panels, names))
+            report.count("alerts", rec["alerts"])
+    # Same arrays -> static JSON/NDJSON (+ .gz/.br) for clients that should not scrape the page
+    with report.stage("api") as rec:
+        if stale:
+            sizes = publish_api(panels, names, order)
+            rec["files"] = len(sizes)
+            report.count("api_kb", round(sizes[API_PATH] / 1024, 1))
+    with report.stage("render", cards=len(stale)):
+        t0 = time.perf_counter()
+        built, timings = render_cards(card_from_arrays, [(names[t], to_arrays(panel.frame(t), CARD_FIELDS)) for t in stale])
+        report_timings(timings, time.perf_counter() - t0)
+    fresh = dict(zip(stale, built))
+    for (t, c), (_, secs) in zip(fresh.items(), timings):
+        report.asset(t, render_s=round(secs, 4))
+        if not c:
+            report.count("card_errors")
+            report.asset(t, card="failed (see log)")
+            continue
+        c["tf"] = [[label, *sig[t]] for label, sig in side.items()]
+        cache.put(t, fps[t], c)
+        report.asset(t, card="built", payload_kb=round(len(json.dumps(c)) / 1024, 1))
+
+    cards = []
+    for t in order:
+        c = fresh[t] if t in fresh else cache.card(t)
+        if t not in fresh:
+            report.asset(t, card="reused")
+        if c: cards.append(c)
+    print(f"♻️ Rebuilt {len(stale)} cards, reused {len(order) - len(stale)}.")
+    report.count("cards_built", sum(1 for c in built if c))
+    report.count("cards_reused", len(order) - len(stale))
+
+    with report.stage("html"):
+        html = render_dashboard(cards)
+
+        # OUTPUTS TO index.html (Standard Webpage Name)
+        with open(page, "w") as f:
+            f.write(html)
+        cache.save(order)
+    report.count("page_kb", round(len(html.encode()) / 1024))
+    return True
+
+def update_dashboard(force=None, page="index.html"):
     print("🚀 Updating Dashboard...")
-    cards = ""
-    for n, t in ASSETS.items():
-        c = create_card(n, t)
-        if c: cards += c
-    
-    html = f"""
-    <!DOCTYPE html><html><head><title>Strategy Dashboard</title><meta charset="utf-8">
-    <style>body{{background:#131722;color:#d1d4dc;font-family:sans-serif;padding:20px;}} .grid{{display:grid;grid-template-columns:repeat(auto-fit,minmax(400px,1fr));gap:20px;}} .card{{background:#1e222d;padding:15px;border-radius:8px;}} .header{{display:flex;justify-content:space-between;margin-bottom:10px;}} .badge{{padding:4px 8px;border-radius:4px;font-weight:bold;}} .stats{{color:#888;margin-bottom:10px;display:flex;gap:15px;}}</style>
-    </head><body><h1 style="text-align:center;color:#2962ff">⚡ RSI(2) + UT BOT DASHBOARD</h1><div class="grid">{cards}</div>
-    <p style="text-align:center;color:#555;margin-top:20px">Auto-updated by GitHub Actions</p></body></html>
-    """
-    
-    # OUTPUTS TO index.html (Standard Webpage Name)
-    with open("index.html", "w") as f:
-        f.write(html)
-    print("✅ Done: index.html updated.")
\ No newline at end of file
+    # Timings, memory and counters go to run_report.json next to index.html (RUN_PROFILE=cpu,memory for more)
+    report = RunReport("main_production")
+    with report.writing(report_path_for(page)):    # failed runs get their report too
+        loaded = refresh_bars(report, force)
+        if loaded and build_page(loaded[0], report, page):
+            print(f"✅ Done: {page} updated.")
+    return report
+
+if __name__ == "__main__":
+    update_dashboard()
@@ -0,0 +1,198 @@
+"""
+Exchange-calendar aware refresh scheduler.
+
+Tickers are grouped by venue (NSE / BSE / crypto / FX). A group is due for
+a refresh when its market has traded since the group's last refresh:
+  * while the session is open, every REFRESH_INTERVAL;
+  * after the close, once more to capture the settled final bar;
+  * never on weekends or exchange holidays (market_holidays.json).
+Crypto is always open, so it refreshes every interval.
+
+`next_refresh_due` tells a cron/loop exactly when to wake up next.
+"""
+import json
+import os
+import time
+from datetime import datetime, timedelta, time as dtime, timezone
+from zoneinfo import ZoneInfo
+
+HOLIDAYS_FILE = os.getenv("MARKET_HOLIDAYS", os.path.join(os.path.dirname(os.path.abspath(__file__)), "market_holidays.json"))
+STATE_FILE = os.getenv("SCHEDULE_STATE", ".cache/schedule.json")
+REFRESH_INTERVAL = timedelta(hours=1)
+SETTLE = timedelta(minutes=20)   # Yahoo's final daily bar lands a little after the close
+SLACK = timedelta(minutes=10)    # cron runs drift; a run a little short of the interval still counts as due
+
+
+class Venue:
+    def __init__(self, name, tz, open_at, close_at, weekdays=range(5), calendar=None, always_open=False):
+        self.name = name
+        self.tz = ZoneInfo(tz)
+        self.open_at = open_at
+        self.close_at = close_at
+        self.weekdays = set(weekdays)
+        self.calendar = calendar
+        self.always_open = always_open
+        self.holidays = set()
+
+    def is_session_day(self, day):
+        return day.weekday() in self.weekdays and day.isoformat() not in self.holidays
+
+    def _session(self, day):
+        return (datetime.combine(day, self.open_at, self.tz), datetime.combine(day, self.close_at, self.tz))
+
+    def is_open(self, now):
+        if self.always_open:
+            return True
+        local = now.astimezone(self.tz)
+        if not self.is_session_day(local.date()):
+            return False
+        start, end = self._session(local.date())
+        return start <= local < end
+
+    def session_end(self, now):
+        """Close of the session in progress at `now`."""
+        return self._session(now.astimezone(self.tz).date())[1]
+
+    def last_close(self, now):
+        """Most recent session close at or before `now` (None for 24/7 venues)."""
+        if self.always_open:
+            return None
+        day = now.astimezone(self.tz).date()
+        for _ in range(30):
+            if self.is_session_day(day):
+                _, end = self._session(day)
+                if end <= now:
+                    return end
+            day -= timedelta(days=1)
+        return None
+
+    def next_open(self, now):
+        if self.always_open:
+            return now
+        day = now.astimezone(self.tz).date()
+        for _ in range(30):
+            if self.is_session_day(day):
+                start, _ = self._session(day)
+                if start > now:
+                    return start
+            day += timedelta(days=1)
+        return now + timedelta(days=1)
+
+
+VENUES = {
+    "NSE": Venue("NSE", "Asia/Kolkata", dtime(9, 15), dtime(15, 30), calendar="INDIA"),
+    "BSE": Venue("BSE", "Asia/Kolkata", dtime(9, 15), dtime(15, 30), calendar="INDIA"),
+    "CRYPTO": Venue("CRYPTO", "UTC", dtime(0, 0), dtime(0, 0), weekdays=range(7), always_open=True),
+    # Spot FX, approximated as Mon-Fri until the 17:00 New York roll
+    "FX": Venue("FX", "America/New_York", dtime(0, 0), dtime(17, 0), calendar="FX"),
+}
+
+
+def load_holidays(path=HOLIDAYS_FILE, venues=VENUES):
+    try:
+        with open(path, encoding="utf-8") as f:
+            table = json.load(f)
+    except OSError:
+        table = {}
+    for v in venues.values():
+        v.holidays = set(table.get(v.calendar, [])) if v.calendar else set()
+    return venues
+
+
+def venue_for(ticker):
+    if ticker.endswith(".NS") or ticker == "^NSEI" or ticker.startswith("^CNX"):
+        return "NSE"
+    if ticker.endswith(".BO") or ticker == "^BSESN":
+        return "BSE"
+    if ticker.endswith("-USD") or ticker.endswith("-INR"):
+        return "CRYPTO"
+    if ticker.endswith("=X"):
+        return "FX"
+    return "NSE"  # the universe is Indian-listed unless told otherwise
+
+
+def group_tickers(tickers):
+    groups = {}
+    for t in tickers:
+        groups.setdefault(venue_for(t), []).append(t)
+    return groups
+
+
+def refreshed_groups(groups, due, frames, topup_failures=()):
+    """Due groups where at least one ticker got fresh bars; an outage does not use up the refresh."""
+    return [g for g in due if any(t in frames and t not in topup_failures for t in groups[g])]
+
+
+class Scheduler:
+    def __init__(self, state_path=STATE_FILE, holidays_path=HOLIDAYS_FILE, interval=REFRESH_INTERVAL, slack=None):
+        self.state_path = state_path
+        self.interval = interval
+        self.slack = min(SLACK, interval / 6) if slack is None else slack
+        self.venues = load_holidays(holidays_path)
+        try:
+            with open(state_path, encoding="utf-8") as f:
+                self.last = {k: datetime.fromisoformat(v) for k, v in json.load(f).items()}
+        except (OSError, ValueError):
+            self.last = {}
+
+    def _now(self, now):
+        return now or datetime.now(timezone.utc)
+
+    def is_due(self, group, now=None):
+        now = self._now(now)
+        last = self.last.get(group)
+        if last is None:
+            return True
+        venue = self.venues[group]
+        if venue.is_open(now):
+            return now - last >= self.interval - self.slack
+        close = venue.last_close(now)
+        # Closed: one more refresh once the final bar has settled, then nothing until the next open
+        return close is not None and last < close + SETTLE <= now
+
+    def next_refresh_due(self, group, now=None):
+        now = self._now(now)
+        last = self.last.get(group)
+        if last is None or self.is_due(group, now):
+            return now
+        venue = self.venues[group]
+        if venue.is_open(now):
+            due = last + self.interval - self.slack
+            return due if venue.always_open else min(due, venue.session_end(now) + SETTLE)
+        close = venue.last_close(now)
+        if close is not None and last < close + SETTLE:
+            return close + SETTLE
+        return venue.next_open(now)
+
+    def due_groups(self, groups, now=None):
+        return [g for g in groups if self.is_due(g, now)]
+
+    def seconds_until_next(self, groups, now=None):
+        now = self._now(now)
+        return max(0.0, min((self.next_refresh_due(g, now) - now).total_seconds() for g in groups))
+
+    def wait_for_next(self, groups):
+        """Sleep until the earliest group is due, then return the due groups."""
+        time.sleep(self.seconds_until_next(groups))
+        return self.due_groups(groups)
+
+    def mark_refreshed(self, groups, now=None):
+        """Stamp `groups` as refreshed at `now`; pass the run's start time, not the time the fetch finished."""
+        now = self._now(now)
+        for g in groups:
+            self.last[g] = now
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump({k: v.isoformat() for k, v in self.last.items()}, f, indent=1)
+
+
+if __name__ == "__main__":
+    from universe import ASSETS
+
+    sched = Scheduler()
+    now = datetime.now(timezone.utc)
+    for group, tickers in group_tickers(ASSETS.values()).items():
+        venue = sched.venues[group]
+        state = "OPEN" if venue.is_open(now) else "closed"
+        due = sched.next_refresh_due(group, now).astimezone(venue.tz)
+        print(f"{group:7s} {state:6s} {len(tickers):2d} tickers  next refresh due {due:%a %Y-%m-%d %H:%M %Z}")
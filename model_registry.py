@@ -0,0 +1,143 @@
+"""
+Gemini model discovery with an on-disk cache.
+
+`client.models.list()` is a network round trip before any real work; the
+registry does it at most once per LISTING_TTL and keeps the names in
+.cache/models.json. Picking a model is a deterministic ranking (not
+"first name containing flash"):
+  1. must match the family ("flash", "pro") and none of its exclusions,
+  2. "-latest" aliases first (Google keeps them on the current stable),
+  3. then stable before preview/experimental,
+  4. then the highest version number, then the name.
+LLM_MODEL pins a model outright.
+
+When a call answers 404 (model retired), `call()` drops that model,
+refreshes the listing on a background thread and retries with the next
+candidate, so the script does not stall on a re-list.
+"""
+import json
+import os
+import re
+import threading
+import time
+
+from google.genai import errors
+
+REGISTRY_PATH = os.getenv("MODEL_REGISTRY_PATH", ".cache/models.json")
+LISTING_TTL = 24 * 3600
+FAMILIES = {
+    "flash": {"include": "flash", "exclude": ("lite", "8b", "tts", "image", "audio", "live", "thinking", "legacy")},
+    "lite": {"include": "flash-lite", "exclude": ("tts", "image", "audio", "live")},
+    "pro": {"include": "pro", "exclude": ("tts", "image", "audio", "vision", "legacy")},
+}
+DEFAULTS = {"flash": "models/gemini-flash-latest", "lite": "models/gemini-flash-lite-latest", "pro": "models/gemini-pro-latest"}
+
+_VERSION = re.compile(r"gemini-(\d+(?:\.\d+)?)")
+
+
+def rank_key(name):
+    """Sort key, best first: alias, stable, newer version, then name (for determinism)."""
+    m = _VERSION.search(name)
+    version = float(m.group(1)) if m else 0.0
+    unstable = any(tag in name for tag in ("preview", "exp"))
+    return (not name.endswith("-latest"), unstable, -version, name)
+
+
+def rank(names, family="flash", families=FAMILIES):
+    rule = families[family]
+    keep = [n for n in names if rule["include"] in n and not any(x in n for x in rule["exclude"])]
+    return sorted(keep, key=rank_key)
+
+
+class ModelRegistry:
+    def __init__(self, client, path=REGISTRY_PATH, ttl=LISTING_TTL):
+        self.client = client
+        self.path = path
+        self.ttl = ttl
+        self.missing = set()
+        self._names = None
+        self._lock = threading.Lock()
+        self._refreshing = None
+
+    # --- listing ---
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return data["models"] if time.time() - data.get("fetched", 0) < self.ttl else None
+
+    def _write(self, names):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump({"fetched": time.time(), "models": names}, f, indent=1)
+        os.replace(tmp, self.path)
+
+    def refresh(self):
+        """Re-list models now; keeps the old listing if the call fails."""
+        try:
+            names = sorted(m.name for m in self.client.models.list()
+                           if "generateContent" in (getattr(m, "supported_actions", None) or ["generateContent"]))
+        except Exception as e:
+            print(f"⚠️ Model listing failed ({e}); keeping cached names")
+            self._names = self._names or []   # fall back to DEFAULTS, don't re-list on every call
+            return self._names
+        self._write(names)
+        with self._lock:
+            self._names = names   # models that 404'd stay skipped for this process
+        return names
+
+    def refresh_in_background(self):
+        with self._lock:
+            if self._refreshing and self._refreshing.is_alive():
+                return self._refreshing
+            self._refreshing = threading.Thread(target=self.refresh, daemon=True)
+            self._refreshing.start()
+            return self._refreshing
+
+    def names(self):
+        if self._names is None:
+            self._names = self._read()
+        if self._names is None:
+            self.refresh()
+        return self._names or []
+
+    # --- choosing ---
+    def ranked(self, family="flash"):
+        pinned = os.getenv("LLM_MODEL")
+        found = [n for n in rank(self.names(), family) if n not in self.missing]
+        candidates = ([pinned] if pinned else []) + found + [DEFAULTS[family]]
+        return list(dict.fromkeys(c for c in candidates if c not in self.missing)) or [DEFAULTS[family]]
+
+    def best(self, family="flash"):
+        return self.ranked(family)[0]
+
+    def mark_missing(self, model):
+        self.missing.add(model)
+        self.refresh_in_background()
+
+    def call(self, fn, family="flash"):
+        """fn(model) with the best model; on 404 drop it, refresh in the background, try the next."""
+        last = None
+        for model in self.ranked(family):
+            try:
+                return fn(model)
+            except errors.APIError as e:
+                if e.code != 404:
+                    raise
+                print(f"⚠️ {model} not found; refreshing model list in the background")
+                self.mark_missing(model)
+                last = e
+        raise last
+
+
+_REGISTRIES = {}
+
+
+def registry_for(client):
+    """One registry per client for the life of the process."""
+    if id(client) not in _REGISTRIES:
+        _REGISTRIES[id(client)] = ModelRegistry(client)
+    return _REGISTRIES[id(client)]
@@ -0,0 +1,169 @@
+"""
+Parallel parameter sweep for the RSI(2) + UT Bot strategy.
+
+Evaluates grid or random combinations of RSI period, RSI thresholds, ATR
+length and ATR multiplier across all assets on a ProcessPoolExecutor.
+
+The OHLC panel is written once to a memory-mapped file; workers map it
+read-only, so prices are shared through the page cache instead of being
+pickled to every process. Tasks are grouped by indicator parameters:
+each task computes indicators once and then scores every threshold set
+against them, which is where most combinations differ.
+
+Note: the 13-week MA is not part of the signal rules, so it does not
+change backtest results and is not swept. The ATR length and multiplier
+only move UT_Stop, which only matters through the DOWNTREND rule, so the
+sweep backtests with exit_on_downtrend=True (recorded in every row);
+without that exit, every ATR setting would score the same.
+"""
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from backtest import run_backtest, BARS_PER_YEAR
+from indicator_panel import Panel, stack_panel, compute_indicators, OHLC
+from signals import with_thresholds, classify
+
+PARAM_GRID = {
+    "rsi_period": [2, 3, 4],
+    "atr_period": [7, 10, 14, 21],
+    "atr_mult": [1.5, 2.0, 2.5, 3.0],
+    "aggressive": [5, 10, 15],
+    "buy": [15, 20, 25, 30],
+    "profit": [80, 85, 90, 95],
+}
+INDICATOR_KEYS = ("rsi_period", "atr_period", "atr_mult")
+THRESHOLD_KEYS = ("aggressive", "buy", "profit")
+THRESHOLDS_PER_TASK = 8   # small enough to keep 32 workers busy on the default grid
+
+SIZING = {"exit_on_downtrend": True}   # see the module docstring
+
+# Worker-side state, filled by _init_worker
+_PANEL = None
+_BARS_PER_YEAR = BARS_PER_YEAR
+_SIZING = SIZING
+
+
+# 1. SHARED PRICE ARRAYS
+def share_panel(panel, directory=None):
+    """Write OHLC to one memory-mapped file; returns the spec workers need."""
+    fd, path = tempfile.mkstemp(suffix=".ohlc", dir=directory)
+    os.close(fd)
+    shape = (len(OHLC),) + panel["Close"].shape
+    mm = np.memmap(path, dtype=np.float64, mode="w+", shape=shape)
+    for i, c in enumerate(OHLC):
+        mm[i] = panel[c]
+    mm.flush()
+    del mm
+    return {"path": path, "shape": shape, "index": panel.index.asi8, "tickers": panel.tickers}
+
+
+def attach_panel(spec):
+    mm = np.memmap(spec["path"], dtype=np.float64, mode="r", shape=spec["shape"])
+    return Panel(pd.DatetimeIndex(spec["index"]), spec["tickers"], {c: mm[i] for i, c in enumerate(OHLC)})
+
+
+def _init_worker(spec, bars_per_year, sizing):
+    global _PANEL, _BARS_PER_YEAR, _SIZING
+    _PANEL = attach_panel(spec)
+    _BARS_PER_YEAR = bars_per_year
+    _SIZING = sizing
+
+
+# 2. EVALUATION
+def _summarize(stats):
+    return {
+        "mean_cagr": float(np.nanmean(stats["CAGR"])),
+        "median_cagr": float(np.nanmedian(stats["CAGR"])),
+        "mean_max_dd": float(np.nanmean(stats["Max Drawdown"])),
+        "mean_hit_rate": float(np.nanmean(stats["Hit Rate"])),
+        "mean_exposure": float(np.nanmean(stats["Exposure"])),
+        "trades": int(stats["Trades"].sum()),
+    }
+
+
+def evaluate_group(task):
+    """One indicator setting x many threshold sets -> list of result rows."""
+    ind_params, threshold_sets = task
+    base = _PANEL
+    panel = Panel(base.index, base.tickers, dict(base.fields))
+    compute_indicators(panel, **ind_params)
+
+    rows = []
+    for th in threshold_sets:
+        rules = with_thresholds(**th)
+        panel["Signal"] = classify(panel.fields, rules)
+        stats, _ = run_backtest(panel, rules, bars_per_year=_BARS_PER_YEAR, **_SIZING)
+        rows.append({**ind_params, **th, **_SIZING, **_summarize(stats)})
+    return rows
+
+
+# 3. SEARCH SPACE
+def _valid(combo):
+    return combo["aggressive"] < combo["buy"] < combo["profit"]
+
+
+def grid_combos(grid=PARAM_GRID):
+    keys = list(grid)
+    for values in itertools.product(*(grid[k] for k in keys)):
+        combo = dict(zip(keys, values))
+        if _valid(combo):
+            yield combo
+
+
+def random_combos(n, grid=PARAM_GRID, seed=0):
+    all_combos = list(grid_combos(grid))
+    return random.Random(seed).sample(all_combos, min(n, len(all_combos)))
+
+
+def group_tasks(combos, per_task=THRESHOLDS_PER_TASK):
+    groups = {}
+    for c in combos:
+        ind = tuple(c[k] for k in INDICATOR_KEYS)
+        groups.setdefault(ind, []).append({k: c[k] for k in THRESHOLD_KEYS})
+    return [(dict(zip(INDICATOR_KEYS, ind)), ths[i:i + per_task])
+            for ind, ths in groups.items() for i in range(0, len(ths), per_task)]
+
+
+def sweep(panel, combos, workers=None, bars_per_year=BARS_PER_YEAR, sort_by="mean_cagr", sizing=SIZING):
+    """Run all combos; returns a DataFrame sorted best-first by `sort_by`."""
+    tasks = group_tasks(combos)
+    spec = share_panel(panel)
+    try:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(spec, bars_per_year, sizing)) as pool:
+            rows = [r for group in pool.map(evaluate_group, tasks) for r in group]
+    finally:
+        os.remove(spec["path"])
+    return pd.DataFrame(rows).sort_values(sort_by, ascending=False, ignore_index=True)
+
+
+if __name__ == "__main__":
+    from bar_cache import BarCache
+    from universe import ASSETS
+    from timeframes import resample_panel, WEEK
+
+    ap = argparse.ArgumentParser(description="RSI(2) + UT Bot parameter sweep")
+    ap.add_argument("--random", type=int, default=0, help="sample N random combos instead of the full grid")
+    ap.add_argument("--workers", type=int, default=os.cpu_count())
+    ap.add_argument("--sort", default="mean_cagr")
+    ap.add_argument("--out", default="optimizer_results.csv")
+    args = ap.parse_args()
+
+    frames, failures = BarCache().load(list(ASSETS.values()), period="max", interval="1d")
+    panel = resample_panel(stack_panel(frames), WEEK)
+    combos = list(random_combos(args.random) if args.random else grid_combos())
+
+    print(f"🔬 Sweeping {len(combos)} combos x {len(panel.tickers)} assets on {args.workers} workers...")
+    t0 = time.perf_counter()
+    results = sweep(panel, combos, workers=args.workers, sort_by=args.sort)
+    print(f"✅ Done in {time.perf_counter() - t0:.1f}s. Saved to {args.out}")
+    results.to_csv(args.out, index=False)
+    print(results.head(15).to_string())
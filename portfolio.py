@@ -0,0 +1,168 @@
+"""
+Local portfolio valuation -> portfolio_report.md.
+
+Builds the "Asset | Price (INR) | Date/Status" table from the daily bars
+main_production.py already keeps in the bar cache, instead of asking
+Gemini to search for prices:
+  * USD-quoted assets (BTC-USD) are converted with the USDINR rate (INR=X)
+    as of the same day, or the latest earlier fix on weekends/holidays;
+  * exchange-traded assets show their last close, labelled "(Friday
+    Closing)" over the weekend, or "Live" while their market is open;
+  * indices are quoted in points, without the ₹ sign.
+
+The LLM is optional and only writes commentary on the computed numbers.
+
+    python portfolio.py [--refresh] [--commentary]
+"""
+import argparse
+import math
+import time
+from datetime import datetime, timezone
+
+from bar_cache import BarCache
+from market_calendar import load_holidays, venue_for
+
+USDINR = "INR=X"
+REPORT_PATH = "portfolio_report.md"
+
+# Report names for the dashboard assets (universe.ASSETS keys)
+REPORT_NAMES = {
+    "Bitcoin": "Bitcoin (BTC)",
+    "Gold BeES": "Nippon Gold BeES ETF",
+    "Silver BeES": "Nippon Silver BeES ETF",
+    "Nifty 50": "Nifty 50 Index",
+    "Sensex": "Sensex Index",
+    "Smallcap 250": "HDFC Nifty Smallcap 250 ETF",
+    "Junior BeES": "Nippon Junior BeES ETF",
+    "MON100": "Motilal Oswal Nasdaq 100 ETF (MON100)",
+    "MAFANG": "Mirae Asset NYSE FANG+ ETF (MAFANG)",
+    "HangSeng BeES": "Nippon HangSeng BeES ETF",
+    "MAHKTECH": "Mirae Asset Hang Seng Tech ETF (MAHKTECH)",
+}
+REPORT_ORDER = list(REPORT_NAMES)
+
+COMMENTARY_PROMPT = """
+Here is my portfolio price table, computed from exchange data:
+
+{table}
+
+Write 3-4 sentences of commentary for a long-term Indian investor.
+Do not restate or change any numbers in the table.
+"""
+
+
+def _day(d):
+    return f"{d:%b} {d.day}, {d.year}"
+
+
+def _price(value, ticker):
+    text = f"{value:,.2f}"
+    return text if ticker.startswith("^") else f"₹{text}"
+
+
+def value_assets(assets, frames, fx=None, now=None):
+    """[(name, ticker, price_inr, last_bar_date, status)] in `assets` order; missing tickers are skipped."""
+    now = now or datetime.now(timezone.utc)
+    venues = load_holidays()
+    rows = []
+    for name, ticker in assets.items():
+        df = frames.get(ticker)
+        if df is None or df.empty:
+            continue
+        close = df["Close"].dropna()
+        last_day, price = close.index[-1], float(close.iloc[-1])
+        note = ""
+        if ticker.endswith("-USD"):
+            if fx is None or fx.empty:
+                rows.append((name, ticker, None, last_day, "⚠️ no USDINR rate cached"))
+                continue
+            rate = fx.asof(last_day)   # same day, else the latest earlier fix (weekends)
+            if math.isnan(rate):       # the cached rates all start after this bar
+                rows.append((name, ticker, None, last_day, f"⚠️ no USDINR rate for {_day(last_day)}"))
+                continue
+            price *= float(rate)
+            note = f", USDINR {float(rate):.2f}"
+
+        venue = venues[venue_for(ticker)]
+        today = now.astimezone(venue.tz).date()
+        if venue.always_open:
+            status = f"Live Price ({_day(last_day)}{note})" if last_day.date() == today else f"Last Price ({_day(last_day)}{note})"
+        elif venue.is_open(now) and last_day.date() == today:
+            status = f"Live ({_day(last_day)}, market open)"
+        elif last_day.weekday() == 4 and today > last_day.date():
+            status = f"{_day(last_day)} (Friday Closing)"
+        else:
+            status = f"{_day(last_day)} (Closing)"
+        rows.append((name, ticker, price, last_day, status))
+    return rows
+
+
+def report_table(rows, names=REPORT_NAMES):
+    lines = ["| Asset | Price (INR) | Date/Status |", "| :--- | ---: | :--- |"]
+    for name, ticker, price, _, status in rows:
+        shown = "—" if price is None else _price(price, ticker)
+        lines.append(f"| {names.get(name, name)} | {shown} | {status} |")
+    return "\n".join(lines)
+
+
+def load_bars(tickers, refresh=False):
+    """Daily bars for the report: cache-only by default (milliseconds), top-up with refresh=True.
+
+    Without refresh nothing is downloaded; tickers missing from the cache
+    come back as failures and the report lists them.
+    """
+    cache = BarCache()
+    if refresh:
+        return cache.load(tickers, period="1mo", interval="1d")
+    return cache.cached(tickers, period="1mo", interval="1d")
+
+
+def commentary(table, client=None):
+    """Optional LLM commentary on the computed table (cached like every other Gemini call)."""
+    from llm_cache import make_client
+    from model_registry import registry_for
+
+    client = client or make_client()
+    registry = registry_for(client)
+    response = registry.call(lambda m: client.models.generate_content(
+        model=m, contents=COMMENTARY_PROMPT.format(table=table)))
+    return response.text
+
+
+def build_report(assets=None, refresh=False, with_commentary=False, now=None, client=None):
+    """Markdown report text plus timing; nothing is written here."""
+    if assets is None:
+        from universe import ASSETS
+        assets = {n: ASSETS[n] for n in REPORT_ORDER if n in ASSETS}
+    now = now or datetime.now(timezone.utc)
+
+    t0 = time.perf_counter()
+    frames, failures = load_bars(list(assets.values()) + [USDINR], refresh)
+    fx = frames[USDINR]["Close"].dropna() if USDINR in frames else None
+    rows = value_assets(assets, frames, fx, now)
+    table = report_table(rows)
+    elapsed = time.perf_counter() - t0
+
+    parts = [f"Latest prices in INR, computed from cached daily bars at {now:%Y-%m-%d %H:%M %Z}.", "", table]
+    gaps = [t for t in assets.values() if t in failures]
+    if gaps:
+        parts += ["", "No data for: " + ", ".join(f"{t} ({failures[t]})" for t in gaps)]
+        if not refresh:
+            parts += ["Run with --refresh to download them."]
+    if with_commentary:
+        parts += ["", "## Commentary", "", commentary(table, client)]
+    return "\n".join(parts) + "\n", elapsed
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Value the portfolio locally and write portfolio_report.md")
+    ap.add_argument("--refresh", action="store_true", help="top up cached bars from Yahoo first")
+    ap.add_argument("--commentary", action="store_true", help="add LLM commentary on the computed numbers")
+    ap.add_argument("--out", default=REPORT_PATH)
+    args = ap.parse_args()
+
+    text, elapsed = build_report(refresh=args.refresh, with_commentary=args.commentary)
+    with open(args.out, "w", encoding="utf-8") as f:
+        f.write(text)
+    print(text)
+    print(f"✅ Valued in {elapsed * 1000:.1f} ms -> {args.out}")
@@ -0,0 +1,62 @@
+"""
+Change detection for the dashboard pipeline.
+
+Each asset's input bars are fingerprinted. Cards whose fingerprint matches
+the previous run are reused from the manifest instead of being recomputed
+and re-rendered; when nothing changed at all the caller can skip writing
+the page (and the workflow skips the commit).
+"""
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from signals import SIGNAL_RULES
+
+RENDER_DIR = os.getenv("RENDER_CACHE_DIR", ".cache/render")
+# Bump when the card payload format or indicator maths change, to invalidate old cards
+RENDER_VERSION = "2"
+_SALT = repr((RENDER_VERSION, SIGNAL_RULES)).encode()
+
+
+def fingerprint(df, extra="", columns=("Open", "High", "Low", "Close")):
+    """Stable hash of a frame's timestamps and OHLC values (plus e.g. the display name)."""
+    h = hashlib.blake2b(_SALT + extra.encode(), digest_size=16)
+    h.update(np.ascontiguousarray(df.index.asi8).tobytes())
+    for c in columns:
+        h.update(np.ascontiguousarray(df[c].to_numpy(dtype=np.float64)).tobytes())
+    return h.hexdigest()
+
+
+class RenderCache:
+    def __init__(self, root=RENDER_DIR, name="manifest.json"):
+        self.path = os.path.join(root, name)
+        os.makedirs(root, exist_ok=True)
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            self.manifest = {"cards": {}, "page": []}
+
+    def changed(self, ticker, fp):
+        entry = self.manifest["cards"].get(ticker)
+        return entry is None or entry["fp"] != fp
+
+    def card(self, ticker):
+        entry = self.manifest["cards"].get(ticker)
+        return entry and entry["card"]
+
+    def put(self, ticker, fp, card):
+        self.manifest["cards"][ticker] = {"fp": fp, "card": card}
+
+    def page_unchanged(self, tickers, page_path):
+        """True when the last page had exactly these cards and is still on disk."""
+        return self.manifest.get("page") == list(tickers) and os.path.exists(page_path)
+
+    def save(self, tickers):
+        self.manifest["page"] = list(tickers)
+        tmp = self.path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.manifest, f, separators=(",", ":"))
+        os.replace(tmp, self.path)
@@ -0,0 +1,79 @@
+"""
+Parallel card rendering.
+
+Building a card is pure CPU work, so cards are rendered on a
+ProcessPoolExecutor. What a card is depends on the caller:
+  * main_production: a JSON card payload dict (chart data and signal)
+    that the page draws in the browser from one shared template;
+  * main08/main09: a Plotly figure (make_subplots / add_trace / to_html)
+    serialized to an HTML string.
+Either way workers get lightweight payloads - the display name and a dict
+of numpy arrays - instead of DataFrames, rebuild whatever they need
+locally and send back (card, seconds). pool.map keeps the results in
+submission order, so the page comes out the same whatever order the
+workers finish in.
+
+Small universes are rendered in-process: below MIN_PARALLEL cards the
+pool start-up costs more than it saves.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+RENDER_WORKERS = int(os.getenv("RENDER_WORKERS", "0")) or os.cpu_count()
+MIN_PARALLEL = 32
+CHUNKS_PER_WORKER = 4   # a few chunks per worker evens out slow cards without per-card IPC
+
+
+def to_arrays(df, fields=None):
+    """DataFrame -> {"_index": datetime64 array, field: float64 array}; cheap to pickle."""
+    fields = list(df.columns) if fields is None else fields
+    out = {"_index": df.index.values}
+    for f in fields:
+        out[f] = df[f].to_numpy(dtype=np.float64)
+    return out
+
+
+def from_arrays(arrays):
+    index = pd.DatetimeIndex(arrays["_index"])
+    return pd.DataFrame({k: v for k, v in arrays.items() if k != "_index"}, index=index)
+
+
+def _timed(job):
+    render, name, payload = job
+    t0 = time.perf_counter()
+    out = render(name, payload)
+    return out, time.perf_counter() - t0
+
+
+def render_cards(render, jobs, workers=RENDER_WORKERS, min_parallel=MIN_PARALLEL):
+    """Run render(name, payload) for every (name, payload) job.
+
+    `render` must be a module-level function so it pickles, and it is the
+    process-pool entry point: `payload` is what to_arrays() produced, plain
+    arrays rather than DataFrames, so it rebuilds the frame itself. Returns
+    (results, timings) with results in job order and timings as
+    [(name, seconds)].
+    """
+    tasks = [(render, name, payload) for name, payload in jobs]
+    if workers <= 1 or len(tasks) < min_parallel:
+        done = [_timed(t) for t in tasks]
+    else:
+        chunksize = max(1, len(tasks) // (workers * CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            done = list(pool.map(_timed, tasks, chunksize=chunksize))
+    results = [out for out, _ in done]
+    timings = [(name, secs) for (name, _), (_, secs) in zip(jobs, done)]
+    return results, timings
+
+
+def report_timings(timings, wall, top=5):
+    if not timings:
+        return
+    busy = sum(s for _, s in timings)
+    print(f"⏱️ Rendered {len(timings)} cards in {wall:.2f}s wall ({busy:.2f}s CPU, {1000 * busy / len(timings):.1f} ms/card)")
+    for name, secs in sorted(timings, key=lambda x: -x[1])[:top]:
+        print(f"   {secs * 1000:8.1f} ms  {name}")
@@ -0,0 +1,190 @@
+"""
+Structured timing/memory instrumentation for the dashboard runs.
+
+    report = RunReport("main_production")
+    with report.stage("fetch"):
+        ...
+    report.count("fetch_failures", len(failures))
+    report.asset("BTC-USD", bars=250, status="fetched")
+    report.write("run_report.json")
+
+Each stage records wall time and the process RSS (current and change);
+per-asset entries collect whatever the stages know about that ticker
+(bars, fetch status, render time, payload size, errors). Counters and
+errors are kept as-is. The JSON goes next to the page it describes.
+
+RUN_PROFILE turns on the expensive tools (comma separated):
+  cpu     cProfile for the whole run -> <report>.prof, top functions in the report
+  memory  tracemalloc: Python-heap peak per stage + top allocation sites
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import resource
+import sys
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+PROFILE = {p.strip() for p in os.getenv("RUN_PROFILE", "").lower().split(",") if p.strip()}
+TOP = 15
+MB = 1024 * 1024
+
+
+def rss_mb():
+    """Current resident set size (Linux /proc), else the peak so far."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / MB
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / MB if sys.platform == "darwin" else peak / 1024   # bytes on macOS, KB on Linux
+
+
+def report_path_for(page):
+    """run_report.json for index.html, <name>_report.json for any other page, in the same folder."""
+    folder, base = os.path.split(page)
+    stem = os.path.splitext(base)[0]
+    return os.path.join(folder, "run_report.json" if stem == "index" else f"{stem}_report.json")
+
+
+class RunReport:
+    def __init__(self, name, profile=None):
+        self.name = name
+        self.profile = PROFILE if profile is None else set(profile)
+        self.started = datetime.now(timezone.utc)
+        self.t0 = time.perf_counter()
+        self.stages = []
+        self.assets = {}
+        self.counters = Counter()
+        self.errors = []
+        self.status = "ok"
+        self._peaks = []     # tracemalloc peak per open stage (stages nest)
+        self._raised = []    # exceptions a stage already recorded
+        self._cpu = None
+        if "memory" in self.profile and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        if "cpu" in self.profile:
+            self._cpu = cProfile.Profile()
+            self._cpu.enable()
+
+    @property
+    def tracing(self):
+        return "memory" in self.profile and tracemalloc.is_tracing()
+
+    @contextmanager
+    def stage(self, name, **info):
+        record = {"stage": name, **info}
+        rss0 = rss_mb()
+        if self.tracing:
+            tracemalloc.reset_peak()
+            self._peaks.append(0)
+        t0 = time.perf_counter()
+        try:
+            yield record
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+            self.error(name, e)
+            self._raised.append(e)
+            raise
+        finally:
+            record["seconds"] = round(time.perf_counter() - t0, 4)
+            record["rss_mb"] = round(rss_mb(), 1)
+            record["rss_delta_mb"] = round(record["rss_mb"] - rss0, 1)
+            if self.tracing:
+                peak = max(self._peaks.pop(), tracemalloc.get_traced_memory()[1])
+                if self._peaks:
+                    self._peaks[-1] = max(self._peaks[-1], peak)   # the enclosing stage saw this peak too
+                tracemalloc.reset_peak()
+                record["py_peak_mb"] = round(peak / MB, 2)
+            self.stages.append(record)
+
+    @contextmanager
+    def writing(self, path):
+        """Write the report to `path` when the block ends, also when it raises (status "error")."""
+        try:
+            yield self
+        except Exception as e:
+            self.status = "error"
+            if not any(e is r for r in self._raised):
+                self.error("run", e)
+            raise
+        finally:
+            self.write(path)
+
+    def asset(self, ticker, **fields):
+        """Merge facts about one ticker into its entry."""
+        entry = self.assets.setdefault(ticker, {})
+        entry.update(fields)
+        return entry
+
+    def count(self, name, n=1):
+        self.counters[name] += n
+
+    def error(self, where, exc, ticker=None):
+        self.count("errors")
+        self.errors.append({"where": where, "ticker": ticker, "type": type(exc).__name__, "message": str(exc)[:300]})
+        if ticker:
+            self.asset(ticker, error=f"{type(exc).__name__}: {exc}")
+
+    # --- output ---
+    def _cpu_top(self, out_path):
+        self._cpu.disable()
+        prof_path = os.path.splitext(out_path)[0] + ".prof"
+        self._cpu.dump_stats(prof_path)
+        stats = pstats.Stats(self._cpu, stream=io.StringIO())
+        top = []
+        for (file, line, func), (cc, nc, tt, ct, _) in sorted(stats.stats.items(), key=lambda kv: -kv[1][3])[:TOP]:
+            top.append({"function": f"{os.path.basename(file)}:{line}({func})", "calls": nc,
+                        "own_s": round(tt, 4), "cumulative_s": round(ct, 4)})
+        return {"file": prof_path, "top": top}
+
+    def _memory_top(self):
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        top = [{"site": f"{os.path.basename(s.traceback[0].filename)}:{s.traceback[0].lineno}",
+                "size_mb": round(s.size / MB, 3), "blocks": s.count}
+               for s in snapshot.statistics("lineno")[:TOP]]
+        return {"current_mb": round(current / MB, 2), "top": top}
+
+    def summary(self):
+        data = {
+            "run": self.name,
+            "status": self.status,
+            "started": self.started.isoformat(timespec="seconds"),
+            "seconds": round(time.perf_counter() - self.t0, 3),
+            "peak_rss_mb": round(peak_rss_mb(), 1),
+            "stages": self.stages,
+            "counters": dict(self.counters),
+            "errors": self.errors,
+            "assets": self.assets,
+        }
+        slow = [(t, a["render_s"]) for t, a in self.assets.items() if "render_s" in a]
+        if slow:
+            data["slowest_assets"] = [t for t, _ in sorted(slow, key=lambda x: -x[1])[:5]]
+        return data
+
+    def write(self, path="run_report.json"):
+        data = self.summary()
+        if self._cpu is not None:
+            data["cpu_profile"] = self._cpu_top(path)
+            self._cpu = None
+        if self.tracing:
+            data["memory_profile"] = self._memory_top()
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=1, default=str)
+        os.replace(tmp, path)
+
+        top = max(self.stages, key=lambda s: s["seconds"], default=None)
+        slowest = f", slowest stage {top['stage']} {top['seconds']:.2f}s" if top else ""
+        print(f"📝 Run report: {path} ({data['seconds']:.2f}s, peak {data['peak_rss_mb']:.0f} MB{slowest})")
+        return data
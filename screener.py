@@ -0,0 +1,142 @@
+"""
+Universe screener: the RSI(2) + UT Bot strategy over thousands of tickers.
+
+Instead of a chart per asset, the universe is processed in fixed-size
+chunks (fetch or read cached bars -> weekly panel -> indicators ->
+signal), only each ticker's last bar is kept, and the chunk's bars are
+dropped before the next one. Memory therefore depends on the chunk size,
+not on the universe size.
+
+With --store NAME the chunks are column slices of a consolidated float32
+bar store (bar_store.py) instead of per-ticker Parquet reads: memory-mapped
+views, nothing decoded up front.
+
+Output is the ranked hits only: by default RSI(2) < 10, deepest below
+the 90-day MA first.
+
+    python screener.py nifty500.csv                      # RSI(2) < 10
+    python screener.py universe.txt --signal BUY --top 50
+    python screener.py universe.txt --all --out all.csv  # every name, ranked
+    python bar_store.py build nifty500.csv --name nifty500 && python screener.py nifty500.csv --store nifty500
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from bar_cache import BarCache
+from run_report import RunReport, report_path_for
+from signals import labels, last_bars, NO_BAR
+from timeframes import Timeframes, WEEK, DAY, MONTH
+
+CHUNK = 250          # tickers per batch; ~5 Yahoo requests, a few MB of panel arrays
+RSI_BELOW = 10.0
+OUT_PATH = "screener_hits.csv"
+RULES = {"D": DAY, "W": WEEK, "M": MONTH}
+COLUMNS = ["Name", "Ticker", "Date", "Close", "RSI_2", "MA_90", "MA_Gap_%", "UT_Stop", "Signal", "Bars"]
+
+
+def last_rows(panel, names):
+    """One summary row per ticker from its last traded bar of a classified panel."""
+    codes = panel["Signal"]
+    traded = codes != NO_BAR
+    has, last = last_bars(panel)
+    cols = np.arange(len(panel.tickers))
+    pick = {f: panel[f][last, cols] for f in ("Close", "RSI_2", "MA_90", "UT_Stop")}
+    label = labels()
+    rows = []
+    for j, t in enumerate(panel.tickers):
+        if not has[j]:
+            continue
+        close, ma = pick["Close"][j], pick["MA_90"][j]
+        rows.append({
+            "Name": names.get(t, t), "Ticker": t, "Date": panel.index[last[j]].date(),
+            "Close": close, "RSI_2": pick["RSI_2"][j], "MA_90": ma,
+            "MA_Gap_%": 100 * (close / ma - 1) if ma > 0 else np.nan,
+            "UT_Stop": pick["UT_Stop"][j], "Signal": label[codes[last[j], j]], "Bars": int(traded[:, j].sum()),
+        })
+    return rows
+
+
+def screen(universe, chunk=CHUNK, rule=WEEK, period="1y", cache_only=False, report=None, bars=None, store=None):
+    """Summary rows for every ticker in `universe` ({name: ticker}), `chunk` tickers at a time.
+
+    `store` = (BarStore, name) reads the chunks from that bar store instead of the Parquet cache.
+    """
+    report = report or RunReport("screener")
+    bars = bars or (None if store else BarCache())
+    names = {t: n for n, t in universe.items()}
+    tickers = list(names)
+    rows = []
+    for i in range(0, len(tickers), chunk):
+        batch = tickers[i:i + chunk]
+        with report.stage("chunk", first=i, size=len(batch)) as rec:
+            if store:
+                loaded = store[0].panel(store[1], batch, period)
+                if loaded is None:
+                    raise FileNotFoundError(f"no bar store {store[1]!r} in {store[0].root}")
+                frames, missing = loaded       # a Panel of memory-mapped views
+                failures = {t: "not in the bar store" for t in missing}
+                found = len(frames.tickers)
+            else:
+                if cache_only:
+                    frames, failures = bars.cached(batch, period=period, interval="1d")
+                else:
+                    frames, failures = bars.load(batch, period=period, interval="1d")
+                found = len(frames)
+            if found:
+                rows += last_rows(Timeframes(frames).panel(rule), names)
+            rec["failures"] = len(failures)
+        report.count("screened", found)
+        report.count("fetch_failures", len(failures))
+        print(f"   {min(i + chunk, len(tickers)):>6}/{len(tickers)} screened ({len(failures)} without data)", flush=True)
+        del frames     # only the summary rows outlive the chunk
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def hits(table, rsi_below=RSI_BELOW, signal=None, rank="MA_Gap_%"):
+    """Rows passing the filters, best first (most negative rank value first)."""
+    keep = pd.Series(True, index=table.index)
+    if rsi_below is not None:
+        keep &= table["RSI_2"] < rsi_below
+    if signal:
+        keep &= table["Signal"].str.contains(signal, case=False, regex=False)
+    return table[keep].sort_values([rank, "RSI_2"], na_position="last").reset_index(drop=True)
+
+
+if __name__ == "__main__":
+    from universe import ASSETS, load_universe
+
+    ap = argparse.ArgumentParser(description="Screen a universe for RSI(2) + UT Bot setups and rank the hits")
+    ap.add_argument("universe", nargs="?", help="universe file (.txt or .csv); default: the dashboard assets")
+    ap.add_argument("--rsi-below", type=float, default=RSI_BELOW)
+    ap.add_argument("--signal", help="keep signals whose label contains this text (e.g. BUY, CRASH)")
+    ap.add_argument("--all", action="store_true", help="no RSI filter: rank every name")
+    ap.add_argument("--rank", default="MA_Gap_%", choices=["MA_Gap_%", "RSI_2"])
+    ap.add_argument("--timeframe", default="W", choices=sorted(RULES))
+    ap.add_argument("--chunk", type=int, default=CHUNK)
+    ap.add_argument("--period", default="1y")
+    ap.add_argument("--cache-only", action="store_true", help="screen cached bars only, no downloads")
+    ap.add_argument("--store", metavar="NAME", help="read bars from this bar store (python bar_store.py build ...)")
+    ap.add_argument("--top", type=int, default=25, help="rows to print (the CSV gets every hit)")
+    ap.add_argument("--out", default=OUT_PATH)
+    args = ap.parse_args()
+
+    universe = load_universe(args.universe) if args.universe else ASSETS
+    print(f"🔎 Screening {len(universe)} tickers in chunks of {args.chunk} ({args.timeframe} bars)...")
+    report = RunReport("screener")
+    with report.writing(report_path_for(args.out)):
+        t0 = time.perf_counter()
+        store = None
+        if args.store:
+            from bar_store import BarStore
+            store = (BarStore(), args.store)
+        table = screen(universe, args.chunk, RULES[args.timeframe], args.period, args.cache_only, report, store=store)
+        found = hits(table, None if args.all else args.rsi_below, args.signal, args.rank)
+        report.count("hits", len(found))
+
+        found.to_csv(args.out, index=False, float_format="%.2f")
+        with pd.option_context("display.width", 200, "display.max_columns", 20, "display.float_format", "{:,.2f}".format):
+            print(found.head(args.top).to_string(index=False) if len(found) else "No hits.")
+        print(f"✅ {len(found)} hits out of {len(table)} screened in {time.perf_counter() - t0:.1f}s -> {args.out}")
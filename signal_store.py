@@ -0,0 +1,211 @@
+"""
+Signal history in SQLite, so a run's signals outlive index.html.
+
+Two tables, both keyed by (ticker, timeframe, ts) where ts is the bar's
+date (YYYY-MM-DD) and timeframe is D/W/M:
+  snapshots    close, RSI(2), 90-day MA, UT stop and signal of every bar,
+  transitions  bars where the signal changed, with the previous signal.
+Indexes on (ticker, ts) and (signal, ts) make questions like "which assets
+flipped to BUY this week" index range scans.
+
+Writes are bulk upserts in one transaction, and incremental: only bars
+from each ticker's last stored bar on (minus REWRITE_BARS, for bars Yahoo
+revised) are written, so the hourly job touches a handful of rows per
+asset. The still-forming bar is rewritten on every run, and transitions
+inside the rewritten window are replaced, so a signal that appears
+intra-week and then reverts does not leave a stale flip behind.
+
+    python signal_store.py flips BUY --days 7
+    python signal_store.py history BTC-USD --timeframe W
+"""
+import argparse
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from signals import labels, NO_BAR
+
+DB_PATH = os.getenv("SIGNAL_DB_PATH", ".cache/signals.sqlite")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    ticker TEXT NOT NULL, timeframe TEXT NOT NULL, ts TEXT NOT NULL,
+    close REAL, rsi REAL, ma REAL, ut_stop REAL, signal TEXT NOT NULL, run_at REAL NOT NULL,
+    PRIMARY KEY (ticker, timeframe, ts)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS snapshots_signal_ts ON snapshots (signal, ts);
+CREATE TABLE IF NOT EXISTS transitions (
+    ticker TEXT NOT NULL, timeframe TEXT NOT NULL, ts TEXT NOT NULL,
+    from_signal TEXT NOT NULL, signal TEXT NOT NULL, close REAL, rsi REAL, run_at REAL NOT NULL,
+    PRIMARY KEY (ticker, timeframe, ts)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS transitions_signal_ts ON transitions (signal, ts);
+CREATE INDEX IF NOT EXISTS transitions_ticker_ts ON transitions (ticker, ts);
+"""
+
+FIELDS = ("Close", "RSI_2", "MA_90", "UT_Stop")
+REWRITE_BARS = 2     # same as bar_cache.RECONCILE_BARS: the last stored bars may have been revised
+
+
+def match_signals(text):
+    """Full signal labels containing `text` ("BUY" -> the buy labels), so queries stay on the index."""
+    return [label for label in labels() if text.lower() in label.lower()]
+
+
+def panel_rows(panel, since=None, rewrite=REWRITE_BARS):
+    """Snapshot and transition rows for the traded bars of a classified panel (vectorized).
+
+    With `since` ({ticker: last stored day}) a ticker's rows start `rewrite`
+    bars before that day; tickers not in it get their full history. Also
+    returns {ticker: (first day written, whether that is the panel's first bar)}.
+    """
+    codes = panel["Signal"]
+    names = np.array(labels(), dtype=object)
+    days = np.asarray(panel.index.strftime("%Y-%m-%d"), dtype=object)
+    tickers = np.array(panel.tickers, dtype=object)
+
+    # Column-major, so each ticker's bars are contiguous and in time order
+    cols, rows = np.nonzero((codes != NO_BAR).T)
+    code = codes[rows, cols]
+    bounds = np.flatnonzero(np.r_[True, cols[1:] != cols[:-1], True])
+    keep = np.ones(len(cols), dtype=bool)
+    starts = {}
+    for a, b in zip(bounds[:-1], bounds[1:]):
+        t = tickers[cols[a]]
+        k = a
+        last = (since or {}).get(t)
+        if last is not None:
+            k = max(a, a + int(np.searchsorted(days[rows[a:b]], last)) - rewrite)
+            keep[a:k] = False
+        if k < b:
+            starts[t] = (days[rows[k]], k == a)
+
+    flip = np.zeros(len(cols), dtype=bool)
+    flip[1:] = (cols[1:] == cols[:-1]) & (code[1:] != code[:-1])
+    prev = np.r_[0, code[:-1]]
+    sel, fsel = np.flatnonzero(keep), np.flatnonzero(keep & flip)
+
+    values = [panel[f][rows[sel], cols[sel]].tolist() for f in FIELDS]
+    snaps = list(zip(tickers[cols[sel]], days[rows[sel]], *values, names[code[sel]]))
+    flips = list(zip(tickers[cols[fsel]], days[rows[fsel]], names[prev[fsel]], names[code[fsel]],
+                     panel["Close"][rows[fsel], cols[fsel]].tolist(), panel["RSI_2"][rows[fsel], cols[fsel]].tolist()))
+    return snaps, flips, starts
+
+
+class SignalStore:
+    def __init__(self, path=DB_PATH):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")   # WAL + NORMAL: durable at checkpoints, no fsync per commit
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def last_stored(self, tickers, timeframe):
+        """{ticker: latest stored day}; one primary-key lookup per ticker."""
+        with self._lock:
+            found = ((t, self._db.execute("SELECT MAX(ts) FROM snapshots WHERE ticker = ? AND timeframe = ?",
+                                          (t, timeframe)).fetchone()[0]) for t in tickers)
+            return {t: ts for t, ts in found if ts is not None}
+
+    def record(self, panel, timeframe="W", run_at=None, full=False):
+        """Upsert a classified panel's new/changed bars (every bar with full=True); returns (snapshots, transitions) written."""
+        run_at = run_at or time.time()
+        since = None if full else self.last_stored(panel.tickers, timeframe)
+        snaps, flips, starts = panel_rows(panel, since)
+        with self._lock:
+            self._db.execute("BEGIN")
+            try:
+                self._db.executemany(
+                    """INSERT INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                       ON CONFLICT (ticker, timeframe, ts) DO UPDATE SET close = excluded.close, rsi = excluded.rsi,
+                       ma = excluded.ma, ut_stop = excluded.ut_stop, signal = excluded.signal, run_at = excluded.run_at""",
+                    ((t, timeframe, ts, c, r, m, u, s, run_at) for t, ts, c, r, m, u, s in snaps))
+                # Flips inside the written window are replaced (a forming bar's flip may have reverted);
+                # a flip on the panel's first bar needs older bars, so a stored one is kept
+                self._db.executemany("DELETE FROM transitions WHERE ticker = ? AND timeframe = ? AND ts >= ?",
+                                     ((t, timeframe, ts) for t, (ts, first) in starts.items() if not first))
+                self._db.executemany("DELETE FROM transitions WHERE ticker = ? AND timeframe = ? AND ts > ?",
+                                     ((t, timeframe, ts) for t, (ts, first) in starts.items() if first))
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO transitions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    ((t, timeframe, ts, a, b, c, r, run_at) for t, ts, a, b, c, r in flips))
+                self._db.execute("COMMIT")
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+        return len(snaps), len(flips)
+
+    def record_panels(self, panels, run_at=None, full=False):
+        """{timeframe: classified panel} -> total (snapshots, transitions) written."""
+        run_at = run_at or time.time()
+        written = [self.record(p, tf, run_at, full) for tf, p in panels.items()]
+        return sum(s for s, _ in written), sum(f for _, f in written)
+
+    # --- queries ---
+    def _query(self, sql, args):
+        with self._lock:
+            cur = self._db.execute(sql, args)
+            cols = [d[0] for d in cur.description]
+            return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+    def flips(self, to, since, timeframe=None):
+        """Transitions into any signal matching `to` (text or list of labels) on or after `since`."""
+        wanted = match_signals(to) if isinstance(to, str) else list(to)
+        if not wanted:
+            return []
+        sql = (f"SELECT * FROM transitions WHERE signal IN ({', '.join('?' * len(wanted))}) AND ts >= ?"
+               + (" AND timeframe = ?" if timeframe else "") + " ORDER BY ts DESC, ticker")
+        return self._query(sql, [*wanted, str(since)] + ([timeframe] if timeframe else []))
+
+    def history(self, ticker, timeframe="W", since=None):
+        return self._query("SELECT * FROM snapshots WHERE ticker = ? AND timeframe = ? AND ts >= ? ORDER BY ts",
+                           (ticker, timeframe, str(since or "")))
+
+    def transitions(self, ticker, timeframe=None, since=None):
+        sql = "SELECT * FROM transitions WHERE ticker = ? AND ts >= ?" + (" AND timeframe = ?" if timeframe else "") + " ORDER BY ts"
+        return self._query(sql, [ticker, str(since or "")] + ([timeframe] if timeframe else []))
+
+    def latest(self, timeframe="W"):
+        """Each ticker's most recent snapshot."""
+        return self._query("""SELECT s.* FROM snapshots s JOIN (SELECT ticker, MAX(ts) AS ts FROM snapshots
+                              WHERE timeframe = ? GROUP BY ticker) m ON s.ticker = m.ticker AND s.ts = m.ts
+                              WHERE s.timeframe = ? ORDER BY s.ticker""", (timeframe, timeframe))
+
+    def close(self):
+        self._db.close()
+
+
+def _num(x):
+    return float("nan") if x is None else x
+
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser(description="Query the signal history")
+    sub = ap.add_subparsers(dest="command", required=True)
+    p = sub.add_parser("flips", help="assets that flipped into a signal recently")
+    p.add_argument("signal", help="text in the signal label, e.g. BUY, AGGRESSIVE, PROFIT")
+    p.add_argument("--days", type=int, default=7)
+    p.add_argument("--timeframe", choices=["D", "W", "M"])
+    p = sub.add_parser("history", help="snapshots of one ticker")
+    p.add_argument("ticker")
+    p.add_argument("--timeframe", default="W", choices=["D", "W", "M"])
+    p.add_argument("--days", type=int, default=365)
+    args = ap.parse_args()
+
+    store = SignalStore()
+    since = date.today() - timedelta(days=args.days)
+    t0 = time.perf_counter()
+    if args.command == "flips":
+        rows = store.flips(args.signal, since, args.timeframe)
+        for r in rows:
+            print(f"{r['ts']}  {r['timeframe']}  {r['ticker']:<14} {r['from_signal']} -> {r['signal']}  "
+                  f"@ {_num(r['close']):.2f} (RSI {_num(r['rsi']):.1f})")
+    else:
+        rows = store.history(args.ticker, args.timeframe, since)
+        for r in rows:
+            print(f"{r['ts']}  {_num(r['close']):>10.2f}  RSI {_num(r['rsi']):5.1f}  {r['signal']}")
+    print(f"✅ {len(rows)} rows in {(time.perf_counter() - t0) * 1000:.1f} ms")
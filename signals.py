@@ -0,0 +1,96 @@
+"""
+Vectorized strategy signal classification.
+
+The RSI(2) + UT Bot rules live in one table. `classify` evaluates them
+with np.select over whole arrays (every bar of every asset at once) and
+returns integer codes into that table; the last code is the default
+"WAIT / HOLD" bucket.
+"""
+import numpy as np
+
+# First matching rule wins. Right-hand side is a number or another field name.
+SIGNAL_RULES = [
+    # label                 color      field    op   threshold
+    ("⚡ AGGRESSIVE ADD",    "#00e676", "RSI_2", "<", 10),
+    ("🟢 BUY / ACCUMULATE",  "#66bb6a", "RSI_2", "<", 20),
+    ("🔴 BOOK PROFIT",       "#ff1744", "RSI_2", ">", 90),
+    ("⚠️ DOWNTREND",         "#ffa726", "Close", "<", "UT_Stop"),
+]
+DEFAULT_SIGNAL = ("⚪ WAIT / HOLD", "#78909c")
+
+NO_BAR = -1  # code for calendar cells where the asset did not trade
+
+_OPS = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal}
+
+
+def labels(rules=SIGNAL_RULES):
+    return [r[0] for r in rules] + [DEFAULT_SIGNAL[0]]
+
+
+def colors(rules=SIGNAL_RULES):
+    return [r[1] for r in rules] + [DEFAULT_SIGNAL[1]]
+
+
+def rsi_codes(rules=SIGNAL_RULES):
+    """Codes of the RSI-driven rules (the ones worth marking on a chart)."""
+    return [i for i, r in enumerate(rules) if r[2] == "RSI_2"]
+
+
+def with_thresholds(aggressive=10, buy=20, profit=90, rules=SIGNAL_RULES):
+    """Copy of the rules table with the three RSI thresholds replaced."""
+    new = {"⚡ AGGRESSIVE ADD": aggressive, "🟢 BUY / ACCUMULATE": buy, "🔴 BOOK PROFIT": profit}
+    return [(l, c, f, op, new.get(l, rhs)) for l, c, f, op, rhs in rules]
+
+
+def _fields_used(rules):
+    names = {"Close"}
+    for _, _, field, _, rhs in rules:
+        names.add(field)
+        if isinstance(rhs, str):
+            names.add(rhs)
+    return names
+
+
+def classify(fields, rules=SIGNAL_RULES):
+    """Signal codes for arrays of any shape; fields maps name -> array."""
+    close = np.asarray(fields["Close"], dtype=float)
+    conditions = []
+    with np.errstate(invalid="ignore"):
+        for _, _, field, op, rhs in rules:
+            right = fields[rhs] if isinstance(rhs, str) else rhs
+            conditions.append(_OPS[op](fields[field], right))
+    codes = np.select(conditions, np.arange(len(rules)), default=len(rules)).astype(np.int8)
+    codes[np.isnan(close)] = NO_BAR
+    return codes
+
+
+def classify_panel(panel, rules=SIGNAL_RULES):
+    """Store per-bar signal codes for every asset as panel['Signal']."""
+    panel["Signal"] = classify(panel.fields, rules)
+    return panel
+
+
+def last_bars(panel):
+    """(has a bar, row of the last traded bar) per ticker of a classified panel."""
+    traded = panel["Signal"] != NO_BAR
+    return traded.any(axis=0), len(traded) - 1 - np.argmax(traded[::-1], axis=0)
+
+
+def latest_signals(panel, rules=SIGNAL_RULES):
+    """{ticker: (label, color)} for each asset's last traded bar of a classified panel."""
+    codes = panel["Signal"]
+    has, last = last_bars(panel)
+    names, palette = labels(rules), colors(rules)
+    out = {}
+    for j, t in enumerate(panel.tickers):
+        code = int(codes[last[j], j]) if has[j] else len(rules)
+        out[t] = (names[code], palette[code])
+    return out
+
+
+def signal_for_row(row, rules=SIGNAL_RULES):
+    """(label, color) for a single row, e.g. the last bar."""
+    code = int(classify({k: np.asarray([row[k]], dtype=float) for k in _fields_used(rules)}, rules)[0])
+    if code == NO_BAR:
+        code = len(rules)
+    return labels(rules)[code], colors(rules)[code]
@@ -0,0 +1,120 @@
+"""
+Static signals API: the dashboard's latest numbers as small JSON files.
+
+Written next to index.html on every run that rebuilds the page, from the
+same classified D/W/M panels the cards and alerts use:
+
+    api/v1/signals.json      {"version", "generated_at", "timeframes", "assets": [...]}
+    api/v1/signals.ndjson    a header line, then one asset per line
+    + .gz (always) and .br (when the optional `brotli` package is installed),
+      pre-compressed so a static host can serve them as they are.
+
+Every asset has, per timeframe, its last bar's date, OHLC, RSI_2, MA_90,
+UT_Stop and signal label. Like the cards, only assets with new bars are
+recomputed; the others keep their entry from the previous snapshot.
+
+VERSION changes only when fields are removed or change meaning; clients
+should ignore fields they do not know.
+"""
+import gzip
+import json
+import os
+from datetime import datetime, timezone
+
+import numpy as np
+
+from signals import labels, last_bars
+
+try:
+    import brotli
+except ImportError:     # optional: pip install brotli
+    brotli = None
+
+VERSION = 1
+API_DIR = os.getenv("SIGNALS_API_DIR", f"api/v{VERSION}")
+NAME = "signals"
+API_PATH = os.path.join(API_DIR, NAME + ".json")
+FIELDS = {"open": "Open", "high": "High", "low": "Low", "close": "Close",
+          "rsi_2": "RSI_2", "ma_90": "MA_90", "ut_stop": "UT_Stop"}
+DIGITS = {"rsi_2": 2}   # prices keep 4 decimals
+
+
+def _num(x, digits):
+    x = float(x)
+    return None if x != x else round(x, digits)
+
+
+def asset_records(panels, names):
+    """{ticker: {"ticker", "name", timeframe: {date, open, ..., signal}}} from {timeframe: classified panel}."""
+    label = labels()
+    out = {}
+    for tf, panel in panels.items():
+        has, last = last_bars(panel)
+        cols = np.arange(len(panel.tickers))
+        pick = {k: panel[f][last, cols].tolist() for k, f in FIELDS.items()}
+        codes = panel["Signal"][last, cols]
+        dates = panel.index[last].strftime("%Y-%m-%d")
+        for j, t in enumerate(panel.tickers):
+            if not has[j]:
+                continue
+            bar = {"date": dates[j], **{k: _num(v[j], DIGITS.get(k, 4)) for k, v in pick.items()}, "signal": label[codes[j]]}
+            out.setdefault(t, {"ticker": t, "name": names.get(t, t)})[tf] = bar
+    return out
+
+
+def load_records(out_dir=API_DIR):
+    """Previous snapshot's assets by ticker ({} if there is none)."""
+    try:
+        with open(os.path.join(out_dir, NAME + ".json"), encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if payload.get("version") != VERSION:
+        return {}
+    return {a["ticker"]: a for a in payload.get("assets", [])}
+
+
+def snapshot(records, order, timeframes=("D", "W", "M"), generated_at=None):
+    generated_at = generated_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+    return {"version": VERSION, "generated_at": generated_at, "timeframes": list(timeframes),
+            "assets": [records[t] for t in order if t in records]}
+
+
+def encode(payload):
+    """(JSON bytes, NDJSON bytes), compact separators, UTF-8."""
+    dump = lambda obj: json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+    header = {k: v for k, v in payload.items() if k != "assets"}
+    body = dump(payload).encode()
+    lines = "\n".join([dump(header)] + [dump(a) for a in payload["assets"]]) + "\n"
+    return body, lines.encode()
+
+
+def _write(path, data):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+
+def write(payload, out_dir=API_DIR):
+    """Write JSON, NDJSON and their compressed variants; returns {path: bytes written}."""
+    os.makedirs(out_dir, exist_ok=True)
+    sizes = {}
+    for ext, data in zip((".json", ".ndjson"), encode(payload)):
+        path = os.path.join(out_dir, NAME + ext)
+        variants = {path: data, path + ".gz": gzip.compress(data, 9, mtime=0)}
+        if brotli is not None:
+            variants[path + ".br"] = brotli.compress(data, quality=11)
+        for p, blob in variants.items():
+            _write(p, blob)
+            sizes[p] = len(blob)
+    return sizes
+
+
+def publish(panels, names, order, out_dir=API_DIR):
+    """Merge freshly computed assets into the previous snapshot and write it; returns {path: bytes}."""
+    records = load_records(out_dir)
+    records.update(asset_records(panels, names))
+    for t, rec in records.items():
+        rec["name"] = names.get(t, rec["name"])
+    return write(snapshot(records, order, tuple(panels) or ("D", "W", "M")), out_dir)
@@ -0,0 +1,253 @@
+"""
+Streaming indicator updates (live BTC without re-running the pipeline).
+
+`IndicatorState` keeps, per asset, only what the next bar needs:
+  * the RSI's EWM gain/loss accumulators and the previous close,
+  * the daily closes of the last 90 calendar days, for MA_90,
+  * the UT Bot's ATR sums, stop and trend (ut_bot.UTBotState).
+RSI, ATR and the UT Bot use the same arithmetic, in the same order, as the
+batch kernels in indicator_panel, so they equal the dashboard's exactly.
+MA_90 is the same true 90-calendar-day mean of daily closes as
+timeframes.calendar_ma (equal up to float rounding), so it is the number
+the cards, the history store and the signals API show.
+
+Ticks arrive from a pluggable source (`replay_file`, `socket_source`, or
+any iterable of (timestamp, price)). `BarStream` folds them into the
+current bar, re-evaluates that forming bar on every tick and reports
+whenever the strategy signal changes.
+
+    python streaming.py ticks.csv          # replay a file
+    python streaming.py --socket host:port  # newline-delimited ticks
+"""
+import argparse
+import json
+import socket
+import sys
+import time
+from collections import deque
+
+import numpy as np
+import pandas as pd
+
+from indicator_panel import RSI_PERIOD, ATR_PERIOD, ATR_MULT
+from signals import SIGNAL_RULES, signal_for_row
+from timeframes import period_ends, WEEK, MA_DAYS
+from ut_bot import UTBotState
+
+
+# 1. INCREMENTAL KERNELS
+def day_number(ts):
+    """Days since 1970-01-01, as timeframes uses for calendar windows."""
+    return pd.Timestamp(ts).value // 86_400_000_000_000
+
+
+class CalendarMean:
+    """timeframes.calendar_ma, one daily close at a time: mean close over the trailing `days` calendar days."""
+
+    def __init__(self, days=MA_DAYS):
+        self.days = days
+        self.window = deque()     # (day number, close), oldest first
+
+    def update(self, day, close):
+        """Set `day`'s close; a later close for the same day (the next tick) replaces it."""
+        if self.window and self.window[-1][0] == day:
+            self.window.pop()
+        self.window.append((day, close))
+        while self.window[0][0] <= day - self.days:
+            self.window.popleft()
+
+    def mean(self):
+        return sum(c for _, c in self.window) / len(self.window) if self.window else np.nan
+
+
+class EwmMean:
+    """indicator_panel.ewm_mean (adjust=False), one value at a time."""
+
+    def __init__(self, alpha, min_periods=0):
+        self.alpha = alpha
+        self.min_periods = min_periods
+        self.value = np.nan
+        self.count = 0
+
+    def update(self, x, commit=True):
+        value = x if self.count == 0 else (1 - self.alpha) * self.value + self.alpha * x
+        if commit:
+            self.value = value
+            self.count += 1
+        return value if self.count + (not commit) >= self.min_periods else np.nan
+
+
+# 2. PER-ASSET STATE
+class IndicatorState:
+    """RSI, 90-day MA, ATR and UT Bot for one asset; feed (high, low, close) bars and daily closes."""
+
+    def __init__(self, rsi_period=RSI_PERIOD, ma_days=MA_DAYS, atr_period=ATR_PERIOD, atr_mult=ATR_MULT,
+                 rules=SIGNAL_RULES):
+        self.gain = EwmMean(1 / rsi_period, min_periods=rsi_period)
+        self.loss = EwmMean(1 / rsi_period, min_periods=rsi_period)
+        self.ma = CalendarMean(ma_days)
+        self.ut = UTBotState(atr_period, atr_mult)
+        self.prev_close = np.nan
+        self.rules = rules
+
+    @classmethod
+    def from_frame(cls, df, daily=None, **params):
+        """Seed from an OHLC frame (e.g. weekly_bars output) by replaying it once; `daily` seeds the 90-day MA."""
+        state = cls(**params)
+        for h, l, c in zip(df["High"].to_numpy(float), df["Low"].to_numpy(float), df["Close"].to_numpy(float)):
+            state.update((h, l, c))
+        if daily is not None:
+            for day, c in zip(daily.index.values.astype("datetime64[D]").astype(np.int64), daily["Close"].to_numpy(float)):
+                state.ma.update(int(day), c)
+        return state
+
+    def update(self, bar, commit=True, day=None):
+        """New bar -> {field: value, "Signal": label}; commit=False just evaluates a forming bar.
+
+        `day` (day_number of the bar's latest close) also records that close as the day's close for MA_90.
+        """
+        high, low, close = (np.float64(x) for x in bar)
+        if day is not None:
+            self.ma.update(day, close)
+        delta = close - self.prev_close
+        gain = self.gain.update(delta if delta > 0 else 0.0, commit)
+        loss = self.loss.update(-delta if delta < 0 else 0.0, commit)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rsi = 100 - (100 / (1 + gain / loss))
+        stop, trend, flip = self.ut.update((high, low, close), commit)
+        row = {
+            "Close": close,
+            "RSI_2": rsi,
+            "MA_90": self.ma.mean(),
+            "ATR": self.ut.last_atr,
+            "UT_Stop": stop,
+            "UT_Trend": trend,
+            "UT_Signal": flip,
+        }
+        if commit:
+            self.prev_close = close
+        row["Signal"], row["Signal_Color"] = signal_for_row(row, self.rules)
+        return row
+
+
+# 3. TICK SOURCES: iterables of (timestamp, price)
+def _parse(line):
+    line = line.strip()
+    if not line or line.startswith("#"):
+        return None
+    if line.startswith("{"):
+        d = json.loads(line)
+        return pd.Timestamp(d["ts"]), float(d["price"])
+    ts, price = line.split(",")[:2]
+    return pd.Timestamp(ts), float(price)
+
+
+def replay_file(path, speed=0.0):
+    """Ticks from a CSV ("timestamp,price") or NDJSON ({"ts", "price"}) file.
+
+    speed > 0 sleeps to replay at that multiple of real time.
+    """
+    prev = None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            tick = _parse(line)
+            if tick is None:
+                continue
+            if speed > 0 and prev is not None:
+                time.sleep(max(0.0, (tick[0] - prev).total_seconds() / speed))
+            prev = tick[0]
+            yield tick
+
+
+def socket_source(host, port):
+    """Newline-delimited ticks from a TCP socket (stand-in for an exchange feed)."""
+    with socket.create_connection((host, port)) as conn, conn.makefile("r", encoding="utf-8") as f:
+        for line in f:
+            tick = _parse(line)
+            if tick is not None:
+                yield tick
+
+
+# 4. TICKS -> BARS -> SIGNAL CHANGES
+class BarStream:
+    """Folds ticks into `rule` bars on top of an IndicatorState and reports signal changes."""
+
+    def __init__(self, ticker, state, rule=WEEK, bar=None, period=None, last_signal=None):
+        self.ticker = ticker
+        self.state = state
+        self.rule = rule
+        self.bar = bar          # forming [open, high, low, close]
+        self.period = period    # its period-end day
+        self.signal = last_signal
+
+    @classmethod
+    def from_history(cls, ticker, df, rule=WEEK, daily=None, **params):
+        """Seed from OHLC bars (and the daily bars behind them, for MA_90); the last bar stays open so live ticks extend it."""
+        state = IndicatorState.from_frame(df.iloc[:-1], daily, **params)
+        last = df.iloc[-1]
+        period = int(period_ends(df.index[-1:], rule)[0])
+        stream = cls(ticker, state, rule, [last["Open"], last["High"], last["Low"], last["Close"]], period)
+        stream.signal = state.update(stream.bar[1:], commit=False)["Signal"]
+        return stream
+
+    def on_tick(self, ts, price):
+        """Apply one tick; returns a change event dict or None."""
+        period = int(period_ends(pd.DatetimeIndex([ts]), self.rule)[0])
+        if self.bar is not None and period != self.period:
+            self.state.update(self.bar[1:])          # previous bar is final now
+            self.bar = None
+        if self.bar is None:
+            self.bar, self.period = [price, price, price, price], period
+        else:
+            self.bar[1] = max(self.bar[1], price)
+            self.bar[2] = min(self.bar[2], price)
+            self.bar[3] = price
+
+        row = self.state.update(self.bar[1:], commit=False, day=day_number(ts))
+        if row["Signal"] == self.signal:
+            return None
+        event = {"ticker": self.ticker, "ts": str(ts), "from": self.signal, "to": row["Signal"],
+                 "price": float(price), "rsi": float(row["RSI_2"])}
+        self.signal = row["Signal"]
+        return event
+
+
+def run_stream(stream, ticks, emit=None):
+    emit = emit or (lambda e: print(f"🔔 {e['ts']} {e['ticker']}: {e['from']} -> {e['to']} "
+                                    f"@ {e['price']:.2f} (RSI {e['rsi']:.1f})", flush=True))
+    n = 0
+    for ts, price in ticks:
+        n += 1
+        event = stream.on_tick(ts, price)
+        if event:
+            emit(event)
+    return n
+
+
+if __name__ == "__main__":
+    from bar_cache import BarCache
+    from main_production import weekly_bars
+
+    ap = argparse.ArgumentParser(description="Stream live signal changes for one asset")
+    ap.add_argument("file", nargs="?", help="tick file to replay (CSV timestamp,price or NDJSON)")
+    ap.add_argument("--socket", help="host:port sending newline-delimited ticks")
+    ap.add_argument("--ticker", default="BTC-USD")
+    ap.add_argument("--speed", type=float, default=0.0, help="replay speed multiple (0 = as fast as possible)")
+    args = ap.parse_args()
+    if not args.file and not args.socket:
+        ap.error("give a tick file or --socket host:port")
+
+    frames, failures = BarCache().load([args.ticker], period="1y", interval="1d")
+    if args.ticker not in frames:
+        sys.exit(f"❌ No history for {args.ticker}: {failures.get(args.ticker)}")
+    stream = BarStream.from_history(args.ticker, weekly_bars(frames[args.ticker]), daily=frames[args.ticker])
+    print(f"📡 {args.ticker} seeded from {len(frames[args.ticker])} daily bars; current signal {stream.signal}")
+
+    if args.socket:
+        host, port = args.socket.rsplit(":", 1)
+        ticks = socket_source(host, int(port))
+    else:
+        ticks = replay_file(args.file, args.speed)
+    t0 = time.perf_counter()
+    n = run_stream(stream, ticks)
+    print(f"✅ {n} ticks in {time.perf_counter() - t0:.2f}s")
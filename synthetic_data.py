@@ -0,0 +1,156 @@
+"""
+Deterministic local stand-in for yf.download.
+
+Generates a reproducible random-walk OHLCV history per ticker and returns it
+in the same shapes yfinance does, with a configurable simulated round-trip
+latency so fetch strategies can be compared offline. RecordedSource does the
+same from real bars saved earlier (e.g. the .cache/bars parquet files).
+
+Also the inputs and references the tests and benchmarks share: raw
+high/low/close arrays, weekly universes, tick streams and the original
+per-frame pandas indicators.
+"""
+import glob
+import os
+import time
+import zlib
+
+import numpy as np
+import pandas as pd
+
+PERIOD_DAYS = {"1mo": 31, "3mo": 92, "6mo": 183, "1y": 366, "2y": 731, "5y": 1827, "10y": 3653}
+
+
+def _is_24x7(ticker):
+    return ticker.endswith("-USD")
+
+
+def synthetic_ohlcv(ticker, days=366, end="2026-01-30"):
+    """Reproducible daily OHLCV frame for one ticker."""
+    rng = np.random.default_rng(zlib.crc32(ticker.encode()))
+    freq = "D" if _is_24x7(ticker) else "B"
+    idx = pd.date_range(end=pd.Timestamp(end), periods=days if freq == "D" else days * 5 // 7, freq=freq)
+    n = len(idx)
+
+    start = 10 ** rng.uniform(1, 4)
+    close = start * np.exp(np.cumsum(rng.normal(0.0003, 0.015, n)))
+    open_ = np.r_[close[0], close[:-1]] * np.exp(rng.normal(0, 0.003, n))
+    spread = np.abs(rng.normal(0, 0.008, n)) * close
+    high = np.maximum(open_, close) + spread
+    low = np.minimum(open_, close) - spread
+    volume = rng.integers(1_000, 1_000_000, n).astype(float)
+
+    return pd.DataFrame({"Open": open_, "High": high, "Low": low, "Close": close, "Volume": volume}, index=idx)
+
+
+class SyntheticSource:
+    """Callable with yf.download's signature for the arguments we use."""
+
+    def __init__(self, latency=0.25, per_ticker=0.005, failing=()):
+        self.latency = latency
+        self.per_ticker = per_ticker
+        self.failing = set(failing)
+        self.calls = 0
+
+    def __call__(self, tickers, period="1y", interval="1d", group_by="column", progress=False, start=None, **kwargs):
+        self.calls += 1
+        symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+        time.sleep(self.latency + self.per_ticker * len(symbols))
+
+        days = PERIOD_DAYS.get(period, 366)
+        frames = {}
+        for t in symbols:
+            if t in self.failing:
+                frames[t] = pd.DataFrame(np.nan, index=pd.DatetimeIndex([]), columns=["Open", "High", "Low", "Close", "Volume"])
+            else:
+                df = synthetic_ohlcv(t, days)
+                frames[t] = df[df.index >= pd.Timestamp(start)] if start else df
+
+        return as_download(frames, group_by)
+
+
+def as_download(frames, group_by="column"):
+    """{ticker: OHLCV frame} -> yf.download's MultiIndex-column frame."""
+    raw = pd.concat(frames, axis=1, names=["Ticker", "Price"])
+    if group_by != "ticker":
+        raw = raw.swaplevel(axis=1).sort_index(axis=1, level=0, sort_remaining=False)
+        raw.columns.names = ["Price", "Ticker"]
+    return raw
+
+
+class RecordedSource:
+    """yf.download stand-in replaying recorded daily bars from a directory of parquet/CSV files.
+
+    Ticker i of any universe gets recording i % len(recordings) (sorted by
+    file name), so N tickers can be served from a handful of real series.
+    """
+
+    def __init__(self, root, latency=0.0, per_ticker=0.0):
+        paths = sorted(glob.glob(os.path.join(root, "*.parquet")) + glob.glob(os.path.join(root, "*.csv")))
+        if not paths:
+            raise FileNotFoundError(f"no .parquet or .csv bars in {root}")
+        self.recordings = [pd.read_parquet(p) if p.endswith(".parquet") else pd.read_csv(p, index_col=0, parse_dates=True)
+                           for p in paths]
+        self.latency = latency
+        self.per_ticker = per_ticker
+        self.assigned = {}
+        self.calls = 0
+
+    def __call__(self, tickers, period="1y", interval="1d", group_by="column", progress=False, start=None, **kwargs):
+        self.calls += 1
+        symbols = [tickers] if isinstance(tickers, str) else list(tickers)
+        time.sleep(self.latency + self.per_ticker * len(symbols))
+
+        days = PERIOD_DAYS.get(period, 366)
+        frames = {}
+        for t in symbols:
+            i = self.assigned.setdefault(t, len(self.assigned))
+            df = self.recordings[i % len(self.recordings)]
+            df = df[df.index > df.index[-1] - pd.Timedelta(days=days)]
+            frames[t] = df[df.index >= pd.Timestamp(start)] if start else df
+        return as_download(frames, group_by)
+
+
+# --- shared by tests/ and benchmarks/ ---
+
+def random_bars(n_bars, n_assets, seed=7):
+    """(high, low, close) random-walk arrays of shape (n_bars, n_assets)."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.02, (n_bars, n_assets)), axis=0))
+    spread = np.abs(rng.normal(0, 0.01, close.shape)) * close
+    return close + spread, close - spread, close
+
+
+def weekly_universe(n_assets, days=366):
+    frames = {}
+    for i in range(n_assets):
+        t = "BTC-USD" if i == 0 else f"SYM{i:04d}.NS"
+        d = synthetic_ohlcv(t, days)
+        frames[t] = d.resample('W-FRI').agg({'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last'}).dropna()
+    return frames
+
+
+def daily_ticks(daily):
+    # Four ticks a day that reproduce each daily bar's open/high/low/close
+    for ts, (o, h, l, c) in zip(daily.index, daily[["Open", "High", "Low", "Close"]].to_numpy()):
+        for hours, price in ((0, o), (6, h), (12, l), (18, c)):
+            yield ts + pd.Timedelta(hours=hours), price
+
+
+def legacy_calculate_indicators(df):
+    # The original per-DataFrame implementation, kept as the reference
+    # (UT_Stop is left out: the old close - 2*ATR line was not a trailing stop)
+    delta = df['Close'].diff()
+    gain = (delta.where(delta > 0, 0)).fillna(0)
+    loss = (-delta.where(delta < 0, 0)).fillna(0)
+    avg_gain = gain.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
+    avg_loss = loss.ewm(min_periods=2, adjust=False, alpha=1/2).mean()
+    rs = avg_gain / avg_loss
+    df['RSI_2'] = 100 - (100 / (1 + rs))
+    df['MA_90'] = df['Close'].rolling(window=13).mean()
+    h_l = df['High'] - df['Low']
+    h_pc = abs(df['High'] - df['Close'].shift(1))
+    l_pc = abs(df['Low'] - df['Close'].shift(1))
+    tr = pd.concat([h_l, h_pc, l_pc], axis=1).max(axis=1)
+    df['ATR'] = tr.rolling(10).mean()
+    return df
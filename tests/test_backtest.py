@@ -0,0 +1,36 @@
+"""Backtest fill timing on a toy panel."""
+import numpy as np
+import pandas as pd
+
+from backtest import run_backtest
+from indicator_panel import Panel
+from signals import SIGNAL_RULES, labels
+
+
+def toy_panel(closes, signals):
+    wait = len(SIGNAL_RULES)
+    codes = np.array([labels().index(s) if s else wait for s in signals], dtype=np.int8)[:, None]
+    close = np.array(closes, dtype=float)[:, None]
+    return Panel(pd.date_range("2024-01-05", periods=len(closes), freq="W-FRI"), ["X"],
+                 {"Close": close, "Signal": codes})
+
+
+def equity(panel, **kwargs):
+    return run_backtest(panel, cost_bps=0, **kwargs)[1]["X"].to_numpy()
+
+
+def test_signal_fills_at_the_next_close():
+    # AGGRESSIVE ADD at bar 1's close (100); the fill is bar 2's close (200), so the jump is not earned
+    panel = toy_panel([100, 100, 200, 220], [None, "⚡ AGGRESSIVE ADD", None, None])
+    np.testing.assert_allclose(equity(panel), [1, 1, 1, 1.1])
+
+
+def test_fill_lag_zero_fills_at_the_signal_close():
+    panel = toy_panel([100, 100, 200, 220], [None, "⚡ AGGRESSIVE ADD", None, None])
+    np.testing.assert_allclose(equity(panel, fill_lag=0), [1, 1, 2, 2.2])
+
+
+def test_book_profit_exits_a_bar_later():
+    panel = toy_panel([100, 100, 110, 121, 60, 60], ["⚡ AGGRESSIVE ADD", None, None, "🔴 BOOK PROFIT", None, None])
+    # In from bar 1's close; out at bar 4's close, so bar 4's drop is still held
+    np.testing.assert_allclose(equity(panel), [1, 1, 1.1, 1.21, 0.6, 0.6])
@@ -0,0 +1,15 @@
+"""Vectorized indicator panel vs the original per-DataFrame pandas code."""
+import numpy as np
+
+from indicator_panel import indicators_for_frames
+from synthetic_data import legacy_calculate_indicators, weekly_universe
+
+
+def test_panel_matches_pandas_reference():
+    frames = weekly_universe(50)
+    panel = indicators_for_frames(frames)
+    for t, df in frames.items():
+        got = panel.frame(t)
+        want = legacy_calculate_indicators(df.copy())
+        for c in ("RSI_2", "MA_90", "ATR"):
+            np.testing.assert_allclose(got[c].to_numpy(), want[c].to_numpy(), rtol=1e-9, equal_nan=True, err_msg=f"{t} {c}")
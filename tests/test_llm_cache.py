@@ -0,0 +1,102 @@
+"""Response cache behaviour against the offline FakeClient."""
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from google.genai import errors
+
+import llm_cache
+from llm_cache import CachedClient, FakeClient, ResponseCache
+
+MODEL = "gemini-2.0-flash"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(str(tmp_path / "llm.sqlite"), ttl=3600)
+
+
+def ask(client, prompt="Nifty 50 vs its 90-day MA?", **kwargs):
+    return client.models.generate_content(model=MODEL, contents=prompt, **kwargs).text
+
+
+def ask_concurrently(client, n=8):
+    with ThreadPoolExecutor(n) as pool:
+        futures = [pool.submit(ask, client) for _ in range(n)]
+        return [f.result(timeout=10) for f in futures]
+
+
+def test_concurrent_identical_calls_make_one_api_call(cache):
+    fake = FakeClient(latency=0.2)
+    texts = ask_concurrently(CachedClient(fake, cache))
+    assert fake.calls == 1
+    assert len(set(texts)) == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_served_from_cache_until_the_ttl_expires(cache, monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: clock[0])
+    fake = FakeClient()
+    client = CachedClient(fake, cache)
+    ask(client)
+    clock[0] += 3599
+    ask(CachedClient(fake, cache))      # a later run within the TTL
+    assert fake.calls == 1
+    clock[0] += 2
+    ask(client)
+    assert fake.calls == 2
+
+
+def test_evict_drops_expired_rows(cache, monkeypatch):
+    clock = [1_000_000.0]
+    monkeypatch.setattr(llm_cache.time, "time", lambda: clock[0])
+    client = CachedClient(FakeClient(), cache)
+    ask(client, "short", ttl=10)
+    ask(client, "long")
+    clock[0] += 11
+    assert cache.evict() == 1
+
+
+def test_failures_are_not_cached(cache):
+    fake = FakeClient(fail_rate=1.0)
+    client = CachedClient(fake, cache)
+    with pytest.raises(errors.ClientError):
+        ask(client)
+    fake.fail_rate = 0.0
+    assert ask(client)
+    assert fake.calls == 2
+    assert ask(client) and fake.calls == 2
+
+
+def test_concurrent_callers_share_a_failure(cache):
+    fake = FakeClient(latency=0.5, fail_rate=1.0)
+    with ThreadPoolExecutor(4) as pool:
+        futures = [pool.submit(ask, CachedClient(fake, cache)) for _ in range(4)]
+        for f in futures:
+            with pytest.raises(errors.ClientError):
+                f.result(timeout=10)
+    assert fake.calls == 1
+
+
+def test_failed_put_does_not_block_waiters(cache, monkeypatch):
+    def locked(*args, **kwargs):
+        raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(cache, "put", locked)
+    fake = FakeClient(latency=0.5)
+    texts = ask_concurrently(CachedClient(fake, cache), n=4)
+    assert fake.calls == 1
+    assert len(set(texts)) == 1
+    ask(CachedClient(fake, cache))      # nothing was stored, so this one goes upstream
+    assert fake.calls == 2
+
+
+def test_chat_turns_are_cached_with_their_history(cache):
+    fake = FakeClient()
+    for _ in range(2):
+        chat = CachedClient(fake, cache).chats.create(model=MODEL)
+        chat.send_message("hello")
+        chat.send_message("and Bitcoin?")
+    assert fake.calls == 2
+    assert len(chat.get_history()) == 4
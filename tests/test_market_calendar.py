@@ -0,0 +1,92 @@
+"""Refresh windows per venue, with fixed clocks."""
+import json
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from market_calendar import Scheduler, group_tickers, refreshed_groups
+
+IST = ZoneInfo("Asia/Kolkata")
+HOUR = timedelta(hours=1)
+
+
+def ist(day, hh, mm=0, ss=0):
+    return datetime(2025, 10, day, hh, mm, ss, tzinfo=IST)
+
+
+@pytest.fixture
+def sched(tmp_path):
+    holidays = tmp_path / "holidays.json"
+    holidays.write_text(json.dumps({"INDIA": ["2025-10-02"]}), encoding="utf-8")    # Gandhi Jayanti, a Thursday
+    return Scheduler(state_path=str(tmp_path / "schedule.json"), holidays_path=str(holidays))
+
+
+def test_never_refreshed_is_due(sched):
+    assert sched.is_due("NSE", ist(4, 12))      # even on a Saturday
+
+
+def test_nse_open_refreshes_hourly(sched):
+    sched.last["NSE"] = ist(6, 9, 20)           # Monday, just after the open
+    assert not sched.is_due("NSE", ist(6, 9, 50))
+    assert sched.is_due("NSE", ist(6, 10, 20))
+    assert sched.next_refresh_due("NSE", ist(6, 9, 50)) == ist(6, 10, 10)
+
+
+def test_nse_open_close_boundaries(sched):
+    assert sched.venues["NSE"].is_open(ist(6, 9, 15))
+    assert not sched.venues["NSE"].is_open(ist(6, 9, 14, 59))
+    assert not sched.venues["NSE"].is_open(ist(6, 15, 30))
+
+
+def test_nse_refreshes_once_after_the_close_settles(sched):
+    sched.last["NSE"] = ist(6, 15, 0)
+    assert not sched.is_due("NSE", ist(6, 15, 40))                 # closed, bar not settled yet
+    assert sched.next_refresh_due("NSE", ist(6, 15, 40)) == ist(6, 15, 50)
+    assert sched.is_due("NSE", ist(6, 15, 50))
+    sched.last["NSE"] = ist(6, 15, 50)
+    assert not sched.is_due("NSE", ist(6, 22))
+    assert sched.next_refresh_due("NSE", ist(6, 22)) == ist(7, 9, 15)
+
+
+def test_last_open_refresh_is_capped_at_the_settle(sched):
+    sched.last["NSE"] = ist(6, 15, 0)
+    assert sched.next_refresh_due("NSE", ist(6, 15, 10)) == ist(6, 15, 50)
+
+
+def test_holiday_and_weekend_skip_to_the_next_session(sched):
+    sched.last["NSE"] = ist(1, 15, 50)          # Wednesday's settled bar
+    assert not sched.is_due("NSE", ist(2, 11))  # holiday
+    assert sched.next_refresh_due("NSE", ist(2, 11)) == ist(3, 9, 15)
+    sched.last["NSE"] = ist(3, 15, 50)          # Friday's settled bar
+    assert not sched.is_due("NSE", ist(4, 11))
+    assert sched.next_refresh_due("NSE", ist(4, 11)) == ist(6, 9, 15)
+
+
+def test_crypto_hourly_with_slack(sched):
+    start = datetime(2025, 10, 4, 12, 0, tzinfo=timezone.utc)
+    sched.last["CRYPTO"] = start
+    assert not sched.is_due("CRYPTO", start + timedelta(minutes=30))
+    assert sched.is_due("CRYPTO", start + HOUR - timedelta(seconds=3))     # cron a few seconds early
+    assert sched.is_due("CRYPTO", start + HOUR - sched.slack)
+    assert not sched.is_due("CRYPTO", start + HOUR - sched.slack - timedelta(seconds=1))
+    assert sched.next_refresh_due("CRYPTO", start + timedelta(minutes=30)) == start + HOUR - sched.slack
+
+
+def test_mark_refreshed_persists(sched, tmp_path):
+    now = ist(6, 10)
+    sched.mark_refreshed(["NSE", "CRYPTO"], now=now)
+    again = Scheduler(state_path=sched.state_path, holidays_path=str(tmp_path / "holidays.json"))
+    assert again.last == {"NSE": now, "CRYPTO": now}
+
+
+def test_refreshed_groups_skips_an_outage():
+    groups = group_tickers(["^NSEI", "GOLDBEES.NS", "BTC-USD", "^BSESN"])
+    assert groups == {"NSE": ["^NSEI", "GOLDBEES.NS"], "CRYPTO": ["BTC-USD"], "BSE": ["^BSESN"]}
+    due = ["NSE", "CRYPTO", "BSE"]
+    frames = {"^NSEI": None, "GOLDBEES.NS": None, "BTC-USD": None, "^BSESN": None}
+    # Crypto's top-up failed (stale cached bars only) and BSE returned nothing at all
+    got = refreshed_groups(groups, due, {t: f for t, f in frames.items() if t != "^BSESN"}, topup_failures={"BTC-USD": "timeout"})
+    assert got == ["NSE"]
+    # One NSE ticker is enough for the group to count as refreshed
+    assert refreshed_groups(groups, ["NSE"], frames, topup_failures={"^NSEI": "timeout"}) == ["NSE"]
@@ -0,0 +1,26 @@
+"""Local valuation of USD-quoted assets in INR."""
+from datetime import datetime, timezone
+
+import pandas as pd
+
+from portfolio import value_assets
+
+NOW = datetime(2025, 10, 6, 12, tzinfo=timezone.utc)
+FX = pd.Series([88.0, 88.5], index=pd.DatetimeIndex(["2025-10-02", "2025-10-03"]))
+
+
+def btc(day, close=100.0):
+    return {"BTC-USD": pd.DataFrame({"Close": [close]}, index=pd.DatetimeIndex([day]))}
+
+
+def test_usd_asset_uses_the_same_day_or_earlier_rate():
+    (_, _, price, _, status), = value_assets({"Bitcoin": "BTC-USD"}, btc("2025-10-03"), FX, NOW)
+    assert price == 8850.0 and "USDINR 88.50" in status
+    (_, _, price, _, _), = value_assets({"Bitcoin": "BTC-USD"}, btc("2025-10-05"), FX, NOW)    # Sunday
+    assert price == 8850.0
+
+
+def test_no_rate_on_or_before_the_bar_is_reported():
+    (_, _, price, _, status), = value_assets({"Bitcoin": "BTC-USD"}, btc("2025-10-01"), FX, NOW)
+    assert price is None
+    assert status == "⚠️ no USDINR rate for Oct 1, 2025"
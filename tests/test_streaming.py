@@ -0,0 +1,50 @@
+"""Streaming IndicatorState vs the batch Timeframes panel the dashboard shows."""
+import numpy as np
+
+from main_production import weekly_bars
+from streaming import IndicatorState, BarStream, run_stream
+from timeframes import Timeframes, period_ends, WEEK
+from synthetic_data import synthetic_ohlcv, daily_ticks
+
+N_WEEKS = 260
+FIELDS = ("RSI_2", "MA_90", "ATR", "UT_Stop")
+
+
+def batch_frame(daily):
+    return Timeframes({"BTC-USD": daily}).panel(WEEK).frame("BTC-USD")
+
+
+def test_bar_by_bar_matches_batch():
+    # Each week's daily closes go to the 90-day MA before the week's bar
+    daily = synthetic_ohlcv("BTC-USD", days=N_WEEKS * 7)
+    weekly = weekly_bars(daily)
+    batch = batch_frame(daily)
+    state = IndicatorState()
+    weeks = period_ends(daily.index, WEEK)
+    days = daily.index.values.astype("datetime64[D]").astype(np.int64)
+    closes = daily["Close"].to_numpy(float)
+    rows = []
+    for label, bar in zip(period_ends(weekly.index, WEEK), weekly[["High", "Low", "Close"]].to_numpy()):
+        for i in np.flatnonzero(weeks == label):
+            state.ma.update(int(days[i]), closes[i])
+        rows.append(state.update(bar))
+    for f in FIELDS:
+        got = np.array([r[f] for r in rows])
+        if f == "MA_90":
+            np.testing.assert_allclose(got, batch[f].to_numpy(), rtol=1e-12)
+        else:
+            np.testing.assert_array_equal(got, batch[f].to_numpy())
+
+
+def test_tick_replay_lands_on_batch_last_bar():
+    daily = synthetic_ohlcv("BTC-USD", days=N_WEEKS * 7)
+    weekly = weekly_bars(daily)
+    batch = batch_frame(daily)
+    split = len(weekly) - 26
+    cut = weekly.index[split - 1]
+    stream = BarStream.from_history("BTC-USD", weekly.iloc[:split], daily=daily[daily.index <= cut])
+    n = run_stream(stream, list(daily_ticks(daily[daily.index > cut])), emit=lambda event: None)
+    assert n > 0
+    final = stream.state.update(stream.bar[1:], commit=False)
+    for f in FIELDS:
+        assert np.isclose(final[f], batch[f].iloc[-1], rtol=1e-12, equal_nan=True), f
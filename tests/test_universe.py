@@ -0,0 +1,34 @@
+"""Universe files -> Yahoo tickers."""
+from universe import load_universe, yahoo_ticker
+
+
+def test_yahoo_ticker_suffixes_bare_nse_symbols():
+    assert yahoo_ticker("reliance") == "RELIANCE.NS"
+    assert yahoo_ticker("BAJAJ-AUTO") == "BAJAJ-AUTO.NS"
+    assert yahoo_ticker("NAM-INDIA") == "NAM-INDIA.NS"
+    assert yahoo_ticker("M&M") == "M&M.NS"
+
+
+def test_yahoo_ticker_keeps_qualified_tickers():
+    for t in ("^NSEI", "BTC-USD", "ETH-INR", "GOLDBEES.NS", "500325.BO", "USDINR=X", "GC=F"):
+        assert yahoo_ticker(t) == t
+
+
+def test_load_universe_nifty500_csv(tmp_path):
+    path = tmp_path / "ind_nifty500list.csv"
+    path.write_text("Company Name,Industry,Symbol,Series,ISIN Code\n"
+                    "Bajaj Auto Ltd.,Automobile,BAJAJ-AUTO,EQ,INE917I01010\n"
+                    "Nippon Life India Asset Management Ltd.,Financial Services,NAM-INDIA,EQ,INE298J01013\n"
+                    "Reliance Industries Ltd.,Oil Gas,RELIANCE,EQ,INE002A01018\n"
+                    "Reliance again,Oil Gas,RELIANCE,EQ,INE002A01018\n", encoding="utf-8")
+    assert load_universe(str(path)) == {
+        "Bajaj Auto Ltd.": "BAJAJ-AUTO.NS",
+        "Nippon Life India Asset Management Ltd.": "NAM-INDIA.NS",
+        "Reliance Industries Ltd.": "RELIANCE.NS",
+    }
+
+
+def test_load_universe_txt(tmp_path):
+    path = tmp_path / "watch.txt"
+    path.write_text("# watchlist\nNifty 50,^NSEI\nBTC-USD\nBAJAJ-AUTO  # hyphenated NSE symbol\n", encoding="utf-8")
+    assert load_universe(str(path)) == {"Nifty 50": "^NSEI", "BTC-USD": "BTC-USD", "BAJAJ-AUTO.NS": "BAJAJ-AUTO.NS"}
@@ -0,0 +1,53 @@
+"""UT Bot kernel and incremental state vs a straight transcription of the Pine script."""
+import math
+
+import numpy as np
+
+from indicator_panel import atr
+from ut_bot import ut_bot, UTBotState
+from synthetic_data import random_bars
+
+
+def reference_ut_bot(close, atr_values, mult=2.0):
+    # Straight transcription of the Pine script, one bar at a time
+    stop, trend, signal = [], [], []
+    prev_stop, prev_src, prev_trend = 0.0, math.nan, 0
+    for src, a in zip(close, atr_values):
+        n = mult * a
+        if math.isnan(n):
+            stop.append(math.nan); trend.append(0); signal.append(0)
+            prev_stop, prev_src, prev_trend = 0.0, src, 0
+            continue
+        if src > prev_stop and prev_src > prev_stop: s = max(prev_stop, src - n)
+        elif src < prev_stop and prev_src < prev_stop: s = min(prev_stop, src + n)
+        elif src > prev_stop: s = src - n
+        else: s = src + n
+        t = 1 if src > s else -1
+        stop.append(s); trend.append(t)
+        signal.append(t if prev_trend not in (0, t) else 0)
+        prev_stop, prev_src, prev_trend = s, src, t
+    return np.array(stop), np.array(trend), np.array(signal)
+
+
+def test_kernel_matches_reference_loop():
+    high, low, close = random_bars(3000, 8)
+    a = atr(high, low, close, 10)
+    stop, trend, signal = ut_bot(close, a, 2.0)
+    assert (signal != 0).sum() > 100    # enough flips to mean something
+    for j in range(close.shape[1]):
+        ref = reference_ut_bot(close[:, j], a[:, j], 2.0)
+        np.testing.assert_allclose(stop[:, j], ref[0], rtol=1e-12, equal_nan=True)
+        np.testing.assert_array_equal(trend[:, j], ref[1])
+        np.testing.assert_array_equal(signal[:, j], ref[2])
+
+
+def test_update_matches_kernel_bar_by_bar():
+    # Bit-exact: the incremental ATR sums must land on the same state
+    high, low, close = random_bars(3000, 4)
+    stop, trend, signal = ut_bot(close, atr(high, low, close, 10), 2.0)
+    for j in range(close.shape[1]):
+        state = UTBotState(10, 2.0)
+        got = np.array([state.update((high[i, j], low[i, j], close[i, j])) for i in range(len(close))])
+        np.testing.assert_array_equal(got[:, 0], stop[:, j])
+        np.testing.assert_array_equal(got[:, 1], trend[:, j])
+        np.testing.assert_array_equal(got[:, 2], signal[:, j])
@@ -0,0 +1,132 @@
+"""
+Multi-timeframe bars and indicators from one daily load.
+
+Daily bars are stacked once into a Panel. Each timeframe (daily, weekly,
+monthly) is described by period-boundary row indices on that shared
+calendar, computed once per rule and reused. Resampling is then a few
+np.*.reduceat calls over the daily arrays, with no pandas groupby:
+  Open = first traded bar, High = fmax, Low = fmin, Close = last traded bar.
+
+The 90-day MA is a true 90-calendar-day mean of daily closes, so it is
+the same number whichever timeframe displays it, not a 13-week
+approximation.
+"""
+import numpy as np
+import pandas as pd
+
+from indicator_panel import Panel, stack_panel, compute_indicators, OHLC
+from signals import classify_panel
+
+WEEK = "W-FRI"
+MONTH = "ME"
+DAY = "D"
+MA_DAYS = 90
+
+_WEEKDAYS = {"MON": 0, "TUE": 1, "WED": 2, "THU": 3, "FRI": 4, "SAT": 5, "SUN": 6}
+
+
+def _days(index):
+    return index.values.astype("datetime64[D]").astype(np.int64)
+
+
+def period_ends(index, rule):
+    """Label (period-end day number) of every row, like resample(rule) with pandas' default labels."""
+    days = _days(index)
+    if rule == DAY:
+        return days
+    if rule.startswith("W-"):
+        weekday = (days + 3) % 7   # 1970-01-01 was a Thursday
+        return days + (_WEEKDAYS[rule[2:]] - weekday) % 7
+    if rule in ("ME", "M"):
+        month = index.values.astype("datetime64[M]")
+        return ((month + 1).astype("datetime64[D]") - 1).astype(np.int64)
+    raise ValueError(f"unsupported rule {rule!r}")
+
+
+def boundaries(index, rule):
+    """(starts, labels): first row of every period and its period-end timestamp."""
+    ends = period_ends(index, rule)
+    if len(ends) == 0:
+        return np.zeros(0, dtype=np.intp), pd.DatetimeIndex([])
+    starts = np.flatnonzero(np.r_[True, ends[1:] != ends[:-1]])
+    return starts, pd.DatetimeIndex(ends[starts].astype("datetime64[D]"))
+
+
+def resample_panel(panel, rule=WEEK, bounds=None, carry=()):
+    """OHLC bars for `rule` from a daily panel; `carry` fields are sampled at each period's last bar."""
+    starts, labels = bounds if bounds is not None else boundaries(panel.index, rule)
+    close = panel["Close"]
+    n, m = close.shape
+    if len(starts) == 0:
+        return Panel(labels, panel.tickers, {c: np.full((0, m), np.nan) for c in (*OHLC, *carry)})
+
+    rows = np.arange(n)[:, None]
+    traded = np.isfinite(close)
+    first = np.minimum.reduceat(np.where(traded, rows, n), starts, axis=0)
+    last = np.maximum.reduceat(np.where(traded, rows, -1), starts, axis=0)
+    has_bar = last >= 0
+    first, last = np.minimum(first, n - 1), np.maximum(last, 0)
+    cols = np.arange(m)
+
+    fields = {
+        "Open": panel["Open"][first, cols],
+        "High": np.fmax.reduceat(panel["High"], starts, axis=0),
+        "Low": np.fmin.reduceat(panel["Low"], starts, axis=0),
+        "Close": close[last, cols],
+    }
+    # Same as resample().agg().dropna(): a period missing any of OHLC is no bar
+    for c in OHLC:
+        has_bar &= np.isfinite(fields[c])
+    for c in carry:
+        fields[c] = panel[c][last, cols]
+    for c in fields:
+        fields[c] = np.where(has_bar, fields[c], np.nan)
+    return Panel(labels, panel.tickers, fields)
+
+
+def calendar_ma(close, index, days=MA_DAYS):
+    """Mean close over the trailing `days` calendar days (pandas rolling('90D')), per asset."""
+    d = _days(index)
+    left = np.searchsorted(d, d - days, side="right")
+    traded = np.isfinite(close)
+    csum = np.vstack([np.zeros((1, close.shape[1])), np.cumsum(np.where(traded, close, 0.0), axis=0, dtype=float)])
+    ccount = np.vstack([np.zeros((1, close.shape[1])), np.cumsum(traded, axis=0)])
+    end = np.arange(1, len(d) + 1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ma = (csum[end] - csum[left]) / (ccount[end] - ccount[left])
+    return np.where(traded, ma, np.nan)
+
+
+class Timeframes:
+    """Daily frames (or a daily Panel, e.g. from bar_store) in, indicator panels for any timeframe out (each built once)."""
+
+    def __init__(self, frames, ma_days=MA_DAYS):
+        self.daily = frames if isinstance(frames, Panel) else stack_panel(frames)
+        self.daily["MA_90D"] = calendar_ma(self.daily["Close"], self.daily.index, ma_days)
+        self._bounds = {}
+        self._panels = {}
+
+    def bounds(self, rule):
+        if rule not in self._bounds:
+            self._bounds[rule] = boundaries(self.daily.index, rule)
+        return self._bounds[rule]
+
+    def bars(self, rule=WEEK):
+        """OHLC panel for `rule` (plus the daily 90-day MA at each period's close)."""
+        if rule == DAY:
+            return Panel(self.daily.index, self.daily.tickers, dict(self.daily.fields))
+        return resample_panel(self.daily, rule, self.bounds(rule), carry=("MA_90D",))
+
+    def panel(self, rule=WEEK, **params):
+        """Indicators + signal codes for `rule`; MA_90 is the true 90-calendar-day MA."""
+        key = (rule, tuple(sorted(params.items())))
+        if key not in self._panels:
+            p = compute_indicators(self.bars(rule), **params)
+            p["MA_90"] = p.fields.pop("MA_90D")
+            self._panels[key] = classify_panel(p)
+        return self._panels[key]
+
+
+def resample_frame(df, rule=WEEK):
+    """Single-frame drop-in for df.resample(rule).agg({...}).dropna()."""
+    return resample_panel(stack_panel({"_": df}), rule).frame("_", list(OHLC))
@@ -0,0 +1,97 @@
+"""
+Which symbols the scripts work on.
+
+ASSETS is the dashboard's 11-asset portfolio (Yahoo tickers) and
+TV_SYMBOLS the same assets as TradingView widget symbols; every script
+imports them from here instead of keeping its own copy.
+
+load_universe() reads a larger universe for the screener from a file:
+  * .txt  - one ticker per line, optionally "name,ticker"; # starts a comment
+  * .csv  - a "Symbol"/"Ticker" column and an optional name column, e.g. the
+            index constituent lists NSE publishes (ind_nifty500list.csv);
+            bare NSE symbols get the ".NS" suffix Yahoo expects.
+"""
+import csv
+import os
+import re
+
+ASSETS = {
+    "Nifty 50": "^NSEI",
+    "Bitcoin": "BTC-USD",
+    "Gold BeES": "GOLDBEES.NS",
+    "Silver BeES": "SILVERBEES.NS",
+    "Junior BeES": "JUNIORBEES.NS",
+    "Smallcap 250": "HDFCSML250.NS",
+    "MON100": "MON100.NS",
+    "MAFANG": "MAFANG.NS",
+    "HangSeng BeES": "HNGSNGBEES.NS",
+    "MAHKTECH": "MAHKTECH.NS",
+    "Sensex": "^BSESN"
+}
+
+# Same assets for the TradingView widgets (main06/main07)
+TV_SYMBOLS = {
+    "Bitcoin": "BINANCE:BTCUSDT",
+    "Gold BeES": "NSE:GOLDBEES",
+    "Silver BeES": "NSE:SILVERBEES",
+    "Nifty 50": "NSE:NIFTY",
+    "Sensex": "BSE:SENSEX",
+    "Smallcap 250": "NSE:HDFCSML250",
+    "Junior BeES": "NSE:JUNIORBEES",
+    "MON100": "NSE:MON100",
+    "MAFANG": "NSE:MAFANG",
+    "HangSeng BeES": "NSE:HNGSNGBEES",
+    "MAHKTECH": "NSE:MAHKTECH"
+}
+
+TICKER_COLUMNS = ("ticker", "symbol", "yahoo")
+NAME_COLUMNS = ("name", "company name", "company", "asset")
+
+
+# Already a Yahoo ticker: index (^NSEI), exchange suffix (X.BO, X.L), FX/futures (USDINR=X, GC=F)
+# or a crypto pair (BTC-USD). NSE symbols can contain "-" themselves (BAJAJ-AUTO, NAM-INDIA).
+QUALIFIED = re.compile(r"^\^|\.[A-Z]{1,3}$|=[A-Z]$|-(USD|USDT|INR|EUR|GBP|BTC|ETH)$")
+
+
+def yahoo_ticker(symbol, suffix=".NS"):
+    """Bare exchange symbols get `suffix`; anything already qualified (^NSEI, BTC-USD, X.BO) is kept."""
+    symbol = symbol.strip().upper()
+    if not symbol or QUALIFIED.search(symbol):
+        return symbol
+    return symbol + suffix
+
+
+def _from_csv(f, suffix):
+    reader = csv.DictReader(f)
+    columns = {c.strip().lower(): c for c in reader.fieldnames or []}
+    tcol = next((columns[c] for c in TICKER_COLUMNS if c in columns), None)
+    if tcol is None:
+        raise ValueError(f"no ticker column (one of {', '.join(TICKER_COLUMNS)}) in {reader.fieldnames}")
+    ncol = next((columns[c] for c in NAME_COLUMNS if c in columns), None)
+    for row in reader:
+        ticker = yahoo_ticker(row[tcol] or "", suffix)
+        if ticker:
+            yield (row[ncol].strip() if ncol and row[ncol] else ticker), ticker
+
+
+def _from_txt(f, suffix):
+    for line in f:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        name, _, ticker = line.rpartition(",")
+        ticker = yahoo_ticker(ticker, suffix)
+        yield (name.strip() or ticker), ticker
+
+
+def load_universe(path, suffix=".NS"):
+    """{name: ticker} from a universe file, de-duplicated by ticker, in file order."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        rows = _from_csv(f, suffix) if os.path.splitext(path)[1].lower() == ".csv" else _from_txt(f, suffix)
+        universe, seen = {}, set()
+        for name, ticker in rows:
+            if ticker in seen:
+                continue
+            seen.add(ticker)
+            universe[name if name not in universe else f"{name} ({ticker})"] = ticker
+    return universe
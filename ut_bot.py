@@ -0,0 +1,137 @@
+"""
+UT Bot ATR trailing stop.
+
+The stop only ratchets in the direction of the trend: while price stays
+above it, it can only rise (max of the old stop and close - mult*ATR);
+while price stays below it, it can only fall. Crossing the stop flips the
+trend and emits a buy/sell signal.
+
+`ut_bot` is the batch kernel: linear in the number of bars and vectorized
+across assets (columns). `UTBotState` is the incremental form for live
+refreshes; it holds just enough state to process one new bar in O(1).
+"""
+from collections import deque
+
+import numpy as np
+
+ATR_PERIOD = 10
+ATR_MULT = 2.0
+
+BUY, SELL = 1, -1
+
+
+def ut_bot(close, atr, mult=ATR_MULT):
+    """Trailing stop, trend (+1/-1, 0 before ATR is ready) and flip signals.
+
+    close and atr are (time,) or (time, assets) arrays. Bars where ATR is
+    NaN produce a NaN stop; the stop starts on the first valid ATR bar.
+    """
+    close = np.asarray(close, dtype=float)
+    one_d = close.ndim == 1
+    src = close.reshape(len(close), -1)
+    loss = (mult * np.asarray(atr, dtype=float)).reshape(src.shape)
+
+    stop = np.full(src.shape, np.nan)
+    trend = np.zeros(src.shape, dtype=np.int8)
+    signal = np.zeros(src.shape, dtype=np.int8)
+
+    prev_stop = np.zeros(src.shape[1])   # Pine's nz(stop[1])
+    prev_src = np.full(src.shape[1], np.nan)
+    prev_trend = np.zeros(src.shape[1], dtype=np.int8)
+
+    for i in range(len(src)):
+        s, n = src[i], loss[i]
+        up = (s > prev_stop) & (prev_src > prev_stop)
+        down = (s < prev_stop) & (prev_src < prev_stop)
+        cur = np.where(up, np.maximum(prev_stop, s - n),
+              np.where(down, np.minimum(prev_stop, s + n),
+              np.where(s > prev_stop, s - n, s + n)))
+
+        ready = ~np.isnan(cur)
+        # With mult * ATR > 0 the construction above puts close strictly on one side of the stop
+        cur_trend = np.where(ready, np.where(s > cur, BUY, SELL), 0)
+        flipped = (prev_trend != 0) & (cur_trend != prev_trend) & ready
+
+        stop[i] = cur
+        trend[i] = cur_trend
+        signal[i] = np.where(flipped, cur_trend, 0)
+
+        prev_stop = np.where(ready, cur, 0.0)
+        prev_src = s
+        prev_trend = trend[i]
+
+    if one_d:
+        return stop[:, 0], trend[:, 0], signal[:, 0]
+    return stop, trend, signal
+
+
+class UTBotState:
+    """Incremental UT Bot for one asset: feed bars with update()."""
+
+    def __init__(self, atr_period=ATR_PERIOD, mult=ATR_MULT):
+        self.atr_period = atr_period
+        self.mult = mult
+        # Running TR sums, differenced like indicator_panel.rolling_mean's cumsum
+        # so ATR (and hence the stop) matches the batch kernel bit for bit
+        self.tr_sums = deque([0.0], maxlen=atr_period + 1)
+        self.bars = 0
+        self.prev_close = np.nan
+        self.stop = 0.0        # Pine's nz(stop[1]) before the first valid bar
+        self.trend = 0
+        self.last_atr = np.nan # ATR of the last bar passed to update(), committed or not
+
+    @classmethod
+    def from_history(cls, high, low, close, atr_period=ATR_PERIOD, mult=ATR_MULT):
+        """Seed from arrays by replaying them (one O(n) pass)."""
+        state = cls(atr_period, mult)
+        for h, l, c in zip(high, low, close):
+            state.update((h, l, c))
+        return state
+
+    @property
+    def atr(self):
+        if self.bars < self.atr_period:
+            return np.nan
+        return (self.tr_sums[-1] - self.tr_sums[0]) / self.atr_period
+
+    def update(self, bar, commit=True):
+        """Process one (high, low, close) bar; returns (stop, trend, signal).
+
+        With commit=False the bar is evaluated (e.g. a still-forming bar
+        revised by live ticks) without changing the state.
+        """
+        high, low, close = bar
+        tr = high - low
+        if not np.isnan(self.prev_close):
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        total = self.tr_sums[-1] + tr
+        atr = (total - self.tr_sums[-self.atr_period]) / self.atr_period if self.bars + 1 >= self.atr_period else np.nan
+        self.last_atr = atr
+        if commit:
+            self.tr_sums.append(total)
+            self.bars += 1
+
+        if np.isnan(atr):
+            if commit:
+                self.prev_close = close
+            return np.nan, 0, 0
+
+        n = self.mult * atr
+        prev_stop, prev_src = self.stop, self.prev_close
+        if close > prev_stop and prev_src > prev_stop:
+            stop = max(prev_stop, close - n)
+        elif close < prev_stop and prev_src < prev_stop:
+            stop = min(prev_stop, close + n)
+        elif close > prev_stop:
+            stop = close - n
+        else:
+            stop = close + n
+
+        trend = BUY if close > stop else SELL
+        signal = trend if self.trend not in (0, trend) else 0
+
+        if commit:
+            self.trend = trend
+            self.stop = stop
+            self.prev_close = close
+        return stop, trend, signal